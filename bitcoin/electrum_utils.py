@@ -11,7 +11,7 @@ Electrum uses different derivation than BIP39:
 import hashlib
 import hmac
 import unicodedata
-from cryptography import base58Utils
+from cryptography import base58Utils, hashBackend
 
 
 # Electrum seed version prefixes
@@ -122,8 +122,7 @@ def pubkey_to_address_compressed(pubkey_hex):
     compressed = get_compressed_pubkey(pubkey_hex)
 
     # Hash160 (SHA256 then RIPEMD160)
-    sha256_hash = hashlib.sha256(compressed).digest()
-    ripemd160_hash = hashlib.new('ripemd160', sha256_hash).digest()
+    ripemd160_hash = hashBackend.hash160(compressed)
 
     # Base58Check encode with version 0x00 (P2PKH mainnet)
     return base58Utils.base58CheckEncode(0x00, ripemd160_hash)
@@ -182,7 +181,6 @@ def get_electrum_root_fingerprint(master_node):
     compressed = get_compressed_pubkey(keypair.publickey)
 
     # HASH160 and take first 4 bytes
-    sha256_hash = hashlib.sha256(compressed).digest()
-    ripemd160_hash = hashlib.new('ripemd160', sha256_hash).digest()
+    ripemd160_hash = hashBackend.hash160(compressed)
 
     return ripemd160_hash[:4].hex()
@@ -91,6 +91,22 @@ class TestBIP32KeyDerivation(unittest.TestCase):
         self.assertEqual(addresses[1], HDWalletConfig.EXPECTED_ADDR_0_1)
 
 
+    def test_derive_children(self):
+        """Test batch child derivation matches one-at-a-time derivation."""
+        seed = bip32.mnemonic_to_seed(HDWalletConfig.MNEMONIC_12)
+        master = bip32.master_key_from_seed(seed)
+        chain = bip32.derive_from_path(master, "m/44'/0'/0'/0")
+
+        nodes = bip32.derive_children(chain, range(4))
+        pubkeys = bip32.public_keys_for_nodes(nodes)
+        for i, (node, pubkey) in enumerate(zip(nodes, pubkeys)):
+            single = bip32.derive_child_key(chain, i)
+            self.assertEqual(node.private_key, single.private_key)
+            self.assertEqual(node.chain_code, single.chain_code)
+            self.assertEqual(node.fingerprint, single.fingerprint)
+            self.assertEqual(pubkey, single.get_keypair().publickey)
+            self.assertEqual(keyUtils.pubKeyToAddr(pubkey), single.get_address())
+
 class TestHDWallet(unittest.TestCase):
     """Test HD Wallet functionality."""
 
@@ -146,6 +162,39 @@ class TestHDWallet(unittest.TestCase):
         change_addr = wallet2.get_change_address()
         self.assertEqual(change_addr, HDWalletConfig.EXPECTED_ADDR_1_0)
 
+    def test_private_key_auto_discover(self):
+        """Test uncached addresses are found by scanning each chain."""
+        wallet = Wallet.from_mnemonic()
+        expected = bip32.derive_from_path(wallet.master_node, "m/44'/0'/0'/1/3")
+
+        key = wallet.get_private_key_for_address(expected.get_address(), search_limit=5)
+        self.assertEqual(key, expected.get_private_key_hex())
+        self.assertEqual(wallet.internal_index, 4)
+
+        with self.assertRaises(ValueError):
+            wallet.get_private_key_for_address(Wallet(TestKeys.KEY1_HEX).get_address(), search_limit=2)
+
+    def test_private_key_scan_stops_early(self):
+        """Test the chain scan derives chunks only until the address is found."""
+        from bitcoin import wallet as wallet_module
+        wallet = Wallet.from_mnemonic()
+        expected = bip32.derive_from_path(wallet.master_node, "m/44'/0'/0'/0/3")
+
+        derived = []
+        derive_children = bip32.derive_children
+
+        def counting_derive_children(parent_node, indices):
+            derived.extend(indices)
+            return derive_children(parent_node, indices)
+
+        bip32.derive_children = counting_derive_children
+        try:
+            key = wallet.get_private_key_for_address(expected.get_address(), search_limit=1000)
+        finally:
+            bip32.derive_children = derive_children
+        self.assertEqual(key, expected.get_private_key_hex())
+        self.assertEqual(derived, list(range(wallet_module.SCAN_CHUNK_SIZE)))
+
     def test_single_key_wallet_compatibility(self):
         """Test that single-key wallets still work."""
         wallet = Wallet(TestKeys.KEY1_HEX)
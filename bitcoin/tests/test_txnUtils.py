@@ -16,7 +16,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import unittest
 
 from cryptography import keyUtils
-from bitcoin import txnUtils
+from bitcoin import txnUtils, electrum_utils
 from config import TestKeys, TestTransactions, TestRawTransactions
 
 
@@ -45,6 +45,31 @@ class TestTxnUtils(unittest.TestCase):
         # Should verify without raising assertion error
         txnUtils.verifyTxnSignature(TestTransactions.TXN_SIGNED)
 
+    def test_verifyTxnSignatures(self):
+        """Test batch verification reports exactly the failing transactions."""
+        privateKey = keyUtils.wifToPrivateKey(TestKeys.TXN_TEST_WIF)
+        outputs = [[amount, keyUtils.addrHashToScriptPubKey(addr)]
+                   for amount, addr in TestTransactions.BLOCKCHAIN_TX_OUTPUTS]
+        compressed_addr = electrum_utils.pubkey_to_address_compressed(
+            keyUtils.privateKeyToPublicKey(privateKey))
+        compressed_txn = txnUtils.makeSignedTransaction(
+            privateKey,
+            TestTransactions.BLOCKCHAIN_TX_HASH,
+            TestTransactions.BLOCKCHAIN_TX_SOURCE_INDEX,
+            keyUtils.addrHashToScriptPubKey(compressed_addr),
+            outputs,
+            compressed=True
+        )
+
+        # Flip one byte of r inside the DER signature
+        sig_start = TestTransactions.TXN_SIGNED.index(TestTransactions.TXN_SIG_DER[:20]) + 10
+        tampered = (TestTransactions.TXN_SIGNED[:sig_start] + 'ff' +
+                    TestTransactions.TXN_SIGNED[sig_start + 2:])
+
+        txns = [TestTransactions.TXN_SIGNED, tampered, compressed_txn, "00"]
+        self.assertEqual(txnUtils.verifyTxnSignatures(txns), [1, 3])
+        self.assertEqual(txnUtils.verifyTxnSignatures(txns[::2]), [])
+
     def test_makeRawTransaction(self):
         """Test creating raw transaction."""
         # http://bitcoin.stackexchange.com/questions/3374/how-to-redeem-a-basic-tx
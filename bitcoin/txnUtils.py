@@ -4,13 +4,12 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-import ecdsa
 import hashlib
 import struct
 import unittest
 
 from bitcoin import msgUtils
-from cryptography import base58Utils, keyUtils
+from cryptography import base58Utils, keyUtils, ecBackend, hashBackend
 
 # Makes a transaction from the inputs
 # outputs is a list of [redemptionSatoshis, outputScript]
@@ -60,8 +59,7 @@ def getSignableTxn(parsed, debug=False):
         sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
         from bitcoin import electrum_utils
         # For compressed keys, calculate address using compressed format
-        sha256_hash = hashlib.sha256(pubkey_bytes).digest()
-        ripemd160_hash = hashlib.new('ripemd160', sha256_hash).digest()
+        ripemd160_hash = hashBackend.hash160(pubkey_bytes)
         inputAddr = ripemd160_hash
 
         if debug:
@@ -97,36 +95,46 @@ def verifyTxnSignature(txn, debug=False):
     signableTxn = getSignableTxn(parsed, debug=debug)
     hashToSign = hashlib.sha256(hashlib.sha256(bytes.fromhex(signableTxn)).digest()).digest().hex()
     assert(parsed[1][-2:] == '01') # hashtype
-    sig = keyUtils.derSigToHexSig(parsed[1][:-2])
     public_key = parsed[2]
 
     if debug:
+        sig = keyUtils.derSigToHexSig(parsed[1][:-2])
         print(f"  Signable txn: {signableTxn[:80]}...")
         print(f"  Hash to sign: {hashToSign}")
         print(f"  Signature: {sig[:40]}...")
 
-    # Handle both compressed and uncompressed public keys
-    pubkey_bytes = bytes.fromhex(public_key)
-
-    if len(pubkey_bytes) == 65 and pubkey_bytes[0] == 0x04:
-        # Uncompressed key: 04 + x + y (65 bytes total)
-        # Strip the 04 prefix for ecdsa library
-        vk = ecdsa.VerifyingKey.from_string(pubkey_bytes[1:], curve=ecdsa.SECP256k1)
-    elif len(pubkey_bytes) == 33 and pubkey_bytes[0] in (0x02, 0x03):
-        # Compressed key: 02/03 + x (33 bytes total)
-        # Use from_string with compressed encoding support
-        vk = ecdsa.VerifyingKey.from_string(
-            pubkey_bytes,
-            curve=ecdsa.SECP256k1,
-            validate_point=True,
-            valid_encodings=("compressed",)
-        )
-    else:
-        raise ValueError(f"Invalid public key format: length={len(pubkey_bytes)}, prefix={pubkey_bytes[0]:02x}")
+    # Handle both compressed (02/03 + x) and uncompressed (04 + x + y) public keys
+    pubkey_bytes = ecBackend.raw_public_key(bytes.fromhex(public_key))
 
     if debug:
-        print(f"  Verifying...")
-    assert(vk.verify_digest(bytes.fromhex(sig), bytes.fromhex(hashToSign)))
+        print(f"  Verifying with EC backend {ecBackend.backend_for('verify_digest').name}...")
+    assert(ecBackend.verify_digest(pubkey_bytes, bytes.fromhex(parsed[1][:-2]), bytes.fromhex(hashToSign)))
+
+# Verifies the signatures of many transactions at once through the EC backend
+# (see ecBackend.verify_batch). Returns the indices of the transactions that fail;
+# an empty list means every signature is valid.
+def verifyTxnSignatures(txns):
+    items = []
+    indices = []
+    failures = []
+    for index, txn in enumerate(txns):
+        try:
+            parsed = parseTxn(txn)
+            signableTxn = getSignableTxn(parsed)
+            hashToSign = hashlib.sha256(hashlib.sha256(bytes.fromhex(signableTxn)).digest()).digest()
+            if parsed[1][-2:] != '01': # hashtype
+                raise ValueError("Unsupported hashtype")
+            sig = bytes.fromhex(parsed[1][:-2])
+            # Handle both compressed (02/03 + x) and uncompressed (04 + x + y) public keys
+            pubkey_bytes = ecBackend.raw_public_key(bytes.fromhex(parsed[2]))
+        except (AssertionError, ValueError, IndexError):
+            failures.append(index)
+            continue
+        items.append((pubkey_bytes, sig, hashToSign))
+        indices.append(index)
+
+    failures += [indices[i] for i in ecBackend.verify_batch(items)]
+    return sorted(failures)
 
 def makeSignedTransaction(privateKey, outputTransactionHash, sourceIndex, scriptPubKey, outputs, compressed=False, debug=False):
     """
@@ -159,8 +167,7 @@ def makeSignedTransaction(privateKey, outputTransactionHash, sourceIndex, script
     if debug:
         print(f"  Hash to sign: {s256.hex()}")
 
-    sk = ecdsa.SigningKey.from_string(bytes.fromhex(privateKey), curve=ecdsa.SECP256k1)
-    sig = sk.sign_digest(s256, sigencode=ecdsa.util.sigencode_der) + b'\x01' # 01 is hashtype
+    sig = ecBackend.sign_digest(bytes.fromhex(privateKey), s256) + b'\x01' # 01 is hashtype
 
     # Get public key (uncompressed by default)
     pubKey = keyUtils.privateKeyToPublicKey(privateKey)
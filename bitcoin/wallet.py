@@ -14,12 +14,17 @@ import hmac
 import unicodedata
 
 from cryptography.keypair import KeyPair
-from cryptography import bip32, base58Utils
+from cryptography import bip32, base58Utils, keyUtils
 from config import TestKeys, TestHDWallet
 from bitcoin import blockchair
 from bitcoin import electrum_utils
 
 
+# Addresses derived per batch when searching a chain for an address
+# (the BIP44 gap limit); the search stops after the first matching batch
+SCAN_CHUNK_SIZE = 20
+
+
 class Wallet:
     """
     Bitcoin wallet for managing keys and transactions.
@@ -402,65 +407,68 @@ class Wallet:
 
         # If auto_discover is enabled, search for the address
         if auto_discover:
-            # Search external chain (receiving addresses)
-            for index in range(search_limit):
-                # Use appropriate derivation path based on wallet type
-                if self.wallet_type == 'electrum':
-                    path = f"m/0/{index}"
-                else:
-                    path = f"m/44'/0'/{self.account_index}'/0/{index}"
+            # Search external chain (receiving addresses), then internal (change)
+            for chain in (0, 1):
+                found = self._scan_chain_for_address(address, chain, search_limit)
+                if found is not None:
+                    index, node = found
+                    # Found it! Update chain index if needed
+                    if chain == 0 and index >= self.external_index:
+                        self.external_index = index + 1
+                    elif chain == 1 and index >= self.internal_index:
+                        self.internal_index = index + 1
+                    return node.get_private_key_hex()
 
-                node = bip32.derive_from_path(self.master_node, path)
+        # Address not found after search
+        raise ValueError(
+            f"Address {address} not found in first {search_limit} addresses of each chain. "
+            f"It may not belong to this wallet, or you can increase search_limit parameter."
+        )
 
-                # Get address (compressed for Electrum, uncompressed for BIP39)
-                if self.wallet_type == 'electrum':
-                    addr = electrum_utils.pubkey_to_address_compressed(
-                        node.get_keypair().publickey
-                    )
-                else:
-                    addr = node.get_address()
+    def _scan_chain_for_address(self, address, chain, search_limit):
+        """
+        Derive the first search_limit addresses of a chain looking for address.
 
-                # Cache this address
-                self._address_cache[addr] = (0, index)
+        The chain node is derived once; children are derived SCAN_CHUNK_SIZE
+        at a time, with each chunk's public keys computed in one batch
+        (KeyPair.public_keys, under KeyPair's cross-check policy), and the
+        scan returns at the first chunk containing the address. Addresses are cached up to and including
+        the match.
 
-                if addr == address:
-                    # Found it! Update external index if needed
-                    if index >= self.external_index:
-                        self.external_index = index + 1
-                    return node.get_private_key_hex()
+        Args:
+            address (str): Bitcoin address to look for
+            chain (int): 0 for external (receiving), 1 for internal (change)
+            search_limit (int): Number of addresses to derive
 
-            # Search internal chain (change addresses)
-            for index in range(search_limit):
-                # Use appropriate derivation path based on wallet type
-                if self.wallet_type == 'electrum':
-                    path = f"m/1/{index}"
-                else:
-                    path = f"m/44'/0'/{self.account_index}'/1/{index}"
+        Returns:
+            tuple: (index, BIP32Node) if found, else None
+        """
+        # Use appropriate derivation path based on wallet type
+        if self.wallet_type == 'electrum':
+            chain_path = f"m/{chain}"
+        else:
+            chain_path = f"m/44'/0'/{self.account_index}'/{chain}"
 
-                node = bip32.derive_from_path(self.master_node, path)
+        chain_node = bip32.derive_from_path(self.master_node, chain_path)
+        for start in range(0, search_limit, SCAN_CHUNK_SIZE):
+            indices = range(start, min(start + SCAN_CHUNK_SIZE, search_limit))
+            nodes = bip32.derive_children(chain_node, indices)
+            pubkeys = bip32.public_keys_for_nodes(nodes)
 
+            for index, node, pubkey in zip(indices, nodes, pubkeys):
                 # Get address (compressed for Electrum, uncompressed for BIP39)
                 if self.wallet_type == 'electrum':
-                    addr = electrum_utils.pubkey_to_address_compressed(
-                        node.get_keypair().publickey
-                    )
+                    addr = electrum_utils.pubkey_to_address_compressed(pubkey)
                 else:
-                    addr = node.get_address()
+                    addr = keyUtils.pubKeyToAddr(pubkey)
 
                 # Cache this address
-                self._address_cache[addr] = (1, index)
+                self._address_cache[addr] = (chain, index)
 
                 if addr == address:
-                    # Found it! Update internal index if needed
-                    if index >= self.internal_index:
-                        self.internal_index = index + 1
-                    return node.get_private_key_hex()
+                    return index, node
 
-        # Address not found after search
-        raise ValueError(
-            f"Address {address} not found in first {search_limit} addresses of each chain. "
-            f"It may not belong to this wallet, or you can increase search_limit parameter."
-        )
+        return None
 
     def discover_addresses(self, gap_limit=20, derivation_standard='auto'):
         """
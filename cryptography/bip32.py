@@ -20,6 +20,7 @@ import os
 if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from cryptography import hashBackend
 from cryptography.keypair import KeyPair
 
 
@@ -198,13 +199,34 @@ def master_key_from_seed(seed):
     )
 
 
-def derive_child_key(parent_node, index):
+def compressed_public_key(node):
+    """
+    Get the compressed public key (33 bytes) of a node.
+
+    Args:
+        node (BIP32Node): Node with a private key
+
+    Returns:
+        bytes: 02/03 prefix + x coordinate
+    """
+    pubkey_hex = node.get_keypair().publickey
+
+    # Compressed public key: 02/03 prefix + x coordinate (skip '04' prefix)
+    y = int(pubkey_hex[66:], 16)
+    if y % 2 == 0:
+        return bytes.fromhex('02' + pubkey_hex[2:66])
+    return bytes.fromhex('03' + pubkey_hex[2:66])
+
+
+def derive_child_key(parent_node, index, parent_pubkey=None):
     """
     Derive child key from parent key (BIP32).
 
     Args:
         parent_node (BIP32Node): Parent node
         index (int): Child index (0-2^31-1 for normal, 2^31-2^32-1 for hardened)
+        parent_pubkey (bytes): Parent compressed public key, if already known
+                               (saves recomputing it for every child)
 
     Returns:
         BIP32Node: Child node
@@ -216,6 +238,10 @@ def derive_child_key(parent_node, index):
     """
     curve_order = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 
+    # Parent public key is needed for normal derivation and the fingerprint
+    if parent_pubkey is None:
+        parent_pubkey = compressed_public_key(parent_node)
+
     # Check if hardened derivation
     is_hardened = index >= 0x80000000
 
@@ -224,21 +250,7 @@ def derive_child_key(parent_node, index):
         data = b'\x00' + parent_node.private_key + index.to_bytes(4, byteorder='big')
     else:
         # Normal child: data = parent_public_key || index
-        # Get parent public key from private key
-        parent_keypair = parent_node.get_keypair()
-        parent_pubkey_hex = parent_keypair.publickey
-
-        # Convert to compressed format
-        x = int(parent_pubkey_hex[2:66], 16)  # Skip '04' prefix, get x coordinate
-        y = int(parent_pubkey_hex[66:], 16)  # Get y coordinate
-
-        # Compressed public key: 02/03 prefix + x coordinate
-        if y % 2 == 0:
-            compressed_pubkey = bytes.fromhex('02' + parent_pubkey_hex[2:66])
-        else:
-            compressed_pubkey = bytes.fromhex('03' + parent_pubkey_hex[2:66])
-
-        data = compressed_pubkey + index.to_bytes(4, byteorder='big')
+        data = parent_pubkey + index.to_bytes(4, byteorder='big')
 
     # HMAC-SHA512 with parent chain code as key
     hmac_result = hmac.new(
@@ -264,21 +276,8 @@ def derive_child_key(parent_node, index):
     child_private_key = child_key_int.to_bytes(32, byteorder='big')
 
     # Calculate parent fingerprint (first 4 bytes of HASH160 of parent public key)
-    parent_keypair = parent_node.get_keypair()
-    parent_pubkey_hex = parent_keypair.publickey
-
-    # Get compressed public key for fingerprint
-    x = int(parent_pubkey_hex[2:66], 16)
-    y = int(parent_pubkey_hex[66:], 16)
-    if y % 2 == 0:
-        compressed_pubkey = bytes.fromhex('02' + parent_pubkey_hex[2:66])
-    else:
-        compressed_pubkey = bytes.fromhex('03' + parent_pubkey_hex[2:66])
-
     # HASH160 = RIPEMD160(SHA256(pubkey))
-    sha256_hash = hashlib.sha256(compressed_pubkey).digest()
-    ripemd160_hash = hashlib.new('ripemd160', sha256_hash).digest()
-    fingerprint = ripemd160_hash[:4]
+    fingerprint = hashBackend.hash160(parent_pubkey)[:4]
 
     return BIP32Node(
         private_key=child_private_key,
@@ -289,6 +288,44 @@ def derive_child_key(parent_node, index):
     )
 
 
+def derive_children(parent_node, indices):
+    """
+    Derive many children of the same parent (e.g. an address window).
+
+    The parent public key is computed once and shared by every child.
+
+    Args:
+        parent_node (BIP32Node): Parent node
+        indices (iterable): Child indices
+
+    Returns:
+        list: BIP32Node for each index, same order
+    """
+    parent_pubkey = compressed_public_key(parent_node)
+    return [derive_child_key(parent_node, index, parent_pubkey) for index in indices]
+
+
+def public_keys_for_nodes(nodes):
+    """
+    Compute the public keys of many nodes at once.
+
+    Goes through KeyPair.public_keys, so the keys are cached and
+    cross-checked under KeyPair's policy like single derivations. The
+    uncached keys are derived as one batch per implementation; ecdsaRR
+    uses one modular inversion for its whole batch.
+
+    Args:
+        nodes (list): BIP32Node instances
+
+    Returns:
+        list: Uncompressed public keys as hex strings ('04' + x + y)
+
+    Raises:
+        RuntimeError: If a cross-check finds the implementations disagree
+    """
+    return KeyPair.public_keys([node.private_key.hex() for node in nodes])
+
+
 def parse_derivation_path(path):
     """
     Parse BIP32 derivation path string.
@@ -7,7 +7,11 @@ For detailed explanations of why these operations destroy bit relationships,
 see reference/bitUtils.md
 
 Operations:
-- mod_inverse: Extended Euclidean Algorithm for modular multiplicative inverse
+- mod_inverse: Modular multiplicative inverse (built-in pow, or the
+  variants picked by an explicit select_mod_inverse() calibration)
+- mod_inverse_eea: Extended Euclidean Algorithm (the textbook version)
+- mod_inverse_pow / mod_inverse_binary / mod_inverse_fermat: alternatives
+- batch_mod_inverse: Many inverses for the cost of one (Montgomery's trick)
 - to_hex/to_bin: Format integers as hex/binary strings
 - bit_length: Count significant bits
 
@@ -16,8 +20,17 @@ Complexity Summary:
 - All formatting functions: O(n) where n = bit length
 """
 
+import sys
+import time
 
-def mod_inverse(a: int, p: int) -> int:
+
+def _check_modulus(p: int):
+    """Raise ValueError unless p > 1 (shared by every mod_inverse variant)."""
+    if p <= 1:
+        raise ValueError(f"Modulus must be greater than 1, got {p}")
+
+
+def mod_inverse_eea(a: int, p: int) -> int:
     """
     Compute modular multiplicative inverse using Extended Euclidean Algorithm.
 
@@ -47,14 +60,20 @@ def mod_inverse(a: int, p: int) -> int:
         The modular inverse a^(-1) mod p
 
     Raises:
-        ValueError: If a is 0 or gcd(a, p) != 1 (no inverse exists)
+        ValueError: If p <= 1, a is 0 or gcd(a, p) != 1 (no inverse exists)
 
     Example:
-        >>> mod_inverse(3, 17)
+        >>> mod_inverse_eea(3, 17)
         6
         >>> (3 * 6) % 17
         1
+
+    Note:
+        This is the readable reference version that the educational traces
+        follow step by step (see mod_inverse_full). mod_inverse() itself
+        dispatches to whichever variant is fastest.
     """
+    _check_modulus(p)
     if a == 0:
         raise ValueError("Cannot compute inverse of 0")
 
@@ -99,23 +118,547 @@ def mod_inverse_fermat(a: int, p: int) -> int:
     Returns:
         The modular inverse a^(-1) mod p
 
+    Raises:
+        ValueError: If p <= 1 or a is 0
+
     Note:
         Only works when p is prime. Use mod_inverse() for general case.
     """
+    _check_modulus(p)
     if a == 0:
         raise ValueError("Cannot compute inverse of 0")
     return pow(a, p - 2, p)
 
 
+def mod_inverse_pow(a: int, p: int) -> int:
+    """
+    Compute modular inverse with Python's built-in pow(a, -1, p).
+
+    CPython runs the extended Euclidean algorithm in C on whole machine
+    words, so this has the same result and O(log p) step count as
+    mod_inverse_eea without the interpreter overhead per step.
+
+    Args:
+        a: Number to invert (must be coprime to p)
+        p: Modulus
+
+    Returns:
+        The modular inverse a^(-1) mod p
+
+    Raises:
+        ValueError: If p <= 1, a is 0 or gcd(a, p) != 1 (no inverse exists)
+    """
+    _check_modulus(p)
+    if a == 0:
+        raise ValueError("Cannot compute inverse of 0")
+    try:
+        return pow(a, -1, p)
+    except ValueError:
+        raise ValueError(f"Modular inverse does not exist: gcd({a}, {p}) != 1") from None
+
+
+def mod_inverse_binary(a: int, p: int) -> int:
+    """
+    Compute modular inverse with the binary extended GCD.
+
+    Replaces division by shifts and subtractions:
+        while u and v are not 1:
+            halve u (and its coefficient x1) while u is even
+            halve v (and its coefficient x2) while v is even
+            subtract the smaller of u, v from the larger (same for x1, x2)
+    Halving a coefficient mod p is x >> 1 if x is even, (x + p) >> 1
+    otherwise, so p must be odd; even moduli use mod_inverse_eea.
+
+    Args:
+        a: Number to invert (must be coprime to p)
+        p: Modulus
+
+    Returns:
+        The modular inverse a^(-1) mod p
+
+    Raises:
+        ValueError: If p <= 1, a is 0 or gcd(a, p) != 1 (no inverse exists)
+    """
+    _check_modulus(p)
+    if a == 0:
+        raise ValueError("Cannot compute inverse of 0")
+    if not p & 1:
+        return mod_inverse_eea(a, p)
+
+    u, v = a % p, p
+    x1, x2 = 1, 0
+    while u != 1 and v != 1:
+        if u == 0:
+            raise ValueError(f"Modular inverse does not exist: gcd({a}, {p}) = {v} != 1")
+        while not u & 1:
+            u >>= 1
+            x1 = x1 >> 1 if not x1 & 1 else (x1 + p) >> 1
+        while not v & 1:
+            v >>= 1
+            x2 = x2 >> 1 if not x2 & 1 else (x2 + p) >> 1
+        if u >= v:
+            u -= v
+            x1 -= x2
+        else:
+            v -= u
+            x2 -= x1
+    return (x1 if u == 1 else x2) % p
+
+
+# =============================================================================
+# Variant selection
+# =============================================================================
+
+# Variants that are correct for every modulus (Fermat needs a prime, so it
+# is benchmarked but never selected)
+MOD_INVERSE_VARIANTS = {
+    'eea': mod_inverse_eea,
+    'pow': mod_inverse_pow,
+    'binary': mod_inverse_binary,
+}
+
+# Largest prime below 2^bits, for benchmarks and select_mod_inverse()
+BENCHMARK_PRIMES = {
+    4: 2**4 - 3,
+    8: 2**8 - 5,
+    16: 2**16 - 15,
+    32: 2**32 - 5,
+    64: 2**64 - 59,
+    128: 2**128 - 159,
+    256: 2**256 - 189,
+}
+
+# [(max modulus bits, variant name)], ascending; the last entry also covers
+# larger moduli. Empty (mod_inverse uses mod_inverse_pow) until
+# select_mod_inverse() or set_mod_inverse_selection() fills it.
+_selection = []
+_selected_functions = []
+
+
+def _time_variant(func, p, values):
+    """Best-of-3 seconds for inverting all values mod p."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for v in values:
+            func(v, p)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _benchmark_values(p, count):
+    """Deterministic spread of invertible values in [1, p-1]."""
+    return [(0x9E3779B97F4A7C15 * (i + 1)) % (p - 1) + 1 for i in range(count)]
+
+
+def select_mod_inverse(iterations: int = 4) -> list:
+    """
+    Time the general variants per modulus size and route mod_inverse.
+
+    Opt-in: nothing calls this at import, so mod_inverse uses
+    mod_inverse_pow until it runs (a few ms with the default iterations).
+    Each BENCHMARK_PRIMES size gets the fastest variant for moduli up to
+    that many bits; neighbouring sizes with the same winner are merged so
+    the dispatch stays short.
+
+    Args:
+        iterations: Inversions timed per variant and size
+
+    Returns:
+        The new selection as [(max_bits, variant_name), ...]
+    """
+    selection = []
+    for bits, p in sorted(BENCHMARK_PRIMES.items()):
+        values = _benchmark_values(p, iterations)
+        timings = {name: _time_variant(func, p, values)
+                   for name, func in MOD_INVERSE_VARIANTS.items()}
+        fastest = min(timings, key=timings.get)
+        if selection and selection[-1][1] == fastest:
+            selection[-1] = (bits, fastest)
+        else:
+            selection.append((bits, fastest))
+    set_mod_inverse_selection(selection)
+    return selection
+
+
+def set_mod_inverse_selection(selection: list):
+    """
+    Route mod_inverse by modulus size.
+
+    Args:
+        selection: [(max_bits, variant_name), ...] sorted by max_bits, a
+                   single variant name to use for every size, or [] to go
+                   back to mod_inverse_pow
+
+    Raises:
+        ValueError: If a variant name is unknown
+    """
+    global _selection, _selected_functions
+    if isinstance(selection, str):
+        selection = [(0, selection)]
+    for _, name in selection:
+        if name not in MOD_INVERSE_VARIANTS:
+            raise ValueError(f"Unknown mod_inverse variant: {name}")
+    _selection = list(selection)
+    _selected_functions = [(bits, MOD_INVERSE_VARIANTS[name]) for bits, name in selection]
+
+
+def mod_inverse_selection() -> list:
+    """Get the current [(max_bits, variant_name), ...] routing table ([] = pow)."""
+    return list(_selection)
+
+
+def mod_inverse(a: int, p: int) -> int:
+    """
+    Compute modular multiplicative inverse: x such that a * x = 1 (mod p).
+
+    Uses mod_inverse_pow (the built-in pow(a, -1, p)) unless a routing
+    table was set with select_mod_inverse or set_mod_inverse_selection,
+    in which case it dispatches on the bit length of p. All variants give
+    the same result; mod_inverse_eea shows the algorithm itself.
+
+    Args:
+        a: Number to invert (must be coprime to p, i.e., gcd(a,p) = 1)
+        p: Modulus (typically prime for elliptic curves)
+
+    Returns:
+        The modular inverse a^(-1) mod p
+
+    Raises:
+        ValueError: If p <= 1, a is 0 or gcd(a, p) != 1 (no inverse exists)
+
+    Example:
+        >>> mod_inverse(3, 17)
+        6
+    """
+    func = mod_inverse_pow
+    bits = p.bit_length()
+    for max_bits, func in _selected_functions:
+        if bits <= max_bits:
+            break
+    return func(a, p)
+
+
+def benchmark_mod_inverse(bit_sizes=(4, 8, 16, 32, 64, 128, 256), iterations=200) -> dict:
+    """
+    Microbenchmark every mod_inverse variant across modulus sizes.
+
+    Args:
+        bit_sizes: Modulus sizes (keys of BENCHMARK_PRIMES)
+        iterations: Inversions per variant and size
+
+    Returns:
+        Dict mapping bits -> {variant name: microseconds per inversion},
+        including 'fermat' (prime moduli only)
+    """
+    variants = dict(MOD_INVERSE_VARIANTS, fermat=mod_inverse_fermat)
+    results = {}
+    for bits in bit_sizes:
+        p = BENCHMARK_PRIMES[bits]
+        values = _benchmark_values(p, iterations)
+        results[bits] = {name: _time_variant(func, p, values) / iterations * 1e6
+                         for name, func in variants.items()}
+    return results
+
+
+def batch_mod_inverse(values: list, p: int) -> list:
+    """
+    Invert many values mod p with ONE mod_inverse (Montgomery's trick).
+
+    Algorithm:
+        prefix[i] = v0 * v1 * ... * vi              (n-1 multiplications)
+        inv = prefix[-1]^(-1)                        (1 mod_inverse)
+        walk backwards: vi^(-1) = inv * prefix[i-1], inv = inv * vi
+                                                     (2(n-1) multiplications)
+    Trades n inversions for 1 inversion + ~3n multiplications.
+
+    Args:
+        values: Numbers to invert (all must be invertible mod p)
+        p: Modulus
+
+    Returns:
+        List of inverses, same order as values
+
+    Raises:
+        ValueError: If any value has no inverse (e.g. is 0 mod p)
+
+    Example:
+        >>> batch_mod_inverse([3, 5, 7], 17)
+        [6, 7, 5]
+    """
+    if not values:
+        return []
+
+    prefix = []
+    acc = 1
+    for v in values:
+        v %= p
+        if v == 0:
+            raise ValueError("Cannot compute inverse of 0")
+        acc = (acc * v) % p
+        prefix.append(acc)
+
+    inv = mod_inverse(acc, p)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        result[i] = (inv * prefix[i - 1]) % p
+        inv = (inv * values[i]) % p
+    result[0] = inv
+    return result
+
+
 # =============================================================================
 # Step-based mod_inverse for rollback support
 # =============================================================================
 
+from array import array
+from collections.abc import MutableMapping, Sequence
 from dataclasses import dataclass, replace, field
-from typing import Dict
+import struct
+
+
+class QuotientTrace:
+    """
+    Append-only, shared storage for EEA quotients.
+
+    Quotients are packed into one array('Q') (8 bytes each) instead of a
+    list of int objects (~32 bytes each plus an 8-byte pointer). States
+    refer to a slice [start, end) of a trace, so copying a state or
+    stepping it copies two integers, not the history. Many inversions can
+    be recorded into the same trace one after another.
+
+    Overflow scheme:
+        Quotients are almost always tiny (most are 1-3), but a step can
+        produce any size: the first quotient of mod_inverse(a, p) with a
+        small a is about p / a. Values outside [0, 2^64 - 2] are stored as
+        the sentinel 2^64 - 1 in the array and the real int is kept in a
+        dict keyed by index, so the common case stays 8 bytes.
+
+    Attributes:
+        OVERFLOW (int): Array sentinel for quotients kept in the overflow dict
+    """
+
+    OVERFLOW = 2**64 - 1
+    _MAGIC = b'QTR1'
+    _HEADER = struct.Struct('<4sQQ')
+    _OVERFLOW_ENTRY = struct.Struct('<QI')
+
+    def __init__(self, quotients=()):
+        """
+        Initialize a trace.
+
+        Args:
+            quotients: Optional initial quotient sequence
+        """
+        self._values = array('Q')
+        self._overflow = {}
+        for q in quotients:
+            self.append(q)
+
+    def append(self, quotient: int):
+        """Record one quotient at the end of the trace."""
+        if 0 <= quotient < self.OVERFLOW:
+            self._values.append(quotient)
+        else:
+            self._overflow[len(self._values)] = quotient
+            self._values.append(self.OVERFLOW)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            values = self._values[index].tolist()
+            if self._overflow:
+                positions = range(*index.indices(len(self._values)))
+                for i, q in enumerate(values):
+                    if q == self.OVERFLOW:
+                        values[i] = self._overflow[positions[i]]
+            return values
+        q = self._values[index]
+        if q == self.OVERFLOW:
+            if index < 0:
+                index += len(self._values)
+            return self._overflow[index]
+        return q
+
+    def slice(self, start: int, end: int) -> 'QuotientTrace':
+        """Copy quotients [start, end) into a new, independent trace."""
+        trace = QuotientTrace()
+        trace._values = self._values[start:end]
+        trace._overflow = {i - start: q for i, q in self._overflow.items() if start <= i < end}
+        return trace
+
+    def nbytes(self) -> int:
+        """Approximate storage used: packed array plus overflow ints."""
+        overflow = sum(sys.getsizeof(q) + 8 for q in self._overflow.values())
+        return self._values.itemsize * len(self._values) + overflow
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the trace (for recording traces to disk).
+
+        Format (little-endian): b'QTR1', count, overflow count, the packed
+        array, then per overflow entry: index, byte length, signed
+        big-endian value.
+        """
+        values = self._values
+        if sys.byteorder != 'little':
+            values = array('Q', values)
+            values.byteswap()
+        parts = [self._HEADER.pack(self._MAGIC, len(self._values), len(self._overflow)),
+                 values.tobytes()]
+        for index, q in sorted(self._overflow.items()):
+            raw = q.to_bytes(q.bit_length() // 8 + 1, 'big', signed=True)
+            parts.append(self._OVERFLOW_ENTRY.pack(index, len(raw)) + raw)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'QuotientTrace':
+        """
+        Load a trace written by to_bytes().
+
+        Raises:
+            ValueError: If data is not a serialized trace
+        """
+        data = memoryview(data)
+        if len(data) < cls._HEADER.size:
+            raise ValueError("Not a quotient trace")
+        magic, count, overflow_count = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC:
+            raise ValueError("Not a quotient trace")
+        offset = cls._HEADER.size
+        trace = cls()
+        trace._values.frombytes(data[offset:offset + 8 * count])
+        if len(trace._values) != count:
+            raise ValueError("Truncated quotient trace")
+        if sys.byteorder != 'little':
+            trace._values.byteswap()
+        offset += 8 * count
+        for _ in range(overflow_count):
+            index, length = cls._OVERFLOW_ENTRY.unpack_from(data, offset)
+            offset += cls._OVERFLOW_ENTRY.size
+            trace._overflow[index] = int.from_bytes(data[offset:offset + length], 'big', signed=True)
+            offset += length
+        return trace
+
+
+class QuotientView(Sequence):
+    """
+    List-like view of one state's quotients inside a shared QuotientTrace.
 
+    Supports len(), indexing, iteration, == against lists, copy() (a real
+    list) and append(). append() extends the shared trace in place when
+    the state owns its tip; if another state has already appended there,
+    the state's slice is first copied into its own trace (copy-on-write).
+    """
+
+    __slots__ = ('_state',)
+
+    def __init__(self, state: 'ModInverseState'):
+        self._state = state
+
+    def __len__(self):
+        return self._state.trace_end - self._state.trace_start
+
+    def __getitem__(self, index):
+        state = self._state
+        length = state.trace_end - state.trace_start
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(length))]
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("quotient index out of range")
+        return state.trace[state.trace_start + index]
+
+    def __eq__(self, other):
+        if isinstance(other, (QuotientView, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def copy(self) -> list:
+        """Materialize the quotients as a list."""
+        return list(self)
+
+    def append(self, quotient: int):
+        """Extend the state's quotient history by one quotient."""
+        state = self._state
+        if state.trace is None:
+            state.trace = QuotientTrace()
+            state.trace_start = state.trace_end = 0
+        elif state.trace_end != len(state.trace):
+            state.trace = state.trace.slice(state.trace_start, state.trace_end)
+            state.trace_end -= state.trace_start
+            state.trace_start = 0
+        state.trace.append(quotient)
+        state.trace_end += 1
+
+
+class ReconstructedBits(MutableMapping):
+    """
+    Map of bit position -> bit (0 or 1), stored as two ints.
+
+    mask has a 1 at every determined position and value holds the bits,
+    so copying is two reference copies instead of a dict copy. Behaves
+    like the Dict[int, int] it replaces (== compares with dicts).
+    """
 
-@dataclass
+    __slots__ = ('mask', 'value')
+
+    def __init__(self, bits=None):
+        self.mask = 0
+        self.value = 0
+        if bits:
+            self.update(bits)
+
+    def __getitem__(self, pos):
+        if not (self.mask >> pos) & 1:
+            raise KeyError(pos)
+        return (self.value >> pos) & 1
+
+    def __setitem__(self, pos, bit):
+        if bit not in (0, 1):
+            raise ValueError("Bit must be 0 or 1")
+        self.mask |= 1 << pos
+        if bit:
+            self.value |= 1 << pos
+        else:
+            self.value &= ~(1 << pos)
+
+    def __delitem__(self, pos):
+        if not (self.mask >> pos) & 1:
+            raise KeyError(pos)
+        self.mask &= ~(1 << pos)
+        self.value &= ~(1 << pos)
+
+    def __iter__(self):
+        mask = self.mask
+        pos = 0
+        while mask:
+            if mask & 1:
+                yield pos
+            mask >>= 1
+            pos += 1
+
+    def __len__(self):
+        return bin(self.mask).count('1')
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def copy(self) -> 'ReconstructedBits':
+        bits = ReconstructedBits()
+        bits.mask = self.mask
+        bits.value = self.value
+        return bits
+
+
+@dataclass(init=False)
 class ModInverseState:
     """
     Represents the state at any point during Extended Euclidean Algorithm.
@@ -124,38 +667,84 @@ class ModInverseState:
         old_r, r: Remainder values (old_r = quotient * r + new_r each step)
         old_s, s: Coefficient values tracking the inverse
         step: Current step number (0 = initial)
-        quotients: List of quotients from each step (for rollback)
+        quotients: List-like view of trace[trace_start:trace_end] (for
+            rollback); passing or assigning a list stores it in a new trace
         reconstructed_bits: Map of bit_position -> bit_value (0 or 1)
             Only contains entries for bits that have been determined.
+        trace: Shared QuotientTrace holding this state's quotients (None
+            until the first quotient is recorded)
+        trace_start, trace_end: This state's slice of the trace
+
+    States compare equal when their values, quotients and bits match,
+    wherever their quotients are stored.
     """
     old_r: int
     r: int
     old_s: int
     s: int
     step: int = 0
-    quotients: list = field(default_factory=list)
-    reconstructed_bits: Dict[int, int] = field(default_factory=dict)
+    reconstructed_bits: ReconstructedBits = field(default_factory=ReconstructedBits)
+    trace: QuotientTrace = field(default=None, compare=False, repr=False)
+    trace_start: int = field(default=0, compare=False, repr=False)
+    trace_end: int = field(default=0, compare=False, repr=False)
+
+    def __init__(self, old_r: int, r: int, old_s: int, s: int, step: int = 0,
+                 quotients=None, reconstructed_bits=None, trace: QuotientTrace = None,
+                 trace_start: int = 0, trace_end: int = 0):
+        self.old_r = old_r
+        self.r = r
+        self.old_s = old_s
+        self.s = s
+        self.step = step
+        if reconstructed_bits is None:
+            reconstructed_bits = ReconstructedBits()
+        elif not isinstance(reconstructed_bits, ReconstructedBits):
+            reconstructed_bits = ReconstructedBits(reconstructed_bits)
+        self.reconstructed_bits = reconstructed_bits
+        self.trace = trace
+        self.trace_start = trace_start
+        self.trace_end = trace_end
+        if quotients is not None:
+            self.quotients = quotients
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.old_r, self.r, self.old_s, self.s, self.step, self.reconstructed_bits)
+                == (other.old_r, other.r, other.old_s, other.s, other.step, other.reconstructed_bits)
+                and self.quotients == other.quotients)
+
+    def __repr__(self):
+        return (f"ModInverseState(old_r={self.old_r!r}, r={self.r!r}, old_s={self.old_s!r}, "
+                f"s={self.s!r}, step={self.step!r}, quotients={self.quotients!r}, "
+                f"reconstructed_bits={self.reconstructed_bits!r})")
+
+    @property
+    def quotients(self) -> QuotientView:
+        return QuotientView(self)
+
+    @quotients.setter
+    def quotients(self, quotients):
+        self.trace = QuotientTrace(quotients)
+        self.trace_start = 0
+        self.trace_end = len(self.trace)
 
     def copy(self) -> 'ModInverseState':
+        """Copy the state; the quotient trace is shared, not duplicated."""
         new_state = replace(self)
-        new_state.quotients = self.quotients.copy()
         new_state.reconstructed_bits = self.reconstructed_bits.copy()
         return new_state
 
     def get_reconstructed_value(self) -> int:
         """Reconstruct value from known bits (unknown bits = 0)."""
-        value = 0
-        for pos, bit in self.reconstructed_bits.items():
-            if bit:
-                value |= (1 << pos)
-        return value
+        return self.reconstructed_bits.value & self.reconstructed_bits.mask
 
     def bits_determined(self) -> int:
         """Return count of determined bits."""
         return len(self.reconstructed_bits)
 
 
-def mod_inverse_full(a: int, p: int) -> ModInverseState:
+def mod_inverse_full(a: int, p: int, trace: QuotientTrace = None) -> ModInverseState:
     """
     Run complete mod_inverse and return final state with all quotients recorded.
 
@@ -165,27 +754,40 @@ def mod_inverse_full(a: int, p: int) -> ModInverseState:
     Args:
         a: Number to compute inverse of
         p: Modulus (typically prime)
+        trace: Optional shared QuotientTrace to append to, for recording
+            many inversions into one buffer (the state's trace_start marks
+            where this inversion begins)
 
     Returns:
         Final ModInverseState with:
             - old_r = 1 (gcd), r = 0
             - old_s = inverse (mod p)
-            - quotients = list of all quotients used
+            - quotients = view of all quotients used
             - step = number of steps taken
 
     Raises:
         ValueError: If no inverse exists (gcd != 1)
     """
-    state = ModInverseState(old_r=a % p, r=p, old_s=1, s=0, step=0)
+    if trace is None:
+        trace = QuotientTrace()
+    start = len(trace)
 
-    while state.r != 0:
-        state, quotient = mod_inverse_step(state)
-        state.quotients.append(quotient)
+    # Same recurrence as mod_inverse_step, kept in locals so recording
+    # costs one array append per step instead of one state per step
+    old_r, r = a % p, p
+    old_s, s = 1, 0
+    append = trace.append
+    while r != 0:
+        quotient = old_r // r
+        append(quotient)
+        old_r, r = r, old_r - quotient * r
+        old_s, s = s, old_s - quotient * s
 
-    if state.old_r != 1:
-        raise ValueError(f"No inverse: gcd({a}, {p}) = {state.old_r}")
+    if old_r != 1:
+        raise ValueError(f"No inverse: gcd({a}, {p}) = {old_r}")
 
-    return state
+    return ModInverseState(old_r=old_r, r=r, old_s=old_s, s=s, step=len(trace) - start,
+                           trace=trace, trace_start=start, trace_end=len(trace))
 
 
 def mod_inverse_step(state: ModInverseState) -> tuple[ModInverseState, int]:
@@ -217,14 +819,16 @@ def mod_inverse_step(state: ModInverseState) -> tuple[ModInverseState, int]:
     new_s = state.old_s - quotient * state.s
 
     # Create new state (the swap happens here)
-    # Note: quotients list is copied but not appended - caller decides whether to record
+    # Note: the quotient trace is shared, not appended - caller decides whether to record
     new_state = ModInverseState(
         old_r=state.r,
         r=new_r,
         old_s=state.s,
         s=new_s,
         step=state.step + 1,
-        quotients=state.quotients.copy()
+        trace=state.trace,
+        trace_start=state.trace_start,
+        trace_end=state.trace_end
     )
 
     return new_state, quotient
@@ -448,6 +1052,22 @@ def demo_bit_destruction():
     print("=" * 70)
 
 
+def demo_mod_inverse_benchmark():
+    """Compare the mod_inverse variants across modulus sizes."""
+    results = benchmark_mod_inverse()
+    names = list(next(iter(results.values())))
+    rows = [[bits] + [f"{results[bits][name]:.2f}" for name in names] for bits in results]
+    print_table(["bits"] + [f"{name} (us)" for name in names], rows,
+                "MOD_INVERSE VARIANTS (microseconds per inversion)")
+    selection = mod_inverse_selection()
+    if selection:
+        print(f"Active selection: {selection}")
+    else:
+        print("Active selection: mod_inverse_pow for every size "
+              "(select_mod_inverse() has not been run)")
+
+
 if __name__ == "__main__":
     demo_mod_inverse()
     demo_bit_destruction()
+    demo_mod_inverse_benchmark()
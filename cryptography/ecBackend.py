@@ -0,0 +1,533 @@
+"""
+Elliptic-curve backend layer for secp256k1
+
+One interface for the EC operations the rest of the code needs:
+    - public_key(private_key)                  -> 64-byte x || y
+    - public_keys(private_keys)                -> list of 64-byte x || y
+    - sign_digest(private_key, digest)         -> DER signature
+    - sign_many(private_key, digests)          -> list of DER signatures
+    - verify_digest(public_key, sig, digest)   -> bool (DER signature)
+    - verify_batch(items)                      -> indices of invalid items
+    - decompress(compressed_public_key)        -> 64-byte x || y
+
+Adapters:
+    - 'ecdsa'     - the pure-Python ecdsa library
+    - 'ecdsaRR'   - the custom implementation in this repo
+    - 'coincurve' - libsecp256k1 bindings (optional; used if installed)
+
+The backend is chosen at first use by a short calibration benchmark
+(fastest wins), unless the environment variable EC_BACKEND names one.
+If it names a backend that is not available, a warning is issued and
+the calibrated choice is used instead.
+Operations a backend does not implement fall through to the next
+fastest backend that does.
+
+Usage:
+    from cryptography import ecBackend
+    pub = ecBackend.public_key(private_key_bytes)
+    ecBackend.active_backend().name
+"""
+
+import hashlib
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ecdsa
+import ecdsa.der
+import ecdsa.util
+
+
+OPERATIONS = ('public_key', 'sign_digest', 'verify_digest', 'verify_batch', 'decompress')
+
+# Environment variable that forces a backend by name
+ENV_BACKEND = 'EC_BACKEND'
+
+
+# ============================================================================
+# BACKEND ADAPTERS
+# ============================================================================
+
+class ECBackend:
+    """
+    Base class for EC backends.
+
+    Subclasses set name, list the operations they implement in
+    operations, and override those methods. Keys and signatures are
+    bytes: private keys 32 bytes, public keys 64 bytes (x || y, no
+    prefix), compressed keys 33 bytes, signatures DER.
+    """
+
+    name = None
+    operations = ()
+
+    @classmethod
+    def available(cls):
+        """Check whether the backend can be used in this process."""
+        return True
+
+    def public_key(self, private_key):
+        raise NotImplementedError
+
+    def public_keys(self, private_keys):
+        """Derive many public keys (one public_key each by default)."""
+        return [self.public_key(private_key) for private_key in private_keys]
+
+    def sign_digest(self, private_key, digest):
+        raise NotImplementedError
+
+    def sign_many(self, private_key, digests):
+        """Sign many digests with one key (one sign_digest each by default)."""
+        return [self.sign_digest(private_key, digest) for digest in digests]
+
+    def verify_digest(self, public_key, signature, digest):
+        raise NotImplementedError
+
+    def verify_batch(self, items):
+        """Verify many (public_key, signature, digest) items (one verify_digest each by default)."""
+        return [index for index, (public_key, signature, digest) in enumerate(items)
+                if not self.verify_digest(public_key, signature, digest)]
+
+    def decompress(self, compressed):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<ECBackend {self.name}>"
+
+
+class EcdsaBackend(ECBackend):
+    """Adapter for the pure-Python ecdsa library."""
+
+    name = 'ecdsa'
+    operations = OPERATIONS
+
+    def public_key(self, private_key):
+        sk = ecdsa.SigningKey.from_string(private_key, curve=ecdsa.SECP256k1)
+        return sk.get_verifying_key().to_string()
+
+    def sign_digest(self, private_key, digest):
+        sk = ecdsa.SigningKey.from_string(private_key, curve=ecdsa.SECP256k1)
+        return sk.sign_digest(digest, sigencode=ecdsa.util.sigencode_der)
+
+    def verify_digest(self, public_key, signature, digest):
+        try:
+            vk = ecdsa.VerifyingKey.from_string(public_key, curve=ecdsa.SECP256k1)
+            return vk.verify_digest(signature, digest, sigdecode=ecdsa.util.sigdecode_der)
+        except (ecdsa.BadSignatureError, ecdsa.BadDigestError, ecdsa.der.UnexpectedDER,
+                ecdsa.MalformedPointError, ValueError):
+            return False
+
+    def decompress(self, compressed):
+        try:
+            vk = ecdsa.VerifyingKey.from_string(compressed, curve=ecdsa.SECP256k1,
+                                                valid_encodings=("compressed",))
+        except ecdsa.MalformedPointError as e:
+            raise ValueError(f"Invalid compressed public key: {e}")
+        return vk.to_string()
+
+
+class EcdsaRRBackend(ECBackend):
+    """Adapter for the custom ecdsaRR implementation."""
+
+    name = 'ecdsaRR'
+    operations = OPERATIONS
+
+    def __init__(self):
+        from cryptography import ecdsaRR
+        self._ecdsaRR = ecdsaRR
+
+    def public_key(self, private_key):
+        return self._ecdsaRR.SigningKey.from_string(private_key).get_verifying_key().to_string()
+
+    def public_keys(self, private_keys):
+        # One shared modular inversion for the whole batch
+        return [vk.to_string() for vk in self._ecdsaRR.batch_public_keys(private_keys)]
+
+    def sign_digest(self, private_key, digest):
+        sk = self._ecdsaRR.SigningKey.from_string(private_key)
+        return sk.sign_digest(digest, sigencode=self._ecdsaRR.sigencode_der)
+
+    def sign_many(self, private_key, digests):
+        sk = self._ecdsaRR.SigningKey.from_string(private_key)
+        return sk.sign_many(digests, sigencode=self._ecdsaRR.sigencode_der)
+
+    def verify_digest(self, public_key, signature, digest):
+        ecdsaRR = self._ecdsaRR
+        # ecdsaRR truncates long digests; ecdsa and coincurve reject them
+        if len(digest) > 32:
+            return False
+        try:
+            # Repeated keys reuse a parsed, precomputed VerifyingKey
+            vk = ecdsaRR.verifying_key_cache.get(public_key)
+            return vk.verify_digest(signature, digest, sigdecode=ecdsaRR.sigdecode_der)
+        except (ecdsaRR.BadSignatureError, ValueError):
+            return False
+
+    def verify_batch(self, items):
+        ecdsaRR = self._ecdsaRR
+        failures = [index for index, (_, _, digest) in enumerate(items) if len(digest) > 32]
+        indices = [index for index, (_, _, digest) in enumerate(items) if len(digest) <= 32]
+        batch = [(items[index][0], items[index][2], items[index][1]) for index in indices]
+        failures += [indices[i] for i in ecdsaRR.verify_batch(batch, sigdecode=ecdsaRR.sigdecode_der)]
+        return sorted(failures)
+
+    def decompress(self, compressed):
+        point = self._ecdsaRR.decompress_point(compressed)
+        return point.x.to_bytes(32, byteorder='big') + point.y.to_bytes(32, byteorder='big')
+
+
+class CoincurveBackend(ECBackend):
+    """Adapter for coincurve (libsecp256k1), if installed."""
+
+    name = 'coincurve'
+    operations = OPERATIONS
+
+    # secp256k1 group order, for low-S normalization
+    _order = ecdsa.SECP256k1.order
+
+    def __init__(self):
+        import coincurve
+        self._coincurve = coincurve
+
+    @classmethod
+    def available(cls):
+        try:
+            import coincurve  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def public_key(self, private_key):
+        key = self._coincurve.PrivateKey(private_key)
+        return key.public_key.format(compressed=False)[1:]
+
+    def sign_digest(self, private_key, digest):
+        return self._coincurve.PrivateKey(private_key).sign(digest, hasher=None)
+
+    def verify_digest(self, public_key, signature, digest):
+        # libsecp256k1 only accepts low-S signatures; ECDSA accepts both
+        try:
+            r, s = ecdsa.util.sigdecode_der(signature, self._order)
+        except ecdsa.der.UnexpectedDER:
+            return False
+        if s > self._order // 2:
+            signature = ecdsa.util.sigencode_der(r, self._order - s, self._order)
+        try:
+            key = self._coincurve.PublicKey(b'\x04' + public_key)
+            return key.verify(signature, digest, hasher=None)
+        except ValueError:
+            return False
+
+    def decompress(self, compressed):
+        return self._coincurve.PublicKey(compressed).format(compressed=False)[1:]
+
+
+# Registered adapters, in preference order when timings tie
+BACKENDS = [CoincurveBackend, EcdsaRRBackend, EcdsaBackend]
+
+
+# ============================================================================
+# SELECTION
+# ============================================================================
+
+_backends = None        # name -> instance, fastest first
+_calibration = None     # name -> microseconds per calibration round
+
+
+def available_backends():
+    """
+    Get the names of the backends usable in this process.
+
+    Returns:
+        list: Backend names
+    """
+    return [backend.name for backend in BACKENDS if backend.available()]
+
+
+def calibrate(rounds=3):
+    """
+    Time every available backend on public key derivation and verification.
+
+    Each backend runs one warm-up round first, so one-time setup (such as
+    the ecdsaRR generator table) is not counted.
+
+    Args:
+        rounds: Timed rounds per backend (at least 1)
+
+    Returns:
+        dict: Backend name -> microseconds per round (one derivation
+              plus one verification)
+
+    Raises:
+        ValueError: If rounds is less than 1
+    """
+    if rounds < 1:
+        raise ValueError(f"rounds must be at least 1, got {rounds}")
+    keys = [hashlib.sha256(b'ec backend %d' % i).digest() for i in range(rounds + 1)]
+    digest = hashlib.sha256(b'calibration').digest()
+    signer = EcdsaBackend()
+    samples = [(key, signer.public_key(key), signer.sign_digest(key, digest)) for key in keys]
+
+    timings = {}
+    for backend_class in BACKENDS:
+        if not backend_class.available():
+            continue
+        backend = backend_class()
+        for i, (key, public_key, signature) in enumerate(samples):
+            if i == 1:
+                start = time.perf_counter()
+            if backend.public_key(key) != public_key:
+                raise RuntimeError(f"EC backend {backend.name} derived a wrong public key")
+            if not backend.verify_digest(public_key, signature, digest):
+                raise RuntimeError(f"EC backend {backend.name} rejected a valid signature")
+        timings[backend.name] = (time.perf_counter() - start) / rounds * 1e6
+    return timings
+
+
+def _ranked_backends():
+    """Backends by preference: env override or calibration, fastest first."""
+    global _backends, _calibration
+    if _backends is None:
+        instances = {b.name: b() for b in BACKENDS if b.available()}
+        forced = os.environ.get(ENV_BACKEND)
+        if forced and forced not in instances:
+            warnings.warn(f"{ENV_BACKEND}={forced!r} is not an available EC backend "
+                          f"(available: {', '.join(instances)}); using the fastest", RuntimeWarning)
+            forced = None
+        if forced:
+            order = [forced] + [name for name in instances if name != forced]
+        else:
+            _calibration = calibrate()
+            order = sorted(instances, key=lambda name: _calibration[name])
+        _backends = {name: instances[name] for name in order}
+    return _backends
+
+
+def active_backend():
+    """
+    Get the selected backend (calibrating on first use).
+
+    Returns:
+        ECBackend instance
+    """
+    return next(iter(_ranked_backends().values()))
+
+
+def backend_for(operation):
+    """
+    Get the backend that handles an operation.
+
+    Args:
+        operation (str): One of OPERATIONS
+
+    Returns:
+        ECBackend instance: the fastest backend implementing it
+    """
+    for backend in _ranked_backends().values():
+        if operation in backend.operations:
+            return backend
+    raise ValueError(f"No EC backend implements {operation!r}")
+
+
+def get_backend(name):
+    """
+    Get a specific backend by name (e.g. to cross-check two of them).
+
+    Args:
+        name (str): Backend name
+
+    Returns:
+        ECBackend instance
+
+    Raises:
+        ValueError: If the backend is not available
+    """
+    if _backends is not None and name in _backends:
+        return _backends[name]
+    for backend_class in BACKENDS:
+        if backend_class.name == name and backend_class.available():
+            return backend_class()
+    raise ValueError(f"{name!r} is not an available EC backend "
+                     f"(available: {', '.join(available_backends())})")
+
+
+def set_backend(name):
+    """
+    Select a backend by name (the others stay as fallbacks).
+
+    Args:
+        name (str): Backend name, or None to re-run selection at next use
+
+    Raises:
+        ValueError: If the backend is not available
+    """
+    global _backends
+    if name is None:
+        _backends = None
+        return
+    selected = get_backend(name)
+    current = dict(_ranked_backends())
+    current.pop(name, None)
+    _backends = {name: selected, **current}
+
+
+def calibration_results():
+    """
+    Get the timings from the startup calibration.
+
+    Returns:
+        dict: Backend name -> microseconds per round, or None if the
+              backend was forced (EC_BACKEND / set_backend) without calibrating
+    """
+    return _calibration
+
+
+# ============================================================================
+# OPERATIONS
+# ============================================================================
+
+def public_key(private_key):
+    """
+    Derive the public key of a private key.
+
+    Args:
+        private_key (bytes): 32-byte private key
+
+    Returns:
+        bytes: 64-byte public key (x || y)
+    """
+    return backend_for('public_key').public_key(private_key)
+
+
+def public_keys(private_keys):
+    """
+    Derive the public keys of many private keys (e.g. an HD address window).
+
+    Args:
+        private_keys (list): 32-byte private keys
+
+    Returns:
+        list: 64-byte public keys (x || y), same order as private_keys
+    """
+    return backend_for('public_key').public_keys(private_keys)
+
+
+def sign_digest(private_key, digest):
+    """
+    Sign a 32-byte digest.
+
+    Args:
+        private_key (bytes): 32-byte private key
+        digest (bytes): Hash to sign
+
+    Returns:
+        bytes: DER-encoded signature
+    """
+    return backend_for('sign_digest').sign_digest(private_key, digest)
+
+
+def sign_many(private_key, digests):
+    """
+    Sign many digests with one private key (e.g. all inputs of a transaction).
+
+    Args:
+        private_key (bytes): 32-byte private key
+        digests (list): Hashes to sign
+
+    Returns:
+        list: DER-encoded signatures, same order as digests
+    """
+    return backend_for('sign_digest').sign_many(private_key, digests)
+
+
+def verify_digest(public_key, signature, digest):
+    """
+    Verify a DER signature over a digest.
+
+    Args:
+        public_key (bytes): 64-byte public key (x || y), or 65/33-byte
+                            SEC encoding (04 / 02 / 03 prefix)
+        signature (bytes): DER-encoded signature
+        digest (bytes): Hash that was signed
+
+    Returns:
+        bool: True if the signature is valid
+    """
+    return backend_for('verify_digest').verify_digest(raw_public_key(public_key), signature, digest)
+
+
+def verify_batch(items):
+    """
+    Verify many DER signatures at once (e.g. all inputs of many transactions).
+
+    ecdsaRR shares work across the batch; the other backends verify
+    one signature at a time.
+
+    Args:
+        items: List of (public_key, signature, digest) tuples, each as
+               accepted by verify_digest
+
+    Returns:
+        list: Indices of invalid items (empty list = all valid)
+    """
+    failures = []
+    indices = []
+    raw_items = []
+    for index, (public_key, signature, digest) in enumerate(items):
+        try:
+            raw_items.append((raw_public_key(public_key), signature, digest))
+        except ValueError:
+            failures.append(index)
+            continue
+        indices.append(index)
+    failures += [indices[i] for i in backend_for('verify_batch').verify_batch(raw_items)]
+    return sorted(failures)
+
+
+def decompress(compressed):
+    """
+    Decompress a 33-byte public key (02/03 prefix + x).
+
+    Args:
+        compressed (bytes): Compressed public key
+
+    Returns:
+        bytes: 64-byte public key (x || y)
+    """
+    return backend_for('decompress').decompress(compressed)
+
+
+def raw_public_key(public_key):
+    """
+    Convert a SEC-encoded public key to 64-byte x || y.
+
+    Args:
+        public_key (bytes): 64 bytes (x || y), 65 bytes (04 + x + y)
+                            or 33 bytes (02/03 + x)
+
+    Returns:
+        bytes: 64-byte public key
+
+    Raises:
+        ValueError: If the encoding is not recognized
+    """
+    if len(public_key) == 64:
+        return public_key
+    if len(public_key) == 65 and public_key[0] == 0x04:
+        return public_key[1:]
+    if len(public_key) == 33 and public_key[0] in (0x02, 0x03):
+        return decompress(public_key)
+    raise ValueError(f"Invalid public key format: length={len(public_key)}")
+
+
+if __name__ == "__main__":
+    print("EC backends available:", ", ".join(available_backends()))
+    print("Calibration (us per derive + verify):")
+    for name, micros in sorted(calibrate().items(), key=lambda item: item[1]):
+        print(f"  {name:>10}: {micros:10.1f}")
+    print("Active backend:", active_backend().name)
+    for operation in OPERATIONS:
+        print(f"  {operation:>14} -> {backend_for(operation).name}")
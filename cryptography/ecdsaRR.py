@@ -12,10 +12,18 @@ For bit-level math explanations, see reference/bitUtils.md
 
 import sys
 import os
+import functools
+import hashlib
+import hmac
+import mmap
+import threading
+import time
+import warnings
+from collections import OrderedDict
 
 # Import common math utilities
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from cryptography.bitUtils import mod_inverse as _mod_inverse
+from cryptography.bitUtils import mod_inverse as _mod_inverse, batch_mod_inverse
 
 
 class Point:
@@ -23,8 +31,14 @@ class Point:
     Represents a point on the elliptic curve.
 
     Special case: Point at infinity represented by x=None, y=None
+
+    Point is only built at API boundaries; the arithmetic works on plain
+    (X, Y, Z) / (x, y) int tuples and locals. __slots__ keeps each
+    instance to two references (no per-instance __dict__).
     """
 
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         """
         Initialize a point on the curve.
@@ -38,12 +52,17 @@ class Point:
 
     def is_infinity(self):
         """Check if this is the point at infinity."""
-        return self.x is None and self.y is None
+        return self.x is None
 
     def __eq__(self, other):
         """Check if two points are equal."""
+        if not isinstance(other, Point):
+            return NotImplemented
         return self.x == other.x and self.y == other.y
 
+    def __hash__(self):
+        return hash((self.x, self.y))
+
     def __repr__(self):
         """String representation of the point."""
         if self.is_infinity():
@@ -51,6 +70,74 @@ class Point:
         return f"Point(x={hex(self.x)[:20]}..., y={hex(self.y)[:20]}...)"
 
 
+class Secp256k1Field:
+    """
+    Reduction modulo the secp256k1 field prime p = 2^256 - 2^32 - 977.
+
+    Because 2^256 = 2^32 + 977 (mod p), a product x = hi*2^256 + lo
+    reduces to lo + hi*(2^32 + 977): a mask, a shift and a small multiply
+    instead of a division. Two folds bring a 512-bit product below 2^257,
+    and one conditional subtraction finishes.
+
+    Lazy reduction: sums and differences of products are reduced ONCE
+    at the end ((a*b + c*d) % p, not (a*b % p + c*d % p) % p), as the
+    point formulas do. Products of three elements (a*b*c % p) measure
+    about even either way, so they are left as single expressions.
+
+    Which reduction wins depends on the interpreter (CPython's % runs
+    in C; the fold is several bytecodes). benchmark_field_reduction()
+    measures both and Secp256k1.select_field_reduction() installs the
+    faster one.
+    """
+
+    P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+    MASK = (1 << 256) - 1
+    # 2^256 mod p
+    FOLD = (1 << 32) + 977
+
+    @staticmethod
+    def reduce_generic(x):
+        """Reduce x mod p with Python's built-in modulo."""
+        return x % Secp256k1Field.P
+
+    @staticmethod
+    def reduce_special(x):
+        """
+        Reduce x mod p using the special form of p (shift-and-fold).
+
+        Args:
+            x: Any integer (lazy sums may be negative or wider than 512 bits)
+
+        Returns:
+            x mod p in [0, p-1]
+        """
+        P = Secp256k1Field.P
+        if x < 0:
+            x = Secp256k1Field.reduce_special(-x)
+            return P - x if x else 0
+        mask = Secp256k1Field.MASK
+        fold = Secp256k1Field.FOLD
+        while x >> 256:
+            x = (x & mask) + (x >> 256) * fold
+        if x >= P:
+            x -= P
+        return x
+
+
+class SpecialFieldModulus(int):
+    """
+    The field prime with `x % p` routed through the shift-and-fold reduction.
+
+    The curve code writes every reduction as `% p` with p a local; when p
+    is an instance of this class, Python calls __rmod__ first (an int
+    subclass on the right overrides int.__mod__), so switching reduction
+    costs nothing in the formulas themselves.
+    """
+
+    def __rmod__(self, x):
+        return Secp256k1Field.reduce_special(x)
+
+
 class Secp256k1:
     """
     secp256k1 elliptic curve parameters and operations.
@@ -62,6 +149,10 @@ class Secp256k1:
     # Prime field (2^256 - 2^32 - 977)
     p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
 
+    # Modulus the point formulas reduce with: p itself (built-in %) or
+    # SpecialFieldModulus(p) (shift-and-fold), see select_field_reduction()
+    field_modulus = p
+
     # Curve coefficient (y² = x³ + ax + b, for secp256k1: a=0, b=7)
     a = 0
     b = 7
@@ -76,6 +167,22 @@ class Secp256k1:
     # Generator point
     G = Point(Gx, Gy)
 
+    # GLV endomorphism: phi(x, y) = (beta*x, y) equals lambda × (x, y)
+    # (beta is a cube root of unity mod p, lambda a cube root of unity mod n)
+    beta = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+    lam = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+
+    # Short lattice basis {(a1, b1), (a2, b2)} with a + b*lambda = 0 (mod n),
+    # used to split k into two ~128-bit halves
+    glv_a1 = 0x3086D221A7D46BCDE86C90E49284EB15
+    glv_b1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+    glv_a2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+    glv_b2 = 0x3086D221A7D46BCDE86C90E49284EB15
+
+    # =========================================================================
+    # Field arithmetic
+    # =========================================================================
+
     @staticmethod
     def mod_inverse(a, m):
         """
@@ -98,6 +205,52 @@ class Secp256k1:
         """
         return _mod_inverse(a, m)
 
+    # Reductions accepted by set_field_reduction (field_modulus above)
+    FIELD_REDUCTIONS = ('generic', 'special')
+
+    @classmethod
+    def set_field_reduction(cls, name):
+        """
+        Choose how the point formulas reduce modulo p.
+
+        Args:
+            name: 'generic' (built-in %) or 'special' (shift-and-fold)
+
+        Raises:
+            ValueError: If name is unknown
+        """
+        if name == 'generic':
+            cls.field_modulus = cls.p
+        elif name == 'special':
+            cls.field_modulus = SpecialFieldModulus(cls.p)
+        else:
+            raise ValueError(f"Unknown field reduction: {name!r}")
+
+    @classmethod
+    def field_reduction(cls):
+        """Name of the active field reduction."""
+        return 'special' if isinstance(cls.field_modulus, SpecialFieldModulus) else 'generic'
+
+    @classmethod
+    def select_field_reduction(cls, iterations=200):
+        """
+        Benchmark both reductions on point doublings and keep the faster.
+
+        Args:
+            iterations: Doublings per measurement
+
+        Returns:
+            Name of the selected reduction
+        """
+        timings = benchmark_field_reduction(iterations)
+        best = min(cls.FIELD_REDUCTIONS, key=lambda name: timings[('double', name)])
+        cls.set_field_reduction(best)
+        return best
+
+    # =========================================================================
+    # Affine coordinates
+    # =========================================================================
+
     @classmethod
     def point_add(cls, P, Q):
         """
@@ -173,16 +326,749 @@ class Secp256k1:
 
         return Point(x3, y3)
 
+    # =========================================================================
+    # Jacobian coordinates (internal fast path)
+    # =========================================================================
+    #
+    # A Jacobian point is a tuple (X, Y, Z) representing the affine point
+    # (X / Z^2, Y / Z^3). Z = 0 is the point at infinity.
+    #
+    # Addition and doubling in this form need NO modular inverse - the
+    # division is deferred into Z. A full scalar multiplication therefore
+    # costs a single mod_inverse (in from_jacobian) instead of one per
+    # point operation (~384 for a 256-bit scalar with affine formulas).
+
+    # Jacobian point at infinity
+    JACOBIAN_INFINITY = (1, 1, 0)
+
+    @classmethod
+    def to_jacobian(cls, P):
+        """
+        Convert an affine Point to Jacobian coordinates.
+
+        Args:
+            P: Affine Point
+
+        Returns:
+            Tuple (X, Y, Z) with Z = 1 (or JACOBIAN_INFINITY)
+        """
+        if P.is_infinity():
+            return cls.JACOBIAN_INFINITY
+        return (P.x, P.y, 1)
+
+    @classmethod
+    def from_jacobian(cls, J):
+        """
+        Normalize a Jacobian point back to an affine Point.
+
+        This is the only step that needs a modular inverse:
+            x = X / Z^2, y = Y / Z^3
+
+        Args:
+            J: Tuple (X, Y, Z)
+
+        Returns:
+            Affine Point
+        """
+        X, Y, Z = J
+        if Z == 0:
+            return Point(None, None)
+
+        p = cls.field_modulus
+        z_inv = cls.mod_inverse(Z, p)
+        z_inv2 = (z_inv * z_inv) % p
+        return Point((X * z_inv2) % p, (Y * z_inv2 * z_inv) % p)
+
+    @classmethod
+    def jacobian_double(cls, J):
+        """
+        Double a Jacobian point: R = 2J (no inversion).
+
+        Formulas for a = 0:
+            S = 4*X*Y^2, M = 3*X^2
+            X3 = M^2 - 2*S
+            Y3 = M*(S - X3) - 8*Y^4
+            Z3 = 2*Y*Z
+
+        Args:
+            J: Tuple (X, Y, Z)
+
+        Returns:
+            Tuple (X3, Y3, Z3)
+        """
+        X1, Y1, Z1 = J
+        if Z1 == 0 or Y1 == 0:
+            return cls.JACOBIAN_INFINITY
+
+        p = cls.field_modulus
+        YY = (Y1 * Y1) % p
+        S = (4 * X1 * YY) % p
+        M = (3 * X1 * X1) % p
+        X3 = (M * M - 2 * S) % p
+        Y3 = (M * (S - X3) - 8 * YY * YY) % p
+        Z3 = (2 * Y1 * Z1) % p
+        return (X3, Y3, Z3)
+
+    @classmethod
+    def jacobian_add(cls, J1, J2):
+        """
+        Add two Jacobian points: R = J1 + J2 (no inversion).
+
+        Args:
+            J1: Tuple (X1, Y1, Z1)
+            J2: Tuple (X2, Y2, Z2)
+
+        Returns:
+            Tuple (X3, Y3, Z3)
+        """
+        X1, Y1, Z1 = J1
+        X2, Y2, Z2 = J2
+        if Z1 == 0:
+            return J2
+        if Z2 == 0:
+            return J1
+
+        p = cls.field_modulus
+        Z1Z1 = (Z1 * Z1) % p
+        Z2Z2 = (Z2 * Z2) % p
+        U1 = (X1 * Z2Z2) % p
+        U2 = (X2 * Z1Z1) % p
+        S1 = (Y1 * Z2 * Z2Z2) % p
+        S2 = (Y2 * Z1 * Z1Z1) % p
+
+        H = (U2 - U1) % p
+        R = (S2 - S1) % p
+        if H == 0:
+            # Same x: either P + P (double) or P + (-P) (infinity)
+            if R == 0:
+                return cls.jacobian_double(J1)
+            return cls.JACOBIAN_INFINITY
+
+        HH = (H * H) % p
+        HHH = (H * HH) % p
+        V = (U1 * HH) % p
+        X3 = (R * R - HHH - 2 * V) % p
+        Y3 = (R * (V - X3) - S1 * HHH) % p
+        Z3 = (Z1 * Z2 * H) % p
+        return (X3, Y3, Z3)
+
+    @classmethod
+    def jacobian_add_affine(cls, J, x2, y2):
+        """
+        Mixed addition: Jacobian point + affine point (x2, y2).
+
+        Same as jacobian_add with Z2 = 1, which saves several
+        multiplications. Used whenever one operand is a fixed base point.
+
+        Args:
+            J: Tuple (X1, Y1, Z1)
+            x2, y2: Affine coordinates of the second point
+
+        Returns:
+            Tuple (X3, Y3, Z3)
+        """
+        X1, Y1, Z1 = J
+        if Z1 == 0:
+            return (x2, y2, 1)
+
+        p = cls.field_modulus
+        Z1Z1 = (Z1 * Z1) % p
+        U2 = (x2 * Z1Z1) % p
+        S2 = (y2 * Z1 * Z1Z1) % p
+
+        H = (U2 - X1) % p
+        R = (S2 - Y1) % p
+        if H == 0:
+            if R == 0:
+                return cls.jacobian_double(J)
+            return cls.JACOBIAN_INFINITY
+
+        HH = (H * H) % p
+        HHH = (H * HH) % p
+        V = (X1 * HH) % p
+        X3 = (R * R - HHH - 2 * V) % p
+        Y3 = (R * (V - X3) - Y1 * HHH) % p
+        Z3 = (Z1 * H) % p
+        return (X3, Y3, Z3)
+
+    @classmethod
+    def double_and_add(cls, k, P):
+        """
+        Generic scalar multiplication: R = k × P (Jacobian double-and-add).
+
+        Processes bits of k from left to right with mixed (Jacobian + affine)
+        additions, then normalizes once at the end. One mod_inverse per
+        multiplication instead of one per step.
+
+        Args:
+            k: Scalar in [1, n-1]
+            P: Affine Point (not infinity)
+
+        Returns:
+            Point representing k × P
+        """
+        if k == 0:
+            return Point(None, None)
+
+        x, y = P.x, P.y
+        p = cls.field_modulus
+        # Leading bit: R = P
+        X, Y, Z = x, y, 1
+        for bit in bin(k)[3:]:
+            # R = 2R (jacobian_double inlined; no 2-torsion on secp256k1)
+            YY = (Y * Y) % p
+            S = (4 * X * YY) % p
+            M = (3 * X * X) % p
+            Z = (2 * Y * Z) % p
+            X = (M * M - 2 * S) % p
+            Y = (M * (S - X) - 8 * YY * YY) % p
+            if bit == '1':
+                X, Y, Z = cls.jacobian_add_affine((X, Y, Z), x, y)
+
+        return cls.from_jacobian((X, Y, Z))
+
+    # Default window width for variable-base wNAF multiplication
+    # (pick with benchmark_wnaf_widths() on the target machine)
+    WNAF_WIDTH = 5
+
+    @staticmethod
+    def wnaf(k, width):
+        """
+        Width-w non-adjacent form of k.
+
+        Every non-zero digit is odd, |digit| < 2^(w-1), and any w consecutive
+        digits contain at most one non-zero digit, so only ~1/(w+1) of the
+        positions need an addition (vs ~1/2 for plain binary).
+
+        Args:
+            k: Non-negative scalar
+            width: Window width w >= 2
+
+        Returns:
+            List of digits, least significant first
+        """
+        digits = []
+        full = 1 << width
+        half = full >> 1
+        while k:
+            if k & 1:
+                digit = k & (full - 1)
+                if digit >= half:
+                    digit -= full
+                k -= digit
+            else:
+                digit = 0
+            digits.append(digit)
+            k >>= 1
+        return digits
+
+    @classmethod
+    def odd_multiples(cls, P, width):
+        """
+        Precompute P, 3P, 5P, ..., (2^(w-1) - 1)P in Jacobian coordinates.
+
+        Args:
+            P: Affine Point
+            width: Window width w >= 2
+
+        Returns:
+            List of 2^(w-2) Jacobian tuples; entry i is (2i + 1) × P
+        """
+        J = cls.to_jacobian(P)
+        multiples = [J]
+        if width > 2:
+            twice = cls.jacobian_double(J)
+            for _ in range((1 << (width - 2)) - 1):
+                J = cls.jacobian_add(J, twice)
+                multiples.append(J)
+        return multiples
+
     @classmethod
-    def point_multiply(cls, k, P=None):
+    def wnaf_multiply(cls, k, P, width=None):
+        """
+        Variable-base scalar multiplication with a width-w NAF: R = k × P
+
+        Precomputes the odd multiples of P, then does one doubling per bit
+        and one addition per non-zero wNAF digit (negative digits add the
+        negated multiple, which is free: -(X, Y, Z) = (X, -Y, Z)).
+
+        Args:
+            k: Scalar in [1, n-1]
+            P: Affine Point (not infinity)
+            width: Window width (default WNAF_WIDTH)
+
+        Returns:
+            Point representing k × P
+        """
+        if width is None:
+            width = cls.WNAF_WIDTH
+        if width < 2:
+            raise ValueError("wNAF window width must be at least 2")
+
+        multiples = cls.odd_multiples(P, width)
+        return cls.from_jacobian(cls.interleaved_wnaf([(k, multiples)], width))
+
+    @classmethod
+    def interleaved_wnaf(cls, terms, width=None):
+        """
+        Strauss-Shamir simultaneous multiplication: SUM(k_i × P_i)
+
+        All wNAF expansions share ONE chain of doublings; each term only
+        adds its own table entry when its digit is non-zero. Two 256-bit
+        products cost ~256 doublings instead of ~512.
+
+        Args:
+            terms: List of (k_i, multiples_i), k_i >= 0 and multiples_i from
+                   odd_multiples(P_i, width) - either Jacobian tuples or
+                   affine (x, y) tuples from normalize_many (affine entries
+                   use the cheaper mixed addition)
+            width: Window width the multiples were built with
+
+        Returns:
+            Jacobian tuple for the sum
+        """
+        if width is None:
+            width = cls.WNAF_WIDTH
+
+        p = cls.field_modulus
+        tables = []
+        length = 0
+        for k, multiples in terms:
+            digits = cls.wnaf(k, width)
+            tables.append((digits, len(digits), multiples, cls.negate_all(multiples)))
+            length = max(length, len(digits))
+
+        # R kept in locals with doubling and both additions inlined: the
+        # loop builds no tuples (jacobian_add is only called for P + P)
+        X, Y, Z = cls.JACOBIAN_INFINITY
+        for i in range(length - 1, -1, -1):
+            if Z:
+                # R = 2R (no 2-torsion on secp256k1, so Y != 0)
+                YY = (Y * Y) % p
+                S = (4 * X * YY) % p
+                M = (3 * X * X) % p
+                Z = (2 * Y * Z) % p
+                X = (M * M - 2 * S) % p
+                Y = (M * (S - X) - 8 * YY * YY) % p
+            for digits, size, multiples, negated in tables:
+                if i >= size:
+                    continue
+                digit = digits[i]
+                if not digit:
+                    continue
+                P = multiples[digit >> 1] if digit > 0 else negated[(-digit) >> 1]
+                if not Z:
+                    X, Y, Z = P if len(P) == 3 else P + (1,)
+                    continue
+                ZZ = (Z * Z) % p
+                if len(P) == 2:
+                    # Mixed addition (Z2 = 1)
+                    U1, S1 = X, Y
+                    H = (P[0] * ZZ - X) % p
+                    R = (P[1] * Z * ZZ - Y) % p
+                else:
+                    Z2 = P[2]
+                    Z2Z2 = (Z2 * Z2) % p
+                    U1 = (X * Z2Z2) % p
+                    S1 = (Y * Z2 * Z2Z2) % p
+                    H = (P[0] * ZZ - U1) % p
+                    R = (P[1] * Z * ZZ - S1) % p
+                    Z = (Z * Z2) % p
+                if not H:
+                    # Same x: R == P (double) or R == -P (infinity)
+                    if R:
+                        X, Y, Z = cls.JACOBIAN_INFINITY
+                    else:
+                        X, Y, Z = cls.jacobian_double(P if len(P) == 3 else P + (1,))
+                    continue
+                HH = (H * H) % p
+                HHH = (H * HH) % p
+                V = (U1 * HH) % p
+                X = (R * R - HHH - 2 * V) % p
+                Y = (R * (V - X) - S1 * HHH) % p
+                Z = (Z * H) % p
+        return (X, Y, Z)
+
+    @classmethod
+    def negate_all(cls, points):
+        """
+        Negate a list of points: -(x, y) = (x, -y), same for Jacobian.
+
+        Args:
+            points: List of affine (x, y) or Jacobian (X, Y, Z) tuples
+
+        Returns:
+            List of negated tuples of the same kind
+        """
+        p = cls.p
+        if points and len(points[0]) == 2:
+            return [(x, p - y) for x, y in points]
+        return [(X, p - Y, Z) for X, Y, Z in points]
+
+    @classmethod
+    def normalize_many(cls, points):
+        """
+        Convert many Jacobian points to affine (x, y) tuples.
+
+        Uses one batch_mod_inverse (Montgomery's trick) for all Z values
+        instead of one mod_inverse per point.
+
+        Args:
+            points: List of Jacobian tuples (none may be infinity)
+
+        Returns:
+            List of affine (x, y) tuples, same order
+
+        Raises:
+            ValueError: If a point is the point at infinity
+        """
+        p = cls.field_modulus
+        result = []
+        for (X, Y, _), z_inv in zip(points, batch_mod_inverse([J[2] for J in points], p)):
+            z_inv2 = (z_inv * z_inv) % p
+            result.append(((X * z_inv2) % p, (Y * z_inv2 * z_inv) % p))
+        return result
+
+    # Use the GLV endomorphism for variable-base point_multiply
+    USE_GLV = True
+
+    @classmethod
+    def glv_decompose(cls, k):
+        """
+        Split k into (k1, k2) with k = k1 + k2*lambda (mod n), |k1|, |k2| ~ 2^128.
+
+        Rounds k onto the lattice spanned by the short basis vectors
+        (Babai rounding) and returns the difference.
+
+        Args:
+            k: Scalar in [0, n-1]
+
+        Returns:
+            Tuple (k1, k2) of signed integers
+        """
+        n = cls.n
+        half = n >> 1
+        c1 = (cls.glv_b2 * k + half) // n
+        c2 = (-cls.glv_b1 * k + half) // n
+        k1 = k - c1 * cls.glv_a1 - c2 * cls.glv_a2
+        k2 = -c1 * cls.glv_b1 - c2 * cls.glv_b2
+        return k1, k2
+
+    @classmethod
+    def glv_multiply(cls, k, P, width=None):
+        """
+        Scalar multiplication using the GLV endomorphism: R = k × P
+
+        k × P = k1 × P + k2 × phi(P), where phi(x, y) = (beta*x, y) costs
+        one field multiplication. Both ~128-bit halves run through one
+        interleaved wNAF pass, halving the number of doublings.
+
+        Args:
+            k: Scalar in [1, n-1]
+            P: Affine Point (not infinity)
+            width: Window width (default WNAF_WIDTH)
+
+        Returns:
+            Point representing k × P
+        """
+        if width is None:
+            width = cls.WNAF_WIDTH
+
+        terms = cls.glv_terms(k, cls.odd_multiples(P, width))
+        return cls.from_jacobian(cls.interleaved_wnaf(terms, width))
+
+    @classmethod
+    def glv_terms(cls, k, multiples):
+        """
+        Split k × P into two interleaved_wnaf terms: k1 × P + k2 × phi(P).
+
+        Args:
+            k: Scalar in [0, n-1]
+            multiples: odd_multiples(P, width) (Jacobian or affine tuples)
+
+        Returns:
+            List [(k1, multiples), (k2, phi_multiples)] with k1, k2 >= 0
+        """
+        p = cls.field_modulus
+        beta = cls.beta
+        k1, k2 = cls.glv_decompose(k)
+        # phi only scales x (X for Jacobian, since x = X/Z^2)
+        phi_multiples = [((beta * P[0]) % p,) + P[1:] for P in multiples]
+
+        # Negative halves: multiply the negated point instead
+        if k1 < 0:
+            k1 = -k1
+            multiples = cls.negate_all(multiples)
+        if k2 < 0:
+            k2 = -k2
+            phi_multiples = cls.negate_all(phi_multiples)
+
+        return [(k1, multiples), (k2, phi_multiples)]
+
+    @staticmethod
+    def pippenger_width(count, bits=256):
+        """
+        Choose the Pippenger bucket width for count terms.
+
+        Each of the ~bits/c windows costs one mixed addition per term plus
+        ~2^c additions to sum 2^(c-1) signed-digit buckets, so the width
+        minimizing (bits/c) * (count + 2^c) is used (roughly ln(count)).
+
+        Args:
+            count: Number of (scalar, point) terms
+            bits: Scalar size in bits
+
+        Returns:
+            Bucket width c (>= 1)
+        """
+        best_width, best_cost = 1, None
+        for c in range(1, 21):
+            cost = (bits // c + 1) * (count + (1 << c))
+            if best_cost is None or cost < best_cost:
+                best_width, best_cost = c, cost
+        return best_width
+
+    @classmethod
+    def pippenger_jacobian(cls, scalars, points, width=None, glv=None):
+        """
+        Pippenger (bucket) multi-scalar multiplication: SUM(k_i × P_i)
+
+        Scalars are cut into signed base-2^c digits. For each window every
+        point is added once into the bucket of its digit, then the buckets
+        are summed as SUM(j × B_j) with a running sum (2 additions per
+        bucket). Cost is ~(b/c) × (n + 2^c) additions plus b doublings
+        in total, so per-term cost falls as n grows, unlike one
+        multiplication per term. With GLV every term becomes two ~128-bit
+        terms (k1 × P + k2 × phi(P)), halving b.
+
+        Args:
+            scalars: List of scalars k_i (reduced mod n)
+            points: List of affine Points P_i, same length
+            width: Bucket width c (default pippenger_width for the input)
+            glv: Split scalars with the GLV endomorphism (default USE_GLV)
+
+        Returns:
+            Jacobian tuple for the sum
+        """
+        n, p = cls.n, cls.field_modulus
+        if glv is None:
+            glv = cls.USE_GLV
+
+        terms = []
+        for k, P in zip(scalars, points):
+            k %= n
+            if not k or P.is_infinity():
+                continue
+            if not glv:
+                terms.append((k, P.x, P.y))
+                continue
+            k1, k2 = cls.glv_decompose(k)
+            phi_x = (cls.beta * P.x) % p
+            # Negative halves: add the negated point instead
+            terms.append((k1, P.x, P.y) if k1 >= 0 else (-k1, P.x, p - P.y))
+            terms.append((k2, phi_x, P.y) if k2 >= 0 else (-k2, phi_x, p - P.y))
+        if not terms:
+            return cls.JACOBIAN_INFINITY
+
+        bits = max(k.bit_length() for k, _, _ in terms)
+        if width is None:
+            width = cls.pippenger_width(len(terms), bits)
+        if width < 1:
+            raise ValueError("Bucket width must be at least 1")
+
+        # Signed digits in [-2^(c-1), 2^(c-1)]: half as many buckets
+        radix = 1 << width
+        half = radix >> 1
+        mask = radix - 1
+        windows = bits // width + 1
+        recoded = []
+        for k, x, y in terms:
+            digits = []
+            for _ in range(windows):
+                d = k & mask
+                k >>= width
+                if d > half:
+                    d -= radix
+                    k += 1
+                digits.append(d)
+            recoded.append((digits, x, y, p - y))
+
+        double = cls.jacobian_double
+        add = cls.jacobian_add
+        add_affine = cls.jacobian_add_affine
+        infinity = cls.JACOBIAN_INFINITY
+        R = infinity
+        for i in range(windows - 1, -1, -1):
+            for _ in range(width):
+                R = double(R)
+
+            buckets = [infinity] * (half + 1)
+            for digits, x, y, neg_y in recoded:
+                d = digits[i]
+                if d > 0:
+                    buckets[d] = add_affine(buckets[d], x, y)
+                elif d < 0:
+                    buckets[-d] = add_affine(buckets[-d], x, neg_y)
+
+            # SUM(j × B_j) = B_top + (B_top + B_top-1) + ...
+            running = infinity
+            window_sum = infinity
+            for j in range(half, 0, -1):
+                running = add(running, buckets[j])
+                window_sum = add(window_sum, running)
+            R = add(R, window_sum)
+        return R
+
+    # Below this many terms, interleaved wNAF (Strauss) beats Pippenger
+    # (crossover measured with benchmark_multi_scalar)
+    PIPPENGER_MIN_TERMS = 32
+
+    @classmethod
+    def multi_scalar_multiply(cls, scalars, points, width=None):
+        """
+        Multi-scalar multiplication: R = SUM(k_i × P_i)
+
+        Small inputs use one interleaved wNAF pass (GLV-split when
+        enabled); from PIPPENGER_MIN_TERMS terms on, Pippenger's bucket
+        method with a width chosen from the input size.
+
+        Args:
+            scalars: List of scalars k_i
+            points: List of affine Points P_i, same length
+            width: Optional Pippenger bucket width (forces Pippenger)
+
+        Returns:
+            Point representing the sum
+
+        Raises:
+            ValueError: If scalars and points differ in length
+        """
+        if len(scalars) != len(points):
+            raise ValueError("scalars and points must have the same length")
+
+        if width is not None or len(points) >= cls.PIPPENGER_MIN_TERMS:
+            return cls.from_jacobian(cls.pippenger_jacobian(scalars, points, width))
+
+        wnaf_width = cls.WNAF_WIDTH
+        terms = []
+        for k, P in zip(scalars, points):
+            k %= cls.n
+            if not k or P.is_infinity():
+                continue
+            multiples = cls.odd_multiples(P, wnaf_width)
+            if cls.USE_GLV:
+                terms += cls.glv_terms(k, multiples)
+            else:
+                terms.append((k, multiples))
+        return cls.from_jacobian(cls.interleaved_wnaf(terms, wnaf_width))
+
+    # Odd multiples of G per window width (for passes without the table)
+    _generator_multiples = {}
+
+    @classmethod
+    def shamir_jacobian(cls, u1, u2, Q, width=None, Q_multiples=None, Q_terms=None):
+        """
+        Compute u1 × G + u2 × Q in a single pass (Shamir's trick / Strauss).
+
+        This is the core of ECDSA verification. If a fixed-base table for
+        G is loaded, u1 × G is accumulated from it with additions only and
+        just u2 × Q needs doublings; otherwise both products share one
+        interleaved chain of doublings. With USE_GLV each scalar is also
+        split into ~128-bit halves, so the shared chain is ~128 doublings.
+
+        Args:
+            u1: Scalar for G in [0, n-1]
+            u2: Scalar for Q in [0, n-1]
+            Q: Affine Point (not infinity)
+            width: Window width (default WNAF_WIDTH)
+            Q_multiples: Optional precomputed odd_multiples(Q, width)
+            Q_terms: Optional ready interleaved_wnaf terms for u2 × Q
+                     (see VerifyingKey.precompute); u2 and Q are then unused
+
+        Returns:
+            Jacobian tuple for u1 × G + u2 × Q
+        """
+        if width is None:
+            width = cls.WNAF_WIDTH
+        if Q_terms is not None:
+            terms = list(Q_terms)
+        else:
+            if Q_multiples is None:
+                Q_multiples = cls.odd_multiples(Q, width)
+            if cls.USE_GLV:
+                terms = cls.glv_terms(u2, Q_multiples)
+            else:
+                terms = [(u2, Q_multiples)]
+
+        table = cls._generator_table
+        if table is not None:
+            return table.multiply_jacobian(u1, cls.interleaved_wnaf(terms, width))
+
+        G_multiples = cls._generator_multiples.get(width)
+        if G_multiples is None:
+            G_multiples = cls.odd_multiples(cls.G, width)
+            cls._generator_multiples[width] = G_multiples
+        if cls.USE_GLV:
+            terms += cls.glv_terms(u1, G_multiples)
+        else:
+            terms.append((u1, G_multiples))
+        return cls.interleaved_wnaf(terms, width)
+
+    # Lazily built fixed-base table for G (see GeneratorTable)
+    _generator_table = None
+
+    @classmethod
+    def generator_table(cls):
+        """
+        Get the fixed-base table for G, building it on first use.
+
+        If the environment variable ECDSARR_G_TABLE names a file, the table
+        is memory-mapped from it (or built and written there if missing),
+        so short-lived processes skip the build. A stale or corrupt file
+        is replaced with a freshly built table, with a warning.
+
+        Returns:
+            GeneratorTable instance
+        """
+        if cls._generator_table is None:
+            path = os.environ.get(GeneratorTable.ENV_PATH)
+            table = None
+            if path and os.path.exists(path):
+                try:
+                    table = GeneratorTable.load(path)
+                except ValueError as e:
+                    warnings.warn(f"{GeneratorTable.ENV_PATH}: {e}; rebuilding", RuntimeWarning)
+            if table is None:
+                table = GeneratorTable.build()
+                if path:
+                    table.save(path)
+            cls._generator_table = table
+        return cls._generator_table
+
+    @classmethod
+    def set_generator_table(cls, table):
+        """
+        Install a fixed-base table for G (e.g. one loaded from a cache file).
+
+        Args:
+            table: GeneratorTable instance, or None to drop the current table
+        """
+        cls._generator_table = table
+
+    @classmethod
+    def point_multiply(cls, k, P=None, window=None, glv=None):
         """
         Multiply point by scalar: R = k × P
 
-        Uses double-and-add algorithm for efficiency.
+        k × G uses the precomputed fixed-base table (additions only).
+        Other points use wNAF with the given window width, split into two
+        half-length scalars with the GLV endomorphism when enabled.
 
         Args:
             k: Scalar (private key)
             P: Point to multiply (defaults to generator G)
+            window: wNAF window width for P != G (default WNAF_WIDTH)
+            glv: Use the GLV endomorphism for P != G (default USE_GLV)
 
         Returns:
             Point representing k × P
@@ -198,20 +1084,363 @@ class Secp256k1:
 
         # Normalize k to be positive
         k = k % cls.n
+        if k == 0 or P.is_infinity():
+            return Point(None, None)
 
-        # Double-and-add algorithm
-        # Convert k to binary and process from left to right
-        result = Point(None, None)  # Start with point at infinity
-        addend = P
+        if P == cls.G:
+            return cls.from_jacobian(cls.generator_table().multiply_jacobian(k))
+        if glv is None:
+            glv = cls.USE_GLV
+        if glv:
+            return cls.glv_multiply(k, P, window)
+        return cls.wnaf_multiply(k, P, window)
 
-        # Process each bit of k from right to left
-        while k > 0:
-            if k & 1:  # If bit is 1
-                result = cls.point_add(result, addend)
-            addend = cls.point_double(addend)
-            k >>= 1
 
-        return result
+class GeneratorTable:
+    """
+    Fixed-base window table for the generator G.
+
+    The scalar k is split into base-2^w digits d_i, so
+        k × G = SUM( d_i × 2^(w*i) × G )
+    Every d_i × 2^(w*i) × G is precomputed (affine), so a multiplication
+    is one mixed addition per non-zero digit and no doublings at all.
+
+    File format (for caching / memory-mapping):
+        8-byte header: MAGIC (6 bytes) + version (1 byte) + width (1 byte)
+        then one 64-byte record (x || y, big-endian) per table entry,
+        ordered by window i, then digit j = 1 .. 2^w - 1.
+    """
+
+    MAGIC = b'RRGTAB'
+    VERSION = 1
+    HEADER_SIZE = 8
+    RECORD_SIZE = 64
+
+    # 6-bit windows: 43 additions per k × G, 2709 entries (~170 KB on disk)
+    DEFAULT_WIDTH = 6
+
+    # Widths accepted from a file (16 bits is already ~270 MB)
+    MAX_WIDTH = 16
+
+    # Environment variable naming an on-disk cache file
+    ENV_PATH = 'ECDSARR_G_TABLE'
+
+    def __init__(self, width, points=None, buffer=None):
+        """
+        Initialize from decoded points or from a raw (possibly mmap'd) buffer.
+
+        Args:
+            width: Window width w in bits
+            points: List of (x, y) tuples in table order
+            buffer: Bytes-like object in the file format (including header)
+        """
+        self.width = width
+        self.windows = (256 + width - 1) // width
+        self.row_size = (1 << width) - 1
+        self.size = self.windows * self.row_size
+        self._buffer = buffer
+        if points is not None:
+            self._points = points
+        else:
+            # Decoded lazily on first access
+            self._points = [None] * self.size
+
+    @classmethod
+    def build(cls, width=None):
+        """
+        Compute the table from scratch.
+
+        Args:
+            width: Window width (default DEFAULT_WIDTH)
+
+        Returns:
+            GeneratorTable instance
+        """
+        if width is None:
+            width = cls.DEFAULT_WIDTH
+
+        curve = Secp256k1
+        points = []
+        base = curve.to_jacobian(curve.G)
+        for _ in range((256 + width - 1) // width):
+            # Row i holds j × B for B = 2^(w*i) × G, j = 1 .. 2^w - 1
+            Bx, By = curve.normalize_many([base])[0]
+            J = (Bx, By, 1)
+            row = [J]
+            for _ in range(2, 1 << width):
+                J = curve.jacobian_add_affine(J, Bx, By)
+                row.append(J)
+            points += curve.normalize_many(row)
+            for _ in range(width):
+                base = curve.jacobian_double(base)
+
+        return cls(width, points=points)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Memory-map a table previously written with save().
+
+        The header and the file length implied by the stored width are
+        checked, then every entry is decoded and checked to be on the
+        curve (a few ms for the default width), and the first must be G.
+
+        Args:
+            path: File path
+
+        Returns:
+            GeneratorTable instance
+
+        Raises:
+            ValueError: If the file is not a valid table
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < cls.HEADER_SIZE:
+                raise ValueError(f"Not a generator table file: {path}")
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = buffer[:cls.HEADER_SIZE]
+        if header[:6] != cls.MAGIC or header[6] != cls.VERSION:
+            buffer.close()
+            raise ValueError(f"Not a generator table file: {path}")
+
+        width = header[7]
+        if not 1 <= width <= cls.MAX_WIDTH:
+            buffer.close()
+            raise ValueError(f"Generator table file has invalid window width {width}: {path}")
+
+        table = cls(width, buffer=buffer)
+        if len(buffer) != cls.HEADER_SIZE + table.size * cls.RECORD_SIZE:
+            buffer.close()
+            raise ValueError(f"Generator table file has wrong size for width {width}: {path}")
+        if table.entry(0) != (Secp256k1.Gx, Secp256k1.Gy):
+            buffer.close()
+            raise ValueError(f"Generator table file does not start with G: {path}")
+
+        # y² = x³ + 7 (mod p) for every entry, so a corrupt record cannot
+        # silently produce wrong keys and signatures
+        p, b = Secp256k1.p, Secp256k1.b
+        for index in range(table.size):
+            x, y = table.entry(index)
+            if x >= p or y >= p or (y * y - x * x * x - b) % p:
+                buffer.close()
+                raise ValueError(f"Generator table entry {index} is not on the curve: {path}")
+        return table
+
+    def save(self, path):
+        """
+        Write the table to a file (atomically, via a temporary file).
+
+        Args:
+            path: File path
+        """
+        header = self.MAGIC + bytes([self.VERSION, self.width])
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            for i in range(self.size):
+                x, y = self.entry(i)
+                f.write(x.to_bytes(32, 'big') + y.to_bytes(32, 'big'))
+        os.replace(tmp_path, path)
+
+    def entry(self, index):
+        """
+        Get table entry as an affine (x, y) tuple.
+
+        Args:
+            index: Flat index (window * row_size + digit - 1)
+
+        Returns:
+            Tuple (x, y)
+        """
+        point = self._points[index]
+        if point is None:
+            offset = self.HEADER_SIZE + index * self.RECORD_SIZE
+            record = self._buffer[offset:offset + self.RECORD_SIZE]
+            point = (int.from_bytes(record[:32], 'big'),
+                     int.from_bytes(record[32:], 'big'))
+            self._points[index] = point
+        return point
+
+    def multiply_jacobian(self, k, R=None):
+        """
+        Compute k × G using only table lookups and mixed additions.
+
+        Args:
+            k: Scalar in [0, n-1]
+            R: Optional Jacobian point to accumulate onto (R + k × G)
+
+        Returns:
+            Jacobian tuple (X, Y, Z) for k × G (or R + k × G)
+        """
+        p = Secp256k1.field_modulus
+        width = self.width
+        mask = self.row_size
+        entry = self.entry
+        row_start = 0
+        X, Y, Z = Secp256k1.JACOBIAN_INFINITY if R is None else R
+        while k:
+            digit = k & mask
+            if digit:
+                x2, y2 = entry(row_start + digit - 1)
+                if not Z:
+                    X, Y, Z = x2, y2, 1
+                else:
+                    # R = R + (x2, y2), jacobian_add_affine inlined
+                    ZZ = (Z * Z) % p
+                    H = (x2 * ZZ - X) % p
+                    S = (y2 * Z * ZZ - Y) % p
+                    if not H:
+                        X, Y, Z = Secp256k1.jacobian_add_affine((X, Y, Z), x2, y2)
+                    else:
+                        HH = (H * H) % p
+                        HHH = (H * HH) % p
+                        V = (X * HH) % p
+                        X = (S * S - HHH - 2 * V) % p
+                        Y = (S * (V - X) - Y * HHH) % p
+                        Z = (Z * H) % p
+            k >>= width
+            row_start += mask
+        return (X, Y, Z)
+
+
+class BadSignatureError(Exception):
+    """Raised when a signature does not verify (same name as in ecdsa)."""
+    pass
+
+
+def sigdecode_string(signature, order):
+    """
+    Decode a raw 64-byte signature (r || s).
+
+    Compatible with ecdsa.util.sigdecode_string.
+
+    Args:
+        signature: 64 bytes
+        order: Curve order (unused, for API compatibility)
+
+    Returns:
+        Tuple (r, s)
+    """
+    if len(signature) != 64:
+        raise BadSignatureError(f"Raw signature must be 64 bytes, got {len(signature)}")
+    return (int.from_bytes(signature[:32], byteorder='big'),
+            int.from_bytes(signature[32:], byteorder='big'))
+
+
+def sigdecode_der(signature, order):
+    """
+    Decode a DER signature: 0x30 len 0x02 len(r) r 0x02 len(s) s.
+
+    Compatible with ecdsa.util.sigdecode_der.
+
+    Args:
+        signature: DER-encoded bytes
+        order: Curve order (unused, for API compatibility)
+
+    Returns:
+        Tuple (r, s)
+    """
+    def read_integer(data, pos):
+        if pos + 2 > len(data) or data[pos] != 0x02:
+            raise BadSignatureError("DER signature: expected INTEGER")
+        length = data[pos + 1]
+        start = pos + 2
+        if length == 0 or length > 33 or start + length > len(data):
+            raise BadSignatureError("DER signature: bad INTEGER length")
+        return int.from_bytes(data[start:start + length], byteorder='big'), start + length
+
+    if len(signature) < 8 or signature[0] != 0x30 or signature[1] != len(signature) - 2:
+        raise BadSignatureError("DER signature: bad SEQUENCE header")
+    r, pos = read_integer(signature, 2)
+    s, pos = read_integer(signature, pos)
+    if pos != len(signature):
+        raise BadSignatureError("DER signature: trailing data")
+    return r, s
+
+
+def sigencode_string(r, s, order):
+    """
+    Encode a signature as raw 64 bytes (r || s).
+
+    Compatible with ecdsa.util.sigencode_string.
+
+    Args:
+        r, s: Signature values
+        order: Curve order (unused, for API compatibility)
+
+    Returns:
+        64 bytes
+    """
+    return r.to_bytes(32, byteorder='big') + s.to_bytes(32, byteorder='big')
+
+
+def sigencode_der(r, s, order):
+    """
+    Encode a signature in DER: 0x30 len 0x02 len(r) r 0x02 len(s) s.
+
+    Compatible with ecdsa.util.sigencode_der.
+
+    Args:
+        r, s: Signature values
+        order: Curve order (unused, for API compatibility)
+
+    Returns:
+        DER-encoded bytes
+    """
+    def integer(value):
+        # Minimal big-endian bytes, with a 0x00 pad if the top bit is set
+        data = value.to_bytes((value.bit_length() + 8) // 8, byteorder='big')
+        return b'\x02' + bytes([len(data)]) + data
+
+    body = integer(r) + integer(s)
+    return b'\x30' + bytes([len(body)]) + body
+
+
+def _digest_to_int(digest):
+    """Convert a message digest to an integer, keeping the leftmost 256 bits."""
+    z = int.from_bytes(digest, byteorder='big')
+    excess = len(digest) * 8 - Secp256k1.n.bit_length()
+    if excess > 0:
+        z >>= excess
+    return z
+
+
+def rfc6979_nonces(private_key, digest):
+    """
+    Deterministic ECDSA nonces (RFC 6979, section 3.2, HMAC-SHA256).
+
+    The nonce depends only on the private key and the digest, so no
+    random number generator is needed and the same message always gets
+    the same signature.
+
+    Args:
+        private_key: Private key integer in [1, n-1]
+        digest: Message digest bytes
+
+    Yields:
+        Candidate nonces k in [1, n-1]; the signer takes the first and
+        only asks for more if it yields r == 0 or s == 0
+    """
+    n = Secp256k1.n
+    x = private_key.to_bytes(32, byteorder='big')
+    # bits2octets(h1): leftmost 256 bits, reduced mod n
+    h1 = (_digest_to_int(digest) % n).to_bytes(32, byteorder='big')
+
+    V = b'\x01' * 32
+    K = b'\x00' * 32
+    K = hmac.new(K, V + b'\x00' + x + h1, hashlib.sha256).digest()
+    V = hmac.new(K, V, hashlib.sha256).digest()
+    K = hmac.new(K, V + b'\x01' + x + h1, hashlib.sha256).digest()
+    V = hmac.new(K, V, hashlib.sha256).digest()
+
+    while True:
+        V = hmac.new(K, V, hashlib.sha256).digest()
+        k = int.from_bytes(V, byteorder='big')
+        if 1 <= k < n:
+            yield k
+        K = hmac.new(K, V + b'\x00', hashlib.sha256).digest()
+        V = hmac.new(K, V, hashlib.sha256).digest()
 
 
 class SigningKey:
@@ -263,6 +1492,79 @@ class SigningKey:
         public_point = Secp256k1.point_multiply(self.private_key)
         return VerifyingKey(public_point)
 
+    def _finish_signature(self, z, r, k_inv, low_s):
+        """s = k^(-1) * (z + r*d) mod n, optionally normalized to s <= n/2."""
+        n = Secp256k1.n
+        s = (k_inv * (z + r * self.private_key)) % n
+        if low_s and s > n >> 1:
+            # (r, n - s) is equally valid; Bitcoin relays only low-S
+            s = n - s
+        return s
+
+    def sign_digest(self, digest, sigencode=sigencode_string, low_s=True):
+        """
+        Sign a message digest with a deterministic RFC 6979 nonce.
+
+        ECDSA signature:
+            k = RFC 6979 nonce from (private key, digest)
+            R = k × G, r = x(R) mod n
+            s = k^(-1) × (z + r × d) mod n
+
+        Args:
+            digest: Message digest bytes (leftmost 256 bits are used)
+            sigencode: Signature encoder (sigencode_string or sigencode_der)
+            low_s: Replace s by n - s when s > n/2 (default True)
+
+        Returns:
+            Encoded signature
+        """
+        n = Secp256k1.n
+        z = _digest_to_int(digest)
+        for k in rfc6979_nonces(self.private_key, digest):
+            r = Secp256k1.point_multiply(k).x % n
+            if r == 0:
+                continue
+            s = self._finish_signature(z, r, Secp256k1.mod_inverse(k, n), low_s)
+            if s != 0:
+                return sigencode(r, s, n)
+
+    def sign_many(self, digests, sigencode=sigencode_string, low_s=True):
+        """
+        Sign many digests with this key, sharing work across the batch.
+
+        Produces exactly the signatures sign_digest would, but:
+            - every R = k × G is accumulated in Jacobian form from the
+              fixed-base table and ALL are converted to affine with one
+              batch inversion (Montgomery's trick)
+            - ALL nonce inverses k^(-1) mod n come from one more batch
+              inversion
+        so a batch costs two inversions instead of two per signature.
+
+        Args:
+            digests: List of message digests
+            sigencode: Signature encoder (sigencode_string or sigencode_der)
+            low_s: Replace s by n - s when s > n/2 (default True)
+
+        Returns:
+            List of encoded signatures, same order as digests
+        """
+        n = Secp256k1.n
+        table = Secp256k1.generator_table()
+        nonces = [next(rfc6979_nonces(self.private_key, digest)) for digest in digests]
+        R_points = Secp256k1.normalize_many([table.multiply_jacobian(k) for k in nonces])
+        k_inverses = batch_mod_inverse(nonces, n)
+
+        signatures = []
+        for digest, (x, _), k_inv in zip(digests, R_points, k_inverses):
+            r = x % n
+            s = self._finish_signature(_digest_to_int(digest), r, k_inv, low_s) if r else 0
+            if s == 0:
+                # Next RFC 6979 candidate needed (probability ~2^-256)
+                signatures.append(self.sign_digest(digest, sigencode, low_s))
+            else:
+                signatures.append(sigencode(r, s, n))
+        return signatures
+
     def to_string(self):
         """
         Export private key as bytes.
@@ -273,13 +1575,97 @@ class SigningKey:
         return self.private_key.to_bytes(32, byteorder='big')
 
 
+# ============================================================================
+# Compressed public keys
+# ============================================================================
+
+# Compressed keys repeat (the same signers across many inputs), so the
+# square root is cached per encoding; 4096 entries is ~1 MB at most
+DECOMPRESSION_CACHE_SIZE = 4096
+
+
+def decompress_y(x, odd):
+    """
+    Recover y from x on secp256k1 (y^2 = x^3 + 7 mod p).
+
+    Because p = 3 (mod 4), a square root of rhs is rhs^((p+1)/4) mod p:
+    one modular exponentiation, no Tonelli-Shanks loop. The candidate is
+    squared back to reject x values that are not on the curve.
+
+    Args:
+        x: x-coordinate integer
+        odd: True to return the odd root (prefix 03), False for even (02)
+
+    Returns:
+        y-coordinate integer with the requested parity
+
+    Raises:
+        ValueError: If x >= p or no point on the curve has this x
+    """
+    p = Secp256k1.p
+    if not (0 <= x < p):
+        raise ValueError("x-coordinate out of range")
+    rhs = (x * x * x + Secp256k1.b) % p
+    y = pow(rhs, (p + 1) // 4, p)
+    if (y * y) % p != rhs:
+        raise ValueError("Point is not on the secp256k1 curve")
+    if (y & 1) != bool(odd):
+        y = p - y
+    return y
+
+
+@functools.lru_cache(maxsize=DECOMPRESSION_CACHE_SIZE)
+def _decompress_cached(compressed):
+    """Cached body of decompress_point (invalid keys raise and are not cached)."""
+    x = int.from_bytes(compressed[1:], byteorder='big')
+    return Point(x, decompress_y(x, compressed[0] == 3))
+
+
+def decompress_point(compressed):
+    """
+    Parse a 33-byte compressed public key (02/03 prefix + x).
+
+    Results go through a bounded LRU cache keyed by the encoding, so
+    repeated keys cost a dictionary lookup instead of a 256-bit
+    exponentiation. See decompression_cache_info() for hit rates.
+
+    Args:
+        compressed: 33 bytes, prefix 0x02 (even y) or 0x03 (odd y)
+
+    Returns:
+        Affine Point
+
+    Raises:
+        ValueError: If the encoding or the point is invalid
+    """
+    compressed = bytes(compressed)
+    if len(compressed) != 33 or compressed[0] not in (2, 3):
+        raise ValueError("Compressed public key must be 33 bytes with 02/03 prefix")
+    return _decompress_cached(compressed)
+
+
+def decompression_cache_info():
+    """Hit/miss statistics of the decompression cache (functools CacheInfo)."""
+    return _decompress_cached.cache_info()
+
+
+def clear_decompression_cache():
+    """Empty the decompression cache (e.g. between benchmarks)."""
+    _decompress_cached.cache_clear()
+
+
 class VerifyingKey:
     """
     ECDSA verifying key (public key).
 
-    Can verify signatures.
+    Can verify signatures (verify_digest). Keys that verify many
+    signatures can keep a window table of their own (precompute).
     """
 
+    # Window width for per-key tables: 2^(w-2) affine odd multiples, plus
+    # their GLV images and negations (see benchmark_verifying_key_cache)
+    PRECOMPUTE_WIDTH = 6
+
     def __init__(self, public_point):
         """
         Initialize verifying key from public point.
@@ -291,27 +1677,95 @@ class VerifyingKey:
             raise ValueError("Public key cannot be point at infinity")
 
         self.public_point = public_point
+        self._precomputed = None
+
+    def precompute(self, width=None):
+        """
+        Build this key's window table for verify_digest.
+
+        Stores the odd multiples 1Q, 3Q, ... (2^(w-1)-1)Q in affine form
+        (one shared inversion), together with phi(Q) multiples and both
+        negations, so a verification only decomposes u2 and runs the
+        interleaved pass. Without precompute() every call rebuilds the
+        multiples in Jacobian form.
+
+        Args:
+            width: wNAF window width (default PRECOMPUTE_WIDTH)
+
+        Returns:
+            self, for chaining
+        """
+        if width is None:
+            width = self.PRECOMPUTE_WIDTH
+        if width < 2:
+            raise ValueError("Window width must be at least 2")
+        p = Secp256k1.field_modulus
+        multiples = Secp256k1.normalize_many(Secp256k1.odd_multiples(self.public_point, width))
+        phi_multiples = [((Secp256k1.beta * x) % p, y) for x, y in multiples]
+        self._precomputed = (width, (multiples, Secp256k1.negate_all(multiples),
+                                     phi_multiples, Secp256k1.negate_all(phi_multiples)))
+        return self
+
+    def precomputed_size(self):
+        """
+        Approximate memory held by the precomputed table, in bytes.
+
+        Counts the tuples and coordinate ints (sys.getsizeof), not the
+        VerifyingKey itself. 0 if precompute() has not been called.
+        """
+        if self._precomputed is None:
+            return 0
+        total = 0
+        for table in self._precomputed[1]:
+            total += sys.getsizeof(table)
+            for entry in table:
+                total += sys.getsizeof(entry) + sum(sys.getsizeof(c) for c in entry)
+        return total
+
+    def _q_terms(self, u2):
+        """interleaved_wnaf terms for u2 × Q from the precomputed table."""
+        multiples, negated, phi_multiples, phi_negated = self._precomputed[1]
+        if not Secp256k1.USE_GLV:
+            return [(u2, multiples)]
+        k1, k2 = Secp256k1.glv_decompose(u2)
+        return [(k1, multiples) if k1 >= 0 else (-k1, negated),
+                (k2, phi_multiples) if k2 >= 0 else (-k2, phi_negated)]
 
     @classmethod
     def from_string(cls, public_key_bytes, curve=None):
         """
         Create VerifyingKey from bytes (compatible with ecdsa library API).
 
-        Expects uncompressed public key (64 bytes: x + y coordinates).
+        Accepts the three SEC1 encodings:
+            64 bytes: x + y coordinates, no prefix (raw)
+            65 bytes: 04 + x + y (uncompressed)
+            33 bytes: 02/03 + x (compressed, y recovered by decompress_point)
 
         Args:
-            public_key_bytes: 64 bytes (x + y coordinates, no prefix)
+            public_key_bytes: Encoded public key
             curve: Curve object (ignored, always uses secp256k1)
 
         Returns:
             VerifyingKey instance
+
+        Raises:
+            ValueError: If the encoding is unknown or the point is invalid
         """
-        if len(public_key_bytes) != 64:
-            raise ValueError("Public key must be 64 bytes (uncompressed, no prefix)")
+        length = len(public_key_bytes)
+        if length == 33:
+            return cls(decompress_point(public_key_bytes))
+        if length == 65:
+            if public_key_bytes[0] != 4:
+                raise ValueError("Uncompressed public key must start with 04")
+            public_key_bytes = public_key_bytes[1:]
+        elif length != 64:
+            raise ValueError("Public key must be 33, 64 or 65 bytes")
 
         # Parse x and y coordinates
         x = int.from_bytes(public_key_bytes[:32], byteorder='big')
         y = int.from_bytes(public_key_bytes[32:], byteorder='big')
+        if x >= Secp256k1.p or y >= Secp256k1.p:
+            raise ValueError("Coordinate out of range")
 
         # Verify point is on the curve
         # y² = x³ + 7 (mod p)
@@ -323,16 +1777,306 @@ class VerifyingKey:
 
         return cls(Point(x, y))
 
-    def to_string(self):
+    def to_string(self, encoding='raw'):
         """
-        Export public key as bytes (uncompressed format, no prefix).
+        Export public key as bytes.
+
+        Args:
+            encoding: 'raw' (64 bytes, x + y, default), 'uncompressed'
+                      (65 bytes, 04 prefix) or 'compressed' (33 bytes)
 
         Returns:
-            64 bytes (x + y coordinates)
+            Encoded public key bytes
+
+        Raises:
+            ValueError: If the encoding name is unknown
         """
         x_bytes = self.public_point.x.to_bytes(32, byteorder='big')
+        if encoding == 'compressed':
+            return (b'\x03' if self.public_point.y & 1 else b'\x02') + x_bytes
         y_bytes = self.public_point.y.to_bytes(32, byteorder='big')
-        return x_bytes + y_bytes
+        if encoding == 'raw':
+            return x_bytes + y_bytes
+        if encoding == 'uncompressed':
+            return b'\x04' + x_bytes + y_bytes
+        raise ValueError("Unknown encoding: %s" % encoding)
+
+    def verify_digest(self, signature, digest, sigdecode=sigdecode_string):
+        """
+        Verify an ECDSA signature over a precomputed digest.
+
+        Checks that x(u1 × G + u2 × Q) = r (mod n) with
+            w = s^(-1) mod n, u1 = z*w mod n, u2 = r*w mod n
+        Both products are computed in one interleaved pass (Shamir's
+        trick), and the x-coordinate is compared in Jacobian form
+        (X == r * Z^2), so no field inversion is needed.
+
+        Compatible with ecdsa.VerifyingKey.verify_digest.
+
+        Args:
+            signature: Encoded signature
+            digest: Message hash (bytes)
+            sigdecode: Decoder (signature, order) -> (r, s)
+                       (sigdecode_string or sigdecode_der)
+
+        Returns:
+            True if the signature is valid
+
+        Raises:
+            BadSignatureError: If the signature is invalid
+        """
+        n = Secp256k1.n
+        r, s = sigdecode(signature, n)
+        if not (1 <= r < n and 1 <= s < n):
+            raise BadSignatureError("Signature r or s out of range")
+
+        z = _digest_to_int(digest)
+        w = Secp256k1.mod_inverse(s, n)
+        u1 = (z * w) % n
+        u2 = (r * w) % n
+
+        if self._precomputed is not None:
+            X, _, Z = Secp256k1.shamir_jacobian(u1, u2, self.public_point,
+                                                width=self._precomputed[0],
+                                                Q_terms=self._q_terms(u2))
+        else:
+            X, _, Z = Secp256k1.shamir_jacobian(u1, u2, self.public_point)
+        if Z == 0:
+            raise BadSignatureError("Signature verification failed")
+
+        # x(R) mod n == r  <=>  X == x' * Z^2 for x' in {r, r + n} (x' < p)
+        p = Secp256k1.field_modulus
+        zz = (Z * Z) % p
+        if X == (r * zz) % p:
+            return True
+        if r + n < p and X == ((r + n) * zz) % p:
+            return True
+        raise BadSignatureError("Signature verification failed")
+
+
+def batch_public_keys(scalars):
+    """
+    Derive many public keys (k × G) at once.
+
+    Each product is accumulated in Jacobian form from the fixed-base table,
+    then ALL results are converted to affine with one batch_mod_inverse
+    (Montgomery's trick): one mod_inverse per batch instead of one per key.
+
+    Args:
+        scalars: Private keys as ints in [1, n-1] (or 32-byte strings)
+
+    Returns:
+        List of VerifyingKey, same order as scalars
+
+    Raises:
+        ValueError: If a private key is out of range
+    """
+    table = Secp256k1.generator_table()
+    points = []
+    for k in scalars:
+        if isinstance(k, (bytes, bytearray)):
+            k = int.from_bytes(k, byteorder='big')
+        if not (1 <= k < Secp256k1.n):
+            raise ValueError("Private key must be in range [1, n-1]")
+        points.append(table.multiply_jacobian(k))
+
+    return [VerifyingKey(Point(x, y)) for x, y in Secp256k1.normalize_many(points)]
+
+
+class VerifyingKeyCache:
+    """
+    Bounded LRU cache: public key bytes -> VerifyingKey with a window table.
+
+    Keys that verify repeatedly (our own hot-wallet and change keys) skip
+    parsing and the per-call odd-multiple precomputation. A key is only
+    precomputed on its second lookup, so one-off keys never pay for a
+    table they will not reuse.
+
+    Attributes:
+        maxsize (int): Maximum number of entries (0 disables caching)
+        width (int): Window width of the per-key tables
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that had to parse the key
+    """
+
+    def __init__(self, maxsize=512, width=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries
+            width (int): Table width (default VerifyingKey.PRECOMPUTE_WIDTH)
+        """
+        self.maxsize = maxsize
+        self.width = width if width is not None else VerifyingKey.PRECOMPUTE_WIDTH
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, public_key_bytes):
+        """
+        Get the VerifyingKey for an encoded public key, parsing it on a miss.
+
+        Args:
+            public_key_bytes: Encoding accepted by VerifyingKey.from_string
+
+        Returns:
+            VerifyingKey (precomputed from its second lookup on)
+
+        Raises:
+            ValueError: If the key is invalid (invalid keys are not cached)
+        """
+        key = bytes(public_key_bytes)
+        with self._lock:
+            vk = self._entries.get(key)
+            if vk is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if vk is not None:
+            if vk._precomputed is None:
+                vk.precompute(self.width)
+            return vk
+
+        vk = VerifyingKey.from_string(key)
+        with self._lock:
+            self.misses += 1
+            if self.maxsize > 0:
+                self._entries[key] = vk
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return vk
+
+    def resize(self, maxsize):
+        """
+        Change the bound, evicting the oldest entries if needed.
+
+        Args:
+            maxsize (int): New maximum number of entries
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Get cache statistics, for sizing the cache.
+
+        Returns:
+            dict: {'size', 'maxsize', 'hits', 'misses', 'hit_rate',
+                   'precomputed' (entries with a table), 'table_bytes'
+                   (total), 'bytes_per_key' (average per precomputed entry)}
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            lookups = self.hits + self.misses
+            stats = {
+                'size': len(entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+        sizes = [vk.precomputed_size() for vk in entries if vk._precomputed is not None]
+        stats['precomputed'] = len(sizes)
+        stats['table_bytes'] = sum(sizes)
+        stats['bytes_per_key'] = sum(sizes) // len(sizes) if sizes else 0
+        return stats
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide cache used by the ecdsaRR EC backend (KeyPair.verify,
+# txnUtils.verifyTxnSignature)
+verifying_key_cache = VerifyingKeyCache()
+
+
+def verify_batch(items, sigdecode=sigdecode_string):
+    """
+    Verify many ECDSA signatures, sharing work across the batch.
+
+    Shared work:
+        - All s^(-1) mod n come from ONE batch_mod_inverse call
+        - u1 × G uses the fixed-base table (built once if missing)
+        - Odd multiples are precomputed once per distinct public key and
+          normalized to affine with ONE shared field inversion
+        - Each R is checked in Jacobian form, so no per-signature inversion
+
+    ECDSA signatures carry only x(R), not R itself, so the signatures
+    cannot be folded into one random linear combination (as Schnorr
+    batch verification does). Each signature still costs one
+    interleaved multiplication u2 × Q (GLV-split when enabled).
+
+    Args:
+        items: List of (public_key, digest, signature) tuples. public_key
+               is a VerifyingKey or bytes accepted by VerifyingKey.from_string
+        sigdecode: Signature decoder (sigdecode_string or sigdecode_der)
+
+    Returns:
+        List of indices of invalid items (empty list = all valid)
+    """
+    curve = Secp256k1
+    n, p = curve.n, curve.field_modulus
+    width = curve.WNAF_WIDTH
+    failures = []
+
+    # Pass 1: decode everything, collect s values to invert together
+    pending = []
+    for index, (public_key, digest, signature) in enumerate(items):
+        try:
+            if not isinstance(public_key, VerifyingKey):
+                public_key = VerifyingKey.from_string(public_key)
+            r, s = sigdecode(signature, n)
+        except (ValueError, BadSignatureError):
+            failures.append(index)
+            continue
+        if not (1 <= r < n and 1 <= s < n):
+            failures.append(index)
+            continue
+        pending.append((index, public_key, _digest_to_int(digest), r, s))
+
+    s_inverses = batch_mod_inverse([item[4] for item in pending], n)
+    table = curve.generator_table()
+
+    # Odd multiples once per distinct key, all normalized to affine with
+    # one shared inversion so the main loop uses mixed additions
+    keys = {}
+    for _, public_key, _, _, _ in pending:
+        Q = public_key.public_point
+        if (Q.x, Q.y) not in keys:
+            keys[(Q.x, Q.y)] = curve.odd_multiples(Q, width)
+    flat = curve.normalize_many([J for multiples in keys.values() for J in multiples])
+    row = 1 << (width - 2)
+    multiples_by_key = {key: flat[i * row:(i + 1) * row] for i, key in enumerate(keys)}
+
+    # Pass 2: R = u1 × G + u2 × Q, compare x(R) with r without inverting Z
+    for (index, public_key, z, r, _), w in zip(pending, s_inverses):
+        Q = public_key.public_point
+        multiples = multiples_by_key[(Q.x, Q.y)]
+
+        u1 = (z * w) % n
+        u2 = (r * w) % n
+        if curve.USE_GLV:
+            terms = curve.glv_terms(u2, multiples)
+        else:
+            terms = [(u2, multiples)]
+        X, _, Z = table.multiply_jacobian(u1, curve.interleaved_wnaf(terms, width))
+
+        zz = (Z * Z) % p
+        if Z == 0 or not (X == (r * zz) % p or (r + n < p and X == ((r + n) * zz) % p)):
+            failures.append(index)
+
+    failures.sort()
+    return failures
 
 
 # Curve constant for compatibility with ecdsa library
@@ -341,6 +2085,243 @@ class SECP256k1:
     pass
 
 
+def _benchmark_scalars(count):
+    """Deterministic full-size (256-bit) scalars for benchmarks."""
+    return [int.from_bytes(hashlib.sha256(i.to_bytes(4, 'big')).digest(), 'big') % Secp256k1.n
+            for i in range(count)]
+
+
+def benchmark_wnaf_widths(widths=range(2, 9), iterations=100):
+    """
+    Time variable-base wNAF (plain and GLV) for several window widths.
+
+    Use this to choose Secp256k1.WNAF_WIDTH for the current machine.
+
+    Args:
+        widths: Window widths to try
+        iterations: Multiplications per width
+
+    Returns:
+        Dict mapping width -> microseconds per multiplication, plus
+        ('glv', width) for the GLV variant and 'binary' for the
+        double-and-add baseline
+    """
+    P = Secp256k1.point_multiply(0x5EED)
+    scalars = _benchmark_scalars(iterations)
+
+    start = time.perf_counter()
+    expected = [Secp256k1.double_and_add(k, P) for k in scalars]
+    timings = {'binary': (time.perf_counter() - start) / iterations * 1e6}
+
+    for width in widths:
+        start = time.perf_counter()
+        results = [Secp256k1.wnaf_multiply(k, P, width) for k in scalars]
+        timings[width] = (time.perf_counter() - start) / iterations * 1e6
+        if results != expected:
+            raise RuntimeError(f"wNAF width {width} disagrees with double-and-add")
+
+        start = time.perf_counter()
+        results = [Secp256k1.glv_multiply(k, P, width) for k in scalars]
+        timings[('glv', width)] = (time.perf_counter() - start) / iterations * 1e6
+        if results != expected:
+            raise RuntimeError(f"GLV width {width} disagrees with double-and-add")
+
+    return timings
+
+
+def benchmark_multi_scalar(sizes=(1, 4, 16, 64, 256, 1024)):
+    """
+    Time SUM(k_i × P_i) as the number of terms grows.
+
+    Compares repeated point_multiply (one product per term, then summed),
+    one interleaved wNAF pass (Strauss) and Pippenger's bucket method.
+    Use it to place Secp256k1.PIPPENGER_MIN_TERMS on the crossover.
+
+    Args:
+        sizes: Numbers of terms to try
+
+    Returns:
+        Dict mapping size -> {'repeated': us/term, 'strauss': us/term,
+        'pippenger': us/term}
+    """
+    curve = Secp256k1
+    results = {}
+    for size in sizes:
+        scalars = _benchmark_scalars(2 * size)
+        points = [curve.point_multiply(k) for k in scalars[:size]]
+        scalars = scalars[size:]
+
+        start = time.perf_counter()
+        R = curve.JACOBIAN_INFINITY
+        for k, P in zip(scalars, points):
+            R = curve.jacobian_add(R, curve.to_jacobian(curve.point_multiply(k, P)))
+        expected = curve.from_jacobian(R)
+        repeated = time.perf_counter() - start
+
+        min_terms = curve.PIPPENGER_MIN_TERMS
+        curve.PIPPENGER_MIN_TERMS = size + 1
+        try:
+            start = time.perf_counter()
+            strauss_result = curve.multi_scalar_multiply(scalars, points)
+            strauss = time.perf_counter() - start
+        finally:
+            curve.PIPPENGER_MIN_TERMS = min_terms
+
+        start = time.perf_counter()
+        pippenger_result = curve.from_jacobian(curve.pippenger_jacobian(scalars, points))
+        pippenger = time.perf_counter() - start
+
+        if not (strauss_result == pippenger_result == expected):
+            raise RuntimeError(f"Multi-scalar results disagree for {size} terms")
+
+        results[size] = {
+            'repeated': repeated / size * 1e6,
+            'strauss': strauss / size * 1e6,
+            'pippenger': pippenger / size * 1e6,
+        }
+    return results
+
+
+def benchmark_field_reduction(iterations=1000):
+    """
+    Time field reduction strategies (microseconds per operation).
+
+    Measures:
+        ('reduce', name):  one reduction of a 512-bit product
+        ('double', name):  one Jacobian point doubling with that reduction
+        'eager_sum' / 'lazy_sum':  a*b + c*d reduced per product / once
+        'eager_triple' / 'lazy_triple':  a*b*c reduced after each / once
+
+    Args:
+        iterations: Operations per measurement
+
+    Returns:
+        Dict of timings in microseconds
+    """
+    field = Secp256k1Field
+    values = [k % field.P for k in _benchmark_scalars(4 * iterations)]
+    quads = [tuple(values[i:i + 4]) for i in range(0, len(values), 4)]
+    products = [a * b for a, b, _, _ in quads]
+    timings = {}
+
+    def measure(function, items):
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        return (time.perf_counter() - start) / len(items) * 1e6
+
+    for name, reduce in (('generic', field.reduce_generic), ('special', field.reduce_special)):
+        timings[('reduce', name)] = measure(reduce, products)
+
+    p = field.P
+    timings['eager_sum'] = measure(lambda q: (q[0] * q[1] % p + q[2] * q[3] % p) % p, quads)
+    timings['lazy_sum'] = measure(lambda q: (q[0] * q[1] + q[2] * q[3]) % p, quads)
+    timings['eager_triple'] = measure(lambda q: (q[0] * q[1] % p) * q[2] % p, quads)
+    timings['lazy_triple'] = measure(lambda q: q[0] * q[1] * q[2] % p, quads)
+
+    # Point doublings through the real formulas with each modulus
+    active = Secp256k1.field_reduction()
+    J = Secp256k1.to_jacobian(Secp256k1.G)
+    try:
+        for name in Secp256k1.FIELD_REDUCTIONS:
+            Secp256k1.set_field_reduction(name)
+            start = time.perf_counter()
+            R = J
+            for _ in range(iterations):
+                R = Secp256k1.jacobian_double(R)
+            timings[('double', name)] = (time.perf_counter() - start) / iterations * 1e6
+    finally:
+        Secp256k1.set_field_reduction(active)
+    return timings
+
+
+def benchmark_allocations(iterations=20):
+    """
+    Measure time and tracemalloc memory per point_multiply.
+
+    Args:
+        iterations: Multiplications per case
+
+    Returns:
+        Dict mapping case ('fixed-base', 'variable-base', 'double-and-add')
+        -> {'us': microseconds per call (best of 3 runs),
+            'peak_bytes': average tracemalloc peak during one call,
+            'retained_bytes': average memory still held after the call}
+    """
+    import tracemalloc
+
+    curve = Secp256k1
+    P = curve.point_multiply(0x5EED)
+    scalars = _benchmark_scalars(iterations)
+    curve.generator_table()
+    cases = {
+        'fixed-base': lambda k: curve.point_multiply(k),
+        'variable-base': lambda k: curve.point_multiply(k, P),
+        'double-and-add': lambda k: curve.double_and_add(k, P),
+    }
+
+    results = {}
+    for name, multiply in cases.items():
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            for k in scalars:
+                multiply(k)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        peak_total = retained_total = 0
+        for k in scalars:
+            tracemalloc.start()
+            result = multiply(k)
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del result
+            peak_total += peak
+            retained_total += retained
+
+        results[name] = {
+            'us': best / iterations * 1e6,
+            'peak_bytes': peak_total // iterations,
+            'retained_bytes': retained_total // iterations,
+        }
+    return results
+
+
+def benchmark_verifying_key_cache(widths=range(4, 9), iterations=50):
+    """
+    Compare verify_digest with and without a per-key window table.
+
+    Args:
+        widths: Table widths to try
+        iterations: Verifications per case
+
+    Returns:
+        Dict mapping 'plain' or a width -> {'us': microseconds per verify
+        (best of 3 runs), 'bytes': table size per key (0 for 'plain')}
+    """
+    sk = SigningKey.from_string((0x5EED).to_bytes(32, byteorder='big'))
+    digests = [hashlib.sha256(i.to_bytes(4, 'big')).digest() for i in range(iterations)]
+    signatures = sk.sign_many(digests)
+    Secp256k1.generator_table()
+
+    cases = [('plain', VerifyingKey(sk.get_verifying_key().public_point))]
+    for width in widths:
+        cases.append((width, VerifyingKey(sk.get_verifying_key().public_point).precompute(width)))
+
+    results = {}
+    for name, vk in cases:
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            for digest, signature in zip(digests, signatures):
+                vk.verify_digest(signature, digest)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = {'us': best / iterations * 1e6, 'bytes': vk.precomputed_size()}
+    return results
+
+
 def test_implementation():
     """
     Test the custom ECDSA implementation.
@@ -398,6 +2379,257 @@ def test_implementation():
     except ImportError:
         print("Standard ecdsa library not available for comparison")
 
+    # Test 6: Fixed-base table vs generic double-and-add
+    print("\nTest 6: Benchmark k*G (fixed-base table vs double-and-add)")
+    iterations = 200
+    scalars = _benchmark_scalars(iterations)
+
+    start = time.perf_counter()
+    table = GeneratorTable.build()
+    build_time = time.perf_counter() - start
+    Secp256k1.set_generator_table(table)
+
+    start = time.perf_counter()
+    expected = [Secp256k1.double_and_add(k, Secp256k1.G) for k in scalars]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [Secp256k1.point_multiply(k) for k in scalars]
+    table_time = time.perf_counter() - start
+
+    print(f"Table build (w={table.width}, {table.size} points): {build_time * 1000:.1f} ms")
+    print(f"Double-and-add: {loop_time / iterations * 1e6:8.1f} us/op")
+    print(f"Fixed-base:     {table_time / iterations * 1e6:8.1f} us/op "
+          f"({loop_time / table_time:.1f}x)")
+    print(f"Break-even after ~{build_time / max(loop_time - table_time, 1e-9) * iterations:.0f} multiplications")
+    if results == expected:
+        print("[OK] Fixed-base results match double-and-add")
+    else:
+        print("[FAIL] Fixed-base results differ from double-and-add")
+
+    # Test 7: wNAF window widths for arbitrary points
+    print("\nTest 7: Benchmark k*P (wNAF window widths vs double-and-add)")
+    timings = benchmark_wnaf_widths(iterations=50)
+    baseline = timings.pop('binary')
+    print(f"Double-and-add: {baseline:8.1f} us/op")
+    for width, us in timings.items():
+        label = f"GLV  w={width[1]}" if isinstance(width, tuple) else f"wNAF w={width}"
+        print(f"{label}:      {us:8.1f} us/op ({baseline / us:.2f}x)")
+    best = min(timings, key=timings.get)
+    print(f"Best: {best} (current default: w={Secp256k1.WNAF_WIDTH}, "
+          f"GLV={Secp256k1.USE_GLV})")
+
+    # Test 8: GLV cross-check against the standard ecdsa library
+    print("\nTest 8: GLV k*P vs standard ecdsa library")
+    try:
+        import ecdsa as standard_ecdsa
+
+        generator = standard_ecdsa.SECP256k1.generator
+        base_scalar = 0xA2D43EFAC7E99B7E3CF4C07EBFEBB3C349D8F2B5B0E1062D9CEF93C170D22D4F
+        P = Secp256k1.point_multiply(base_scalar)
+        P_standard = generator * base_scalar
+        mismatches = 0
+        for k in scalars[:20]:
+            R = Secp256k1.glv_multiply(k, P)
+            R_standard = P_standard * k
+            if (R.x, R.y) != (R_standard.x(), R_standard.y()):
+                mismatches += 1
+        if mismatches == 0:
+            print("[OK] GLV results match the standard ecdsa library")
+        else:
+            print(f"[FAIL] {mismatches} GLV results differ from the standard ecdsa library")
+    except ImportError:
+        print("Standard ecdsa library not available for comparison")
+
+    # Test 9: Native verification vs standard ecdsa library
+    print("\nTest 9: verify_digest (Shamir/Strauss) vs standard ecdsa library")
+    try:
+        import ecdsa as standard_ecdsa
+
+        sk_standard = standard_ecdsa.SigningKey.from_string(
+            private_key_bytes, curve=standard_ecdsa.SECP256k1)
+        vk_standard = sk_standard.get_verifying_key()
+        digests = [hashlib.sha256(bytes([i])).digest() for i in range(20)]
+        signatures = [sk_standard.sign_digest(d) for d in digests]
+
+        start = time.perf_counter()
+        for d, sig in zip(digests, signatures):
+            vk_standard.verify_digest(sig, d)
+        standard_time = time.perf_counter() - start
+
+        timings = {}
+        for label, table in (("no G table", None), ("with G table", Secp256k1.generator_table())):
+            Secp256k1.set_generator_table(table)
+            start = time.perf_counter()
+            for d, sig in zip(digests, signatures):
+                vk.verify_digest(sig, d)
+            timings[label] = time.perf_counter() - start
+
+        count = len(digests)
+        print(f"ecdsa library:         {standard_time / count * 1e6:8.1f} us/verify")
+        for label, elapsed in timings.items():
+            print(f"ecdsaRR ({label}): {elapsed / count * 1e6:8.1f} us/verify")
+
+        try:
+            vk.verify_digest(signatures[0], digests[1])
+            print("[FAIL] Wrong digest was accepted")
+        except BadSignatureError:
+            print("[OK] All signatures verified, wrong digest rejected")
+    except ImportError:
+        print("Standard ecdsa library not available for comparison")
+
+    # Test 10: Batch verification
+    print("\nTest 10: verify_batch vs one verify_digest per signature")
+    try:
+        import ecdsa as standard_ecdsa
+
+        batch = []
+        for i in range(40):
+            key = hashlib.sha256(b'batch key %d' % (i % 8)).digest()
+            sk_standard = standard_ecdsa.SigningKey.from_string(key, curve=standard_ecdsa.SECP256k1)
+            digest = hashlib.sha256(b'batch message %d' % i).digest()
+            batch.append((sk_standard.get_verifying_key().to_string(), digest,
+                          sk_standard.sign_digest(digest)))
+        # Corrupt two entries
+        batch[5] = (batch[5][0], hashlib.sha256(b'tampered').digest(), batch[5][2])
+        batch[17] = (batch[6][0], batch[17][1], batch[17][2])
+
+        start = time.perf_counter()
+        single_failures = []
+        for i, (pub, digest, sig) in enumerate(batch):
+            try:
+                VerifyingKey.from_string(pub).verify_digest(sig, digest)
+            except BadSignatureError:
+                single_failures.append(i)
+        single_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_failures = verify_batch(batch)
+        batch_time = time.perf_counter() - start
+
+        print(f"One at a time: {single_time / len(batch) * 1e6:8.1f} us/signature")
+        print(f"verify_batch:  {batch_time / len(batch) * 1e6:8.1f} us/signature "
+              f"({single_time / batch_time:.2f}x)")
+        if batch_failures == single_failures == [5, 17]:
+            print(f"[OK] Failing indices reported: {batch_failures}")
+        else:
+            print(f"[FAIL] batch={batch_failures} single={single_failures} expected=[5, 17]")
+    except ImportError:
+        print("Standard ecdsa library not available for comparison")
+
+    # Test 11: Batch public-key derivation
+    print("\nTest 11: batch_public_keys vs get_verifying_key per key")
+    keys = [k.to_bytes(32, 'big') for k in _benchmark_scalars(200)]
+
+    start = time.perf_counter()
+    single = [SigningKey.from_string(k).get_verifying_key().to_string() for k in keys]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = [vk_b.to_string() for vk_b in batch_public_keys(keys)]
+    batch_time = time.perf_counter() - start
+
+    print(f"One at a time:     {single_time / len(keys) * 1e6:8.1f} us/key")
+    print(f"batch_public_keys: {batch_time / len(keys) * 1e6:8.1f} us/key "
+          f"({single_time / batch_time:.2f}x)")
+    if batched == single:
+        print("[OK] Batch public keys match")
+    else:
+        print("[FAIL] Batch public keys differ")
+
+    # Test 12: Multi-scalar multiplication
+    print("\nTest 12: SUM(k_i x P_i) - repeated point_multiply vs Strauss vs Pippenger")
+    print(f"{'terms':>6} {'repeated':>10} {'strauss':>10} {'pippenger':>10}  (us/term)")
+    try:
+        for size, row in benchmark_multi_scalar((1, 4, 16, 64, 256)).items():
+            print(f"{size:>6} {row['repeated']:10.1f} {row['strauss']:10.1f} "
+                  f"{row['pippenger']:10.1f}")
+    except RuntimeError as e:
+        print(f"[FAIL] {e}")
+
+    scalars = _benchmark_scalars(80)
+    points = [Secp256k1.point_multiply(k) for k in scalars[:40]]
+    scalars = scalars[40:]
+    naive = Secp256k1.JACOBIAN_INFINITY
+    for k, P in zip(scalars, points):
+        naive = Secp256k1.jacobian_add(naive, Secp256k1.to_jacobian(Secp256k1.point_multiply(k, P)))
+    naive = Secp256k1.from_jacobian(naive)
+    min_terms = Secp256k1.PIPPENGER_MIN_TERMS
+    Secp256k1.PIPPENGER_MIN_TERMS = len(points) + 1
+    try:
+        strauss = Secp256k1.multi_scalar_multiply(scalars, points)
+    finally:
+        Secp256k1.PIPPENGER_MIN_TERMS = min_terms
+    pippenger = Secp256k1.from_jacobian(Secp256k1.pippenger_jacobian(scalars, points))
+    if naive == strauss == pippenger:
+        print("[OK] All methods agree")
+    else:
+        print(f"[FAIL] Methods disagree: strauss {'ok' if strauss == naive else 'differs'}, "
+              f"pippenger {'ok' if pippenger == naive else 'differs'}")
+
+    # Test 13: Field reduction
+    print("\nTest 13: Field reduction - built-in % vs shift-and-fold (p = 2^256 - 2^32 - 977)")
+    timings = benchmark_field_reduction()
+    for name in Secp256k1.FIELD_REDUCTIONS:
+        print(f"{name:>8}: reduce {timings[('reduce', name)]:.3f} us, "
+              f"point double {timings[('double', name)]:.2f} us")
+    print(f"a*b + c*d: eager {timings['eager_sum']:.3f} us, lazy {timings['lazy_sum']:.3f} us")
+    print(f"Active reduction: {Secp256k1.field_reduction()} "
+          f"(Secp256k1.select_field_reduction() picks the faster)")
+
+    # Test 14: Memory per multiplication
+    print("\nTest 14: tracemalloc per point_multiply")
+    for name, row in benchmark_allocations().items():
+        print(f"{name:>15}: {row['us']:8.1f} us  peak {row['peak_bytes']:6d} B  "
+              f"retained {row['retained_bytes']:4d} B")
+
+    # Test 15: Deterministic signing
+    print("\nTest 15: RFC 6979 signing - sign_digest vs sign_many vs ecdsa library")
+    signer = SigningKey.from_string(hashlib.sha256(b'signing key').digest())
+    digests = [hashlib.sha256(b'payout %d' % i).digest() for i in range(50)]
+
+    start = time.perf_counter()
+    single = [signer.sign_digest(d) for d in digests]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = signer.sign_many(digests)
+    batch_time = time.perf_counter() - start
+
+    print(f"sign_digest: {single_time / len(digests) * 1e6:8.1f} us/signature")
+    print(f"sign_many:   {batch_time / len(digests) * 1e6:8.1f} us/signature "
+          f"({single_time / batch_time:.2f}x)")
+    verifier = signer.get_verifying_key()
+    if single == batched and all(verifier.verify_digest(sig, d) for sig, d in zip(batched, digests)):
+        print("[OK] Identical deterministic signatures, all verify")
+    else:
+        print("[FAIL] sign_many differs from sign_digest")
+    try:
+        import ecdsa as standard_ecdsa
+        import ecdsa.util
+
+        sk_standard = standard_ecdsa.SigningKey.from_string(signer.to_string(), curve=standard_ecdsa.SECP256k1)
+        r, s = standard_ecdsa.util.sigdecode_string(
+            sk_standard.sign_digest_deterministic(digests[0], hashfunc=hashlib.sha256), Secp256k1.n)
+        expected = sigencode_string(r, min(s, Secp256k1.n - s), Secp256k1.n)
+        print("[OK] Matches ecdsa library RFC 6979 (low-S)" if expected == single[0]
+              else "[FAIL] Differs from ecdsa library RFC 6979")
+    except ImportError:
+        print("Standard ecdsa library not available for comparison")
+
+    # Test 16: Per-key precomputation
+    print("\nTest 16: Verifying key cache - per-key window tables")
+    for name, result in benchmark_verifying_key_cache(iterations=20).items():
+        label = 'plain' if name == 'plain' else f'width {name}'
+        print(f"{label:>8}: {result['us']:8.1f} us/verify, {result['bytes']:6d} bytes/key")
+    cache = VerifyingKeyCache()
+    encoded = verifier.to_string()
+    for sig, d in zip(batched, digests):
+        cache.get(encoded).verify_digest(sig, d)
+    stats = cache.stats()
+    print(f"{len(digests)} verifies of one key: hit rate {stats['hit_rate']:.0%}, "
+          f"{stats['bytes_per_key']} bytes per cached key")
+
     print("\n" + "=" * 60)
     print("Testing complete!")
 
@@ -0,0 +1,354 @@
+"""
+RIPEMD-160 / HASH160 backend selection
+
+One interface for the address hash, whatever the Python build provides:
+    - ripemd160(data)   -> 20-byte RIPEMD-160 digest
+    - hash160(data)     -> 20-byte RIPEMD-160(SHA-256(data))
+    - new(data=b'')     -> hashlib-style RIPEMD-160 object
+
+Backends:
+    - 'openssl'      - hashlib.new('ripemd160'); missing on OpenSSL 3
+                       builds without the legacy provider
+    - 'pycryptodome' - Crypto.Hash.RIPEMD160 C extension (optional; used if installed)
+    - 'pure'         - cryptography/ripemd160.py (always available)
+
+At import every backend is probed once: it must reproduce the reference
+test vectors, and it is timed on a 32-byte message (the SHA-256 digest
+that HASH160 hashes). The fastest working backend is cached, unless the
+environment variable HASH160_BACKEND names one (an unknown or broken name
+only warns and keeps the fastest).
+
+Usage:
+    from cryptography import hashBackend
+    h160 = hashBackend.hash160(public_key_bytes)
+    hashBackend.active_backend()
+"""
+
+import hashlib
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from cryptography.ripemd160 import RIPEMD160Hash
+
+
+# Environment variable that forces a backend by name
+ENV_BACKEND = 'HASH160_BACKEND'
+
+# Reference vectors (message, RIPEMD-160 digest) every backend must reproduce
+TEST_VECTORS = (
+    (b'', '9c1185a5c5e9fc54612808977ee8f548b2258d31'),
+    (b'abc', '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc'),
+    (b'a' * 64, '9dfb7d374ad924f3f88de96291c33e9abed53e32'),
+)
+
+# Probe message size (a SHA-256 digest) and time spent timing each backend
+PROBE_SIZE = 32
+PROBE_TIME = 0.001
+
+
+# ============================================================================
+# BACKEND ADAPTERS
+# ============================================================================
+
+class HashBackend:
+    """
+    Base class for RIPEMD-160 backends.
+
+    Subclasses set name and override new() (and available() if the
+    backend depends on an optional module).
+    """
+
+    name = None
+
+    @classmethod
+    def available(cls):
+        """Check whether the backend can be used in this process."""
+        return True
+
+    def new(self, data=b''):
+        """Get a hashlib-style RIPEMD-160 object."""
+        raise NotImplementedError
+
+    def ripemd160(self, data):
+        """Get the 20-byte RIPEMD-160 digest of data."""
+        return self.new(data).digest()
+
+    def __repr__(self):
+        return f"<HashBackend {self.name}>"
+
+
+class OpenSSLBackend(HashBackend):
+    """Adapter for hashlib's OpenSSL ripemd160."""
+
+    name = 'openssl'
+
+    @classmethod
+    def available(cls):
+        try:
+            hashlib.new('ripemd160')
+        except ValueError:
+            return False
+        return True
+
+    def new(self, data=b''):
+        return hashlib.new('ripemd160', data)
+
+    def ripemd160(self, data):
+        return hashlib.new('ripemd160', data).digest()
+
+
+class PycryptodomeBackend(HashBackend):
+    """Adapter for the pycryptodome C extension, if installed."""
+
+    name = 'pycryptodome'
+
+    def __init__(self):
+        from Crypto.Hash import RIPEMD160
+        self._RIPEMD160 = RIPEMD160
+
+    @classmethod
+    def available(cls):
+        try:
+            from Crypto.Hash import RIPEMD160  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def new(self, data=b''):
+        return self._RIPEMD160.new(data)
+
+
+class PureBackend(HashBackend):
+    """Adapter for the pure-Python implementation in ripemd160.py."""
+
+    name = 'pure'
+
+    def new(self, data=b''):
+        return RIPEMD160Hash(data)
+
+
+# Registered adapters, in preference order when timings tie
+BACKENDS = [OpenSSLBackend, PycryptodomeBackend, PureBackend]
+
+
+# ============================================================================
+# PROBE AND SELECTION
+# ============================================================================
+
+_backends = {}          # name -> instance, for every backend that passed the probe
+_probe = {}             # name -> {'hashes_per_sec', 'mb_per_sec'}
+_active = None          # selected HashBackend
+_forced = False         # True if HASH160_BACKEND selected _active
+
+
+def _passes_vectors(backend):
+    """Check a backend against TEST_VECTORS, one-shot and incrementally."""
+    try:
+        for message, expected in TEST_VECTORS:
+            if backend.ripemd160(message).hex() != expected:
+                return False
+            h = backend.new()
+            h.update(message[:1])
+            h.update(message[1:])
+            if h.hexdigest() != expected:
+                return False
+    except Exception:
+        return False
+    return True
+
+
+def measure(backend, size=PROBE_SIZE, min_time=PROBE_TIME):
+    """
+    Time a backend's one-shot ripemd160() on a message of the given size.
+
+    Args:
+        backend: HashBackend instance
+        size: Message size in bytes
+        min_time: Seconds to keep hashing
+
+    Returns:
+        dict: {'hashes_per_sec', 'mb_per_sec'}
+    """
+    message = bytes(size)
+    hash_fn = backend.ripemd160
+    hash_fn(message)
+    calls, start = 0, time.perf_counter()
+    while True:
+        hash_fn(message)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+    rate = calls / elapsed
+    return {'hashes_per_sec': rate, 'mb_per_sec': rate * size / 1e6}
+
+
+def probe(min_time=PROBE_TIME):
+    """
+    Probe every backend and select one (runs once at import).
+
+    Backends that cannot be loaded or fail the test vectors are skipped.
+    The rest are timed and the fastest is selected, unless HASH160_BACKEND
+    names one. If it names a backend that is not working, a warning is
+    issued and the fastest is selected instead.
+
+    Args:
+        min_time: Seconds to spend timing each backend
+
+    Returns:
+        dict: Backend name -> {'hashes_per_sec', 'mb_per_sec'}
+    """
+    global _backends, _probe, _active, _forced
+    backends, results = {}, {}
+    for backend_class in BACKENDS:
+        if not backend_class.available():
+            continue
+        backend = backend_class()
+        if _passes_vectors(backend):
+            backends[backend.name] = backend
+            results[backend.name] = measure(backend, min_time=min_time)
+
+    forced = os.environ.get(ENV_BACKEND)
+    if forced and forced not in backends:
+        warnings.warn(f"{ENV_BACKEND}={forced!r} is not a working RIPEMD-160 backend "
+                      f"(working: {', '.join(backends)}); using the fastest", RuntimeWarning)
+        forced = None
+    if forced:
+        active = backends[forced]
+    else:
+        active = backends[max(results, key=lambda name: results[name]['hashes_per_sec'])]
+
+    _backends, _probe, _active, _forced = backends, results, active, bool(forced)
+    return results
+
+
+def available_backends():
+    """
+    Get the names of the backends that passed the probe.
+
+    Returns:
+        list: Backend names, in BACKENDS order
+    """
+    return list(_backends)
+
+
+def active_backend():
+    """
+    Get the name of the selected backend.
+
+    Returns:
+        str: Backend name
+    """
+    return _active.name
+
+
+def get_backend(name):
+    """
+    Get a specific working backend by name (e.g. to cross-check two of them).
+
+    Args:
+        name (str): Backend name
+
+    Returns:
+        HashBackend instance
+
+    Raises:
+        ValueError: If the backend did not pass the probe
+    """
+    try:
+        return _backends[name]
+    except KeyError:
+        raise ValueError(f"{name!r} is not a working RIPEMD-160 backend "
+                         f"(working: {', '.join(_backends)})") from None
+
+
+def set_backend(name):
+    """
+    Select a backend by name.
+
+    Args:
+        name (str): Backend name, or None to re-run the probe
+
+    Raises:
+        ValueError: If the backend did not pass the probe
+    """
+    global _active
+    if name is None:
+        probe()
+        return
+    _active = get_backend(name)
+
+
+def backend_report():
+    """
+    Get the active backend and the throughput measured by the probe.
+
+    Returns:
+        dict: {'active': name, 'forced': bool, 'backends': {name:
+               {'hashes_per_sec', 'mb_per_sec'}}} for 32-byte messages
+    """
+    return {
+        'active': _active.name,
+        'forced': _forced,
+        'backends': {name: dict(result) for name, result in _probe.items()},
+    }
+
+
+# ============================================================================
+# OPERATIONS
+# ============================================================================
+
+def new(data=b''):
+    """
+    Get a hashlib-style RIPEMD-160 object from the active backend.
+
+    Args:
+        data (bytes): Initial data
+
+    Returns:
+        Object with update(), copy(), digest() and hexdigest()
+    """
+    return _active.new(data)
+
+
+def ripemd160(data):
+    """
+    Compute RIPEMD-160 with the active backend.
+
+    Args:
+        data (bytes): Message
+
+    Returns:
+        bytes: 20-byte digest
+    """
+    return _active.ripemd160(data)
+
+
+def hash160(data):
+    """
+    Compute HASH160 = RIPEMD-160(SHA-256(data)), as used for addresses.
+
+    Args:
+        data (bytes): Message (usually a serialized public key)
+
+    Returns:
+        bytes: 20-byte hash
+    """
+    return _active.ripemd160(hashlib.sha256(data).digest())
+
+
+probe()
+
+
+if __name__ == "__main__":
+    report = backend_report()
+    print("RIPEMD-160 backends (32-byte messages):")
+    for name, result in sorted(report['backends'].items(),
+                               key=lambda item: -item[1]['hashes_per_sec']):
+        print(f"  {name:>12}: {result['hashes_per_sec']:12,.0f} hashes/s "
+              f"{result['mb_per_sec']:8.2f} MB/s")
+    print(f"Active backend: {report['active']}" + (" (forced)" if report['forced'] else ""))
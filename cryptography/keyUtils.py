@@ -6,9 +6,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import ecdsa
 import ecdsa.der
 import ecdsa.util
-import hashlib
 
-from cryptography import base58Utils
+from cryptography import base58Utils, hashBackend
 from cryptography.keypair import KeyPair
 
 # ============================================================================
@@ -80,9 +79,7 @@ def pubKeyToAddr(s):
     Returns:
         str: Bitcoin address (Base58Check encoded)
     """
-    ripemd160 = hashlib.new('ripemd160')
-    ripemd160.update(hashlib.sha256(bytes.fromhex(s)).digest())
-    return base58Utils.base58CheckEncode(0, ripemd160.digest())
+    return base58Utils.base58CheckEncode(0, hashBackend.hash160(bytes.fromhex(s)))
 
 # ============================================================================
 # UTILITY FUNCTIONS (not part of KeyPair class)
@@ -4,9 +4,128 @@ KeyPair class for Bitcoin ECDSA key management
 Represents a Bitcoin key pair with public and private keys.
 """
 
-import hashlib
+import threading
+from collections import OrderedDict
+
 import ecdsa
-from cryptography import base58Utils
+from cryptography import base58Utils, ecBackend, hashBackend
+
+
+class PublicKeyCache:
+    """
+    Bounded LRU cache: private key hex -> public key hex.
+
+    Shared by every KeyPair in the process, so HD scans that rebuild the
+    same parent KeyPair many times derive its public key only once.
+
+    Attributes:
+        maxsize (int): Maximum number of entries (0 disables caching)
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that had to derive the key
+    """
+
+    def __init__(self, maxsize=4096):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, private_key_hex):
+        """
+        Look up a public key, counting the hit or miss.
+
+        Args:
+            private_key_hex (str): Normalized (uppercase) private key
+
+        Returns:
+            str: Public key hex, or None if not cached
+        """
+        with self._lock:
+            publickey = self._entries.get(private_key_hex)
+            if publickey is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(private_key_hex)
+            self.hits += 1
+            return publickey
+
+    def put(self, private_key_hex, publickey):
+        """
+        Store a public key, evicting the least recently used entry if full.
+
+        Args:
+            private_key_hex (str): Normalized (uppercase) private key
+            publickey (str): Public key hex
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[private_key_hex] = publickey
+            self._entries.move_to_end(private_key_hex)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def resize(self, maxsize):
+        """
+        Change the bound, evicting the oldest entries if needed.
+
+        Args:
+            maxsize (int): New maximum number of entries
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: {'size', 'maxsize', 'hits', 'misses', 'hit_rate'}
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide cache used by KeyPair
+public_key_cache = PublicKeyCache()
+
+
+def _derive_public_keys_ecdsa(private_key_hexes):
+    """Public key hexes ('04' + x + y) from the standard ecdsa library."""
+    private_keys = [bytes.fromhex(key) for key in private_key_hexes]
+    return ['04' + pub.hex() for pub in ecBackend.get_backend('ecdsa').public_keys(private_keys)]
+
+
+def _derive_public_keys_ecdsaRR(private_key_hexes):
+    """Public key hexes ('04' + x + y) from the custom ecdsaRR implementation (one batch)."""
+    private_keys = [bytes.fromhex(key) for key in private_key_hexes]
+    return ['04' + pub.hex() for pub in ecBackend.get_backend('ecdsaRR').public_keys(private_keys)]
 
 
 class KeyPair:
@@ -16,8 +135,42 @@ class KeyPair:
     Attributes:
         publickey (str): Hex-encoded public key (65 bytes uncompressed or 33 bytes compressed)
         _privatekey (str): Hex-encoded private key (32 bytes) - private attribute
+
+    Cross-check policy (class-wide, see set_cross_check_policy):
+        'always' - derive with both ecdsa and ecdsaRR and compare (default)
+        'sample' - compare on 1 in cross_check_sample_rate derivations
+        'trust'  - derive once with the selected EC backend (see ecBackend)
+    Derived public keys are kept in the process-wide public_key_cache.
     """
 
+    CROSS_CHECK_POLICIES = ('always', 'sample', 'trust')
+    cross_check_policy = 'always'
+    cross_check_sample_rate = 100
+
+    # Derivation counter for 'sample'
+    _derivations = 0
+
+    @classmethod
+    def set_cross_check_policy(cls, policy, sample_rate=None):
+        """
+        Choose how public keys are cross-checked between implementations.
+
+        Args:
+            policy (str): 'always', 'sample' or 'trust'
+            sample_rate (int): For 'sample', check 1 in sample_rate derivations
+
+        Raises:
+            ValueError: If policy or sample_rate is invalid
+        """
+        if policy not in cls.CROSS_CHECK_POLICIES:
+            raise ValueError(f"Unknown cross-check policy: {policy!r}")
+        if sample_rate is not None:
+            if sample_rate < 1:
+                raise ValueError("Sample rate must be at least 1")
+            cls.cross_check_sample_rate = sample_rate
+        cls.cross_check_policy = policy
+        cls._derivations = 0
+
     def __init__(self, private_key_hex):
         """
         Initialize KeyPair from private key.
@@ -49,44 +202,83 @@ class KeyPair:
         # Generate and store public key (public attribute)
         self.publickey = self._generate_public_key()
 
+    @classmethod
+    def public_keys(cls, private_key_hexes):
+        """
+        Generate the public keys of many private keys using ECDSA secp256k1.
+
+        Looks in the process-wide cache first. The remaining keys are
+        derived according to cross_check_policy: with both the standard
+        ecdsa library and the custom ecdsaRR implementation (verifying
+        they produce identical results), or only with the selected EC
+        backend. Each implementation derives its keys as one batch (see
+        ecBackend.public_keys; ecdsaRR shares one modular inversion).
+
+        Args:
+            private_key_hexes (list): Private keys as hex strings (validated)
+
+        Returns:
+            list: Hex-encoded uncompressed public keys, same order
+
+        Raises:
+            RuntimeError: If a cross-check finds the implementations disagree
+        """
+        private_key_hexes = [key.upper() for key in private_key_hexes]
+        publickeys = [public_key_cache.get(key) for key in private_key_hexes]
+        checked, trusted = [], []
+        for i, publickey in enumerate(publickeys):
+            if publickey is not None:
+                continue
+            policy = cls.cross_check_policy
+            if policy == 'sample':
+                # First derivation and every sample_rate-th one after it
+                check = cls._derivations % cls.cross_check_sample_rate == 0
+                cls._derivations += 1
+            else:
+                check = policy == 'always'
+            (checked if check else trusted).append(i)
+
+        if checked:
+            keys = [private_key_hexes[i] for i in checked]
+
+            # Method 1: Standard ecdsa library
+            pubkeys_standard = _derive_public_keys_ecdsa(keys)
+
+            # Method 2: Custom ecdsaRR implementation
+            pubkeys_custom = _derive_public_keys_ecdsaRR(keys)
+
+            # Verify both methods produce the same result
+            for i, pubkey_standard, pubkey_custom in zip(checked, pubkeys_standard, pubkeys_custom):
+                if pubkey_standard != pubkey_custom:
+                    raise RuntimeError(
+                        f"Public key mismatch!\n"
+                        f"  Standard ecdsa: {pubkey_standard}\n"
+                        f"  Custom ecdsaRR: {pubkey_custom}"
+                    )
+                publickeys[i] = pubkey_standard
+
+        if trusted:
+            keys = [bytes.fromhex(private_key_hexes[i]) for i in trusted]
+            for i, pub in zip(trusted, ecBackend.public_keys(keys)):
+                publickeys[i] = '04' + pub.hex()
+
+        for i in checked + trusted:
+            public_key_cache.put(private_key_hexes[i], publickeys[i])
+        return publickeys
+
     def _generate_public_key(self):
         """
         Generate public key from private key using ECDSA secp256k1.
 
-        Uses both standard ecdsa library and custom ecdsaRR implementation,
-        then verifies they produce identical results.
+        Uses the cache and cross-check policy of public_keys.
 
         Returns:
             str: Hex-encoded uncompressed public key (130 characters)
+
+        Raises:
+            RuntimeError: If a cross-check finds the implementations disagree
         """
-        # Method 1: Standard ecdsa library
-        sk_standard = ecdsa.SigningKey.from_string(
-            bytes.fromhex(self._privatekey),
-            curve=ecdsa.SECP256k1
-        )
-        vk_standard = sk_standard.get_verifying_key()
-        pubkey_standard = '04' + vk_standard.to_string().hex()
-
-        # Method 2: Custom ecdsaRR implementation
-        from cryptography import ecdsaRR
-
-        sk_custom = ecdsaRR.SigningKey.from_string(
-            bytes.fromhex(self._privatekey),
-            curve=ecdsaRR.SECP256k1
-        )
-        vk_custom = sk_custom.get_verifying_key()
-        pubkey_custom = '04' + vk_custom.to_string().hex()
-
-        # Verify both methods produce the same result
-        if pubkey_standard != pubkey_custom:
-            raise RuntimeError(
-                f"Public key mismatch!\n"
-                f"  Standard ecdsa: {pubkey_standard}\n"
-                f"  Custom ecdsaRR: {pubkey_custom}"
-            )
-
-        # Return the verified public key
-        return pubkey_standard
+        return type(self).public_keys([self._privatekey])[0]
 
     def get_private_key(self):
         """
@@ -124,13 +316,8 @@ class KeyPair:
         Returns:
             str: Bitcoin address (Base58Check encoded)
         """
-        # SHA-256 hash of public key
-        sha256_hash = hashlib.sha256(bytes.fromhex(self.publickey)).digest()
-
-        # RIPEMD-160 hash of SHA-256 hash
-        ripemd160 = hashlib.new('ripemd160')
-        ripemd160.update(sha256_hash)
-        hash160 = ripemd160.digest()
+        # RIPEMD-160 of the SHA-256 of the public key
+        hash160 = hashBackend.hash160(bytes.fromhex(self.publickey))
 
         # Base58Check encode with version 0x00 (P2PKH)
         return base58Utils.base58CheckEncode(0x00, hash160)
@@ -145,11 +332,21 @@ class KeyPair:
         Returns:
             bytes: DER-encoded signature
         """
-        sk = ecdsa.SigningKey.from_string(
-            bytes.fromhex(self._privatekey),
-            curve=ecdsa.SECP256k1
-        )
-        return sk.sign_digest(message_hash, sigencode=ecdsa.util.sigencode_der)
+        return ecBackend.sign_digest(bytes.fromhex(self._privatekey), message_hash)
+
+    def sign_many(self, message_hashes):
+        """
+        Sign many message hashes with private key (batch payouts, multi-input
+        transactions). Shares work across the batch when the EC backend
+        supports it.
+
+        Args:
+            message_hashes (list): Hashes to sign
+
+        Returns:
+            list: DER-encoded signatures, same order
+        """
+        return ecBackend.sign_many(bytes.fromhex(self._privatekey), message_hashes)
 
     def verify(self, message_hash, signature):
         """
@@ -162,14 +359,9 @@ class KeyPair:
         Returns:
             bool: True if signature is valid
         """
-        vk = ecdsa.VerifyingKey.from_string(
-            bytes.fromhex(self.publickey[2:]),  # Skip '04' prefix
-            curve=ecdsa.SECP256k1
-        )
         try:
-            vk.verify_digest(signature, message_hash, sigdecode=ecdsa.util.sigdecode_der)
-            return True
-        except (ecdsa.BadSignatureError, Exception):
+            return ecBackend.verify_digest(bytes.fromhex(self.publickey), signature, message_hash)
+        except Exception:
             return False
 
     @classmethod
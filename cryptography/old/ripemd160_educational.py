@@ -129,8 +129,8 @@ def myRipeMD160(public_key, verbose=True):
     # Step 1: SHA-256 hash of public key
     message = hashlib.sha256(bytes.fromhex(public_key)).hexdigest()
 
-    # Convert to binary
-    bmessage = bin(int(message, 16))[2:]
+    # Convert to binary (all 256 bits, keeping leading zeros)
+    bmessage = bin(int(message, 16))[2:].zfill(256)
 
     # Padding: append '1' bit and zeros
     length = len(bmessage)
@@ -146,6 +146,7 @@ def myRipeMD160(public_key, verbose=True):
     hmessage = hex(int(bmessage, 2))[2:]
     if hmessage.endswith('L'):
         hmessage = hmessage[:-1]
+    hmessage = hmessage.zfill(128)
 
     # Split message into 16 32-bit words for X[]
     X = [little_end(hmessage[i:i+8]) for i in range(0, len(hmessage)-1, 8)]
@@ -6,11 +6,93 @@ RIPEMD-160 produces a 160-bit (20-byte) hash value from arbitrary input data.
 
 Used in Bitcoin for generating addresses from public keys.
 
+The core works on bytes: compress() decodes each 64-byte block into 16
+little-endian words with one precompiled struct.Struct. It has two forms,
+compress_loop() and compress_unrolled() (straight-line code generated by
+generate_compress_source() into ripemd160_unrolled.py); a benchmark gate,
+run once the pure core has hashed COMPRESS_GATE_AFTER blocks, picks the
+unrolled one only if it is measurably faster. RIPEMD160Hash
+is the streaming, hashlib-style interface on top of it (update, copy,
+digest, hexdigest); digest(data) is the one-shot form, batch_digest()
+hashes many messages at once in NumPy lanes (NumPy optional), and
+RIPEMD160(hex) is the original hex-in/hex-out interface.
+
 Reference: https://homes.esat.kuleuven.be/~bosselae/ripemd160.html
 """
 
 import os
-import math
+import struct
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Initial hash values (160 bits = 5 x 32-bit words)
+H0 = (0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0)
+
+# Left line round constants (5 rounds of 16 steps each)
+K_LEFT = (0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E)
+
+# Right line round constants (parallel computation)
+K_RIGHT = (0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000)
+
+# Left line rotation amounts per step (80 values)
+S_LEFT = (11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8,
+          7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
+          11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5,
+          11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
+          9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6)
+
+# Right line rotation amounts per step (80 values)
+S_RIGHT = (8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6,
+           9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
+           9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5,
+           15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
+           8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11)
+
+# Left line message word selection order (80 values)
+R_LEFT = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+          7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
+          3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12,
+          1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
+          4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13)
+
+# Right line message word selection order (80 values)
+R_RIGHT = (5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12,
+           6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
+           15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13,
+           8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
+           12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11)
+
+MASK = 0xFFFFFFFF
+BLOCK_SIZE = 64
+DIGEST_SIZE = 20
+
+# Precompiled codecs: one block as 16 words, the state as 5 words,
+# the message bit length as a 64-bit word (all little-endian)
+_WORDS = struct.Struct('<16I')
+_STATE = struct.Struct('<5I')
+_LENGTH = struct.Struct('<Q')
+
+# Generated straight-line compression function (see generate_compress_source)
+UNROLLED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ripemd160_unrolled.py')
+
+# Per round: (left constant, right constant, 16 x (left word, left shift,
+# right word, right shift)), so compress_loop() does no index arithmetic
+_ROUNDS = tuple(
+    (K_LEFT[i], K_RIGHT[i],
+     tuple(zip(R_LEFT[16*i:16*(i+1)], S_LEFT[16*i:16*(i+1)],
+               R_RIGHT[16*i:16*(i+1)], S_RIGHT[16*i:16*(i+1)])))
+    for i in range(5)
+)
 
 
 # ============================================================================
@@ -35,86 +117,410 @@ def makehex(value, size=8):
     return value
 
 
-def makebin(value, size=32):
-    """Convert integer to binary string with specified size.
+def ROL(value, n):
+    """Rotate Left operation - circular left shift.
 
     Args:
-        value: Integer value to convert
-        size: Desired string length (default 32)
+        value: 32-bit integer value
+        n: Number of bits to rotate
 
     Returns:
-        Binary string padded with leading zeros
+        Rotated 32-bit value
     """
-    value = bin(value)[2:]
-    while len(value) < size:
-        value = '0' + value
-    return value
+    return (value << n) | (value >> (32 - n))
 
 
-def ROL(value, n):
-    """Rotate Left operation - circular left shift.
+# ============================================================================
+# RIPEMD-160 ALGORITHM
+# ============================================================================
+
+def compress_loop(state, block, offset=0):
+    """Run the RIPEMD-160 compression function on one 64-byte block.
+
+    The left line uses the mixing functions in order f1..f5, the right
+    line in reverse f5..f1 (see F). Both are inlined here per round, and
+    every addition is masked to 32 bits. compress_unrolled() is the same
+    function generated as straight-line code.
 
     Args:
-        value: 32-bit integer value
-        n: Number of bits to rotate
+        state: Tuple of 5 32-bit words (H0 for the first block)
+        block: bytes, bytearray or memoryview holding the block
+        offset: Byte offset of the block within block (default 0)
 
     Returns:
-        Rotated 32-bit value
+        New state as a tuple of 5 32-bit words
     """
-    return (value << n) | (value >> (32 - n))
+    h0, h1, h2, h3, h4 = state
+    X = _WORDS.unpack_from(block, offset)
+    a = aa = h0
+    b = bb = h1
+    c = cc = h2
+    d = dd = h3
+    e = ee = h4
+
+    for rnd, (kl, kr, steps) in enumerate(_ROUNDS):
+        for xl, sl, xr, sr in steps:
+            if rnd == 0:
+                fl = b ^ c ^ d
+                fr = bb ^ (cc | ~dd)
+            elif rnd == 1:
+                fl = (b & c) | (~b & d)
+                fr = (bb & dd) | (cc & ~dd)
+            elif rnd == 2:
+                fl = (b | ~c) ^ d
+                fr = (bb | ~cc) ^ dd
+            elif rnd == 3:
+                fl = (b & d) | (c & ~d)
+                fr = (bb & cc) | (~bb & dd)
+            else:
+                fl = b ^ (c | ~d)
+                fr = bb ^ cc ^ dd
 
+            # LEFT LINE
+            t = (a + fl + X[xl] + kl) & MASK
+            t = (((t << sl) | (t >> (32 - sl))) + e) & MASK
+            a, e, d, c, b = e, d, ((c << 10) | (c >> 22)) & MASK, b, t
+
+            # RIGHT LINE
+            t = (aa + fr + X[xr] + kr) & MASK
+            t = (((t << sr) | (t >> (32 - sr))) + ee) & MASK
+            aa, ee, dd, cc, bb = ee, dd, ((cc << 10) | (cc >> 22)) & MASK, bb, t
+
+    # Combine left and right lines
+    return ((h1 + c + dd) & MASK,
+            (h2 + d + ee) & MASK,
+            (h3 + e + aa) & MASK,
+            (h4 + a + bb) & MASK,
+            (h0 + b + cc) & MASK)
+
+
+# Mixing functions as source templates, indexed by round: the left line
+# uses them in order, the right line in reverse
+_F_SOURCE = (
+    '({x} ^ {y} ^ {z})',
+    '(({x} & {y}) | (~{x} & {z}))',
+    '(({x} | ~{y}) ^ {z})',
+    '(({x} & {z}) | ({y} & ~{z}))',
+    '({x} ^ ({y} | ~{z}))',
+)
+
+
+def generate_compress_source():
+    """Generate the fully unrolled compression function as a Python module.
+
+    Each of the 160 steps becomes three lines with the message word, round
+    constant, rotation and mixing function inlined. Instead of shifting
+    (a, b, c, d, e) after every step, the generator renames the variables
+    (after 80 steps the names are back where they started).
+
+    Returns:
+        Source of ripemd160_unrolled.py, defining compress_unrolled(state,
+        block, offset=0) with the same contract as compress_loop()
+    """
+    lines = [
+        '"""',
+        "Unrolled RIPEMD-160 compression function.",
+        "",
+        "GENERATED by ripemd160.generate_compress_source() - do not edit by hand.",
+        "Regenerate with: python cryptography/ripemd160.py --generate",
+        '"""',
+        "",
+        "import struct",
+        "",
+        "_WORDS = struct.Struct('<16I')",
+        "",
+        "",
+        "def compress_unrolled(state, block, offset=0):",
+        '    """Straight-line RIPEMD-160 compression of one 64-byte block (see compress_loop)."""',
+        "    h0, h1, h2, h3, h4 = state",
+        "    " + ", ".join(f"x{i}" for i in range(16)) + " = _WORDS.unpack_from(block, offset)",
+        "    a = aa = h0",
+        "    b = bb = h1",
+        "    c = cc = h2",
+        "    d = dd = h3",
+        "    e = ee = h4",
+    ]
+    for line, names, constants, shifts, order, functions in (
+            ('LEFT', 'abcde', K_LEFT, S_LEFT, R_LEFT, _F_SOURCE),
+            ('RIGHT', ('aa', 'bb', 'cc', 'dd', 'ee'), K_RIGHT, S_RIGHT, R_RIGHT, _F_SOURCE[::-1])):
+        v = list(names)
+        for j in range(80):
+            if j % 16 == 0:
+                lines.append(f"    # {line} LINE, round {j // 16 + 1}")
+            a, b, c, d, e = v
+            f = functions[j // 16].format(x=b, y=c, z=d)
+            k = constants[j // 16]
+            k = f" + 0x{k:08X}" if k else ""
+            s = shifts[j]
+            lines.append(f"    {a} = ({a} + {f} + x{order[j]}{k}) & 0xFFFFFFFF")
+            lines.append(f"    {a} = ((({a} << {s}) | ({a} >> {32 - s})) + {e}) & 0xFFFFFFFF")
+            lines.append(f"    {c} = (({c} << 10) | ({c} >> 22)) & 0xFFFFFFFF")
+            v = [e, a, b, c, d]
+    lines += [
+        "    return ((h1 + c + dd) & 0xFFFFFFFF,",
+        "            (h2 + d + ee) & 0xFFFFFFFF,",
+        "            (h3 + e + aa) & 0xFFFFFFFF,",
+        "            (h4 + a + bb) & 0xFFFFFFFF,",
+        "            (h0 + b + cc) & 0xFFFFFFFF)",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_compress_module(path=UNROLLED_PATH):
+    """Write generate_compress_source() to ripemd160_unrolled.py.
+
+    Args:
+        path: Output file (default: next to this module)
+    """
+    with open(path, 'w') as f:
+        f.write(generate_compress_source())
+
+
+# Generated ahead of time; built in memory if the file is missing
+try:
+    from .ripemd160_unrolled import compress_unrolled
+except ImportError:
+    try:
+        from ripemd160_unrolled import compress_unrolled
+    except ImportError:
+        _namespace = {}
+        exec(compile(generate_compress_source(), UNROLLED_PATH, 'exec'), _namespace)
+        compress_unrolled = _namespace['compress_unrolled']
+        del _namespace
+
+
+# ============================================================================
+# COMPRESSION SELECTION
+# ============================================================================
+
+COMPRESS_VARIANTS = {
+    'loop': compress_loop,
+    'unrolled': compress_unrolled,
+}
+
+# The unrolled form must be at least this much faster to replace the loop
+COMPRESS_GATE = 0.05
+
+# Blocks compressed with compress_loop before the gate runs. Processes that
+# only touch the pure core briefly (the hashBackend probe, a few addresses)
+# never pay for the benchmark.
+COMPRESS_GATE_AFTER = 256
+
+_compress_calls = 0
 
-def little_end(string, base=16):
-    """Convert string to little-endian format.
+
+def _compress_until_gate(state, block, offset=0):
+    """compress_loop, counting blocks until the gate is due, then select_compress()."""
+    global _compress_calls
+    _compress_calls += 1
+    if _compress_calls >= COMPRESS_GATE_AFTER:
+        select_compress()
+    return compress_loop(state, block, offset)
+
+
+_compress = _compress_until_gate
+_compress_selection = None
+
+
+def select_compress(iterations=8, calls=2):
+    """Time both compression functions and keep the faster one.
+
+    compress_unrolled only replaces compress_loop if it is at least
+    COMPRESS_GATE (5%) faster, best of iterations runs. The variants are
+    timed alternately so background load hits both. Runs on its own after
+    COMPRESS_GATE_AFTER blocks, or on the first compress_selection() call.
 
     Args:
-        string: Input string (hex or binary)
-        base: 16 for hex, 2 for binary
+        iterations: Timed runs per variant (the best is kept)
+        calls: Compressions per run
 
     Returns:
-        String in little-endian byte order
+        dict: {'selected': 'loop' | 'unrolled', 'loop_us', 'unrolled_us'}
+              (microseconds per block)
     """
-    t = ''
-    if base == 2:
-        s = 8
-    if base == 16:
-        s = 2
-    for x in range(len(string) // s):
-        t = string[s*x:s*(x+1)] + t
-    return t
+    global _compress, _compress_selection
+    block = bytes(range(BLOCK_SIZE))
+    expected = compress_loop(H0, block)
+    for name, func in COMPRESS_VARIANTS.items():
+        if func(H0, block) != expected:
+            raise RuntimeError(f"RIPEMD-160 compress variant {name} gives a wrong result")
+
+    best = dict.fromkeys(COMPRESS_VARIANTS, float('inf'))
+    for _ in range(iterations):
+        for name, func in COMPRESS_VARIANTS.items():
+            start = time.perf_counter()
+            for _ in range(calls):
+                func(H0, block)
+            best[name] = min(best[name], (time.perf_counter() - start) / calls)
+    timings = {name: seconds * 1e6 for name, seconds in best.items()}
+
+    faster = timings['unrolled'] <= timings['loop'] * (1 - COMPRESS_GATE)
+    selected = 'unrolled' if faster else 'loop'
+    _compress = COMPRESS_VARIANTS[selected]
+    _compress_selection = {'selected': selected,
+                           'loop_us': timings['loop'], 'unrolled_us': timings['unrolled']}
+    return dict(_compress_selection)
+
+
+def set_compress(name):
+    """Force a compression variant ('loop' or 'unrolled').
+
+    Raises:
+        ValueError: If name is not in COMPRESS_VARIANTS
+    """
+    global _compress, _compress_selection
+    if name not in COMPRESS_VARIANTS:
+        raise ValueError(f"Unknown compress variant {name!r} "
+                         f"(choose from {', '.join(COMPRESS_VARIANTS)})")
+    _compress = COMPRESS_VARIANTS[name]
+    _compress_selection = {'selected': name}
+
+
+def compress_selection():
+    """Get the selected compression variant and the timings behind it.
+
+    Runs select_compress() first if the gate has not run yet.
+
+    Returns:
+        dict: {'selected', 'loop_us', 'unrolled_us'} (timings absent if forced)
+    """
+    if _compress_selection is None:
+        select_compress()
+    return dict(_compress_selection)
+
+
+def compress(state, block, offset=0):
+    """Compress one 64-byte block with the selected variant.
+
+    Args:
+        state: Tuple of 5 32-bit words (H0 for the first block)
+        block: bytes, bytearray or memoryview holding the block
+        offset: Byte offset of the block within block (default 0)
+
+    Returns:
+        New state as a tuple of 5 32-bit words
+    """
+    return _compress(state, block, offset)
+
+
+def padding(length):
+    """Get the padding that follows a message of the given length.
+
+    A 0x80 byte, zeros until the length is 56 mod 64, then the message
+    length in bits as a 64-bit little-endian integer.
+
+    Args:
+        length: Message length in bytes
+
+    Returns:
+        Padding bytes (9 to 72 bytes)
+    """
+    return b'\x80' + b'\x00' * ((55 - length) % BLOCK_SIZE) + _LENGTH.pack((length * 8) & 0xFFFFFFFFFFFFFFFF)
 
 
 # ============================================================================
-# RIPEMD-160 ALGORITHM
+# STREAMING INTERFACE
 # ============================================================================
 
-def F(x, y, z, round):
-    """RIPEMD-160 mixing function - varies by round number.
+class RIPEMD160Hash:
+    """Incremental RIPEMD-160 with the hashlib interface.
+
+    Only the current partial block (under 64 bytes) is buffered; whole
+    blocks are compressed straight out of the data passed to update().
+    copy() is cheap because the state is immutable, so a midstate can be
+    shared between several messages with a common prefix.
 
-    Five different boolean functions are used across 80 rounds:
-    - Rounds 0-15:   f(x,y,z) = x XOR y XOR z
-    - Rounds 16-31:  f(x,y,z) = (x AND y) OR (NOT x AND z)
-    - Rounds 32-47:  f(x,y,z) = (x OR NOT y) XOR z
-    - Rounds 48-63:  f(x,y,z) = (x AND z) OR (y AND NOT z)
-    - Rounds 64-79:  f(x,y,z) = x XOR (y OR NOT z)
+    Attributes:
+        name (str): 'ripemd160'
+        digest_size (int): 20
+        block_size (int): 64
+
+    Example:
+        >>> h = RIPEMD160Hash(b'a')
+        >>> h.update(b'bc')
+        >>> h.hexdigest()
+        '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc'
+    """
+
+    name = 'ripemd160'
+    digest_size = DIGEST_SIZE
+    block_size = BLOCK_SIZE
+
+    __slots__ = ('_state', '_buffer', '_length')
+
+    def __init__(self, data=b''):
+        self._state = H0
+        self._buffer = b''
+        self._length = 0
+        if data:
+            self.update(data)
+
+    def update(self, data):
+        """Hash more data.
+
+        Args:
+            data: bytes, bytearray or memoryview
+        """
+        view = memoryview(data).cast('B')
+        size = len(view)
+        self._length += size
+        state = self._state
+        start = 0
+        if self._buffer:
+            start = BLOCK_SIZE - len(self._buffer)
+            if size < start:
+                self._buffer += bytes(view)
+                return
+            state = _compress(state, self._buffer + bytes(view[:start]))
+        end = size - (size - start) % BLOCK_SIZE
+        for offset in range(start, end, BLOCK_SIZE):
+            state = _compress(state, view, offset)
+        self._buffer = bytes(view[end:])
+        self._state = state
+
+    def copy(self):
+        """Get an independent copy of the current hash state.
+
+        Returns:
+            RIPEMD160Hash
+        """
+        other = RIPEMD160Hash.__new__(RIPEMD160Hash)
+        other._state = self._state
+        other._buffer = self._buffer
+        other._length = self._length
+        return other
+
+    def digest(self):
+        """Get the digest of the data so far (the object can still be updated).
+
+        Returns:
+            20-byte digest
+        """
+        state = self._state
+        tail = self._buffer + padding(self._length)
+        for offset in range(0, len(tail), BLOCK_SIZE):
+            state = _compress(state, tail, offset)
+        return _STATE.pack(*state)
+
+    def hexdigest(self):
+        """Get the digest of the data so far as 40 hex characters."""
+        return self.digest().hex()
+
+
+def digest(data):
+    """Compute the RIPEMD-160 digest of raw bytes.
 
     Args:
-        x, y, z: 32-bit integer values
-        round: Current round number (0-79)
+        data: bytes, bytearray or memoryview
 
     Returns:
-        Result of mixing function
+        20-byte digest
+
+    Example:
+        >>> digest(b'abc').hex()
+        '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc'
     """
-    if round < 16:
-        return x ^ y ^ z
-    elif 16 <= round < 32:
-        return (x & y) | (~x & z)
-    elif 32 <= round < 48:
-        return (x | ~y) ^ z
-    elif 48 <= round < 64:
-        return (x & z) | (y & ~z)
-    elif 64 <= round:
-        return x ^ (y | ~z)
+    return RIPEMD160Hash(data).digest()
 
 
 def RIPEMD160(data):
@@ -130,6 +536,9 @@ def RIPEMD160(data):
     Returns:
         160-bit hash as 40-character hexadecimal string
 
+    Raises:
+        ValueError: If data is not a whole number of hex bytes
+
     Example:
         >>> RIPEMD160('')
         '9c1185a5c5e9fc54612808977ee8f548b2258d31'
@@ -137,127 +546,168 @@ def RIPEMD160(data):
         >>> RIPEMD160('61')  # Hash of 'a'
         '0bdc9d2d256b3ee9daae347be6f4dc835a467ffe'
     """
+    return digest(bytes.fromhex(data)).hex()
 
-    # RIPEMD-160 initial hash values (160 bits = 5 x 32-bit words)
-    h0 = 0x67452301
-    h1 = 0xEFCDAB89
-    h2 = 0x98BADCFE
-    h3 = 0x10325476
-    h4 = 0xC3D2E1F0
-
-    # Left line round constants (5 rounds of 16 steps each)
-    k = [0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E]
-
-    # Right line round constants (parallel computation)
-    kk = [0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000]
-
-    # Left line rotation amounts per round (80 values)
-    s = [11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8,
-         7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
-         11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5,
-         11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
-         9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6]
-
-    # Right line rotation amounts per round (80 values)
-    ss = [8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6,
-          9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
-          9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5,
-          15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
-          8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11]
-
-    # Left line message word selection order (80 values)
-    r = list(range(16)) + [7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
-                           3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12,
-                           1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
-                           4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13]
-
-    # Right line message word selection order (80 values)
-    rr = [5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12,
-          6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
-          15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13,
-          8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
-          12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11]
-
-    # ========================================================================
-    # PREPROCESSING - Padding and length encoding
-    # ========================================================================
-
-    # Convert hex data to binary
-    temp = ''
-    for x in data:
-        temp += makebin(int(x, 16), 4)
-
-    length = len(temp) % 2**64
-
-    # Append '1' bit followed by zeros until length ≡ 448 (mod 512)
-    temp += '1'
-    while len(temp) % 512 != 448:
-        temp += '0'
-
-    # Append 64-bit length in little-endian format
-    input_data = temp
-    temp = makebin(length, 64)
-    bit_length = ''
-    for x in range(len(input_data) // 32):
-        bit_length += little_end(temp[32*x:32*(x+1)], 2)
-    input_data += bit_length[32:] + bit_length[:32]
-
-    # Number of 512-bit blocks to process
-    num_blocks = len(input_data) // 512
-
-    # ========================================================================
-    # MAIN HASH COMPUTATION - Process each 512-bit block
-    # ========================================================================
-
-    for i in range(num_blocks):
-        # Initialize working variables for left and right lines
-        # (aa, bb, cc, dd, ee) are parallel to (a, b, c, d, e)
-        a = aa = h0
-        b = bb = h1
-        c = cc = h2
-        d = dd = h3
-        e = ee = h4
-
-        # Break block into 16 x 32-bit words
-        X = input_data[512*i:512*(i+1)]
-        X = [int(little_end(X[32*x:32*(x+1)], 2), 2) for x in range(16)]
-
-        # 80 rounds of hashing (split into left and right parallel lines)
-        for j in range(80):
+
+# ============================================================================
+# BATCH HASHING (NUMPY LANES)
+# ============================================================================
+
+# Smallest group of same-length messages worth vectorizing, and the most
+# lanes compressed at once (bounds the size of the temporary arrays)
+BATCH_MIN_LANES = 16
+BATCH_MAX_LANES = 1 << 16
+
+# Mixing functions on uint32 lane arrays, indexed like _F_SOURCE
+_F_LANES = (
+    lambda x, y, z: x ^ y ^ z,
+    lambda x, y, z: (x & y) | (~x & z),
+    lambda x, y, z: (x | ~y) ^ z,
+    lambda x, y, z: (x & z) | (y & ~z),
+    lambda x, y, z: x ^ (y | ~z),
+)
+
+
+def _compress_lanes(state, X):
+    """Compress one block per lane; uint32 arithmetic wraps mod 2^32.
+
+    Args:
+        state: 5 uint32 arrays of shape (lanes,)
+        X: uint32 array of shape (16, lanes), word i of every block in row i
+
+    Returns:
+        New state as 5 uint32 arrays
+    """
+    h0, h1, h2, h3, h4 = state
+    a = aa = h0
+    b = bb = h1
+    c = cc = h2
+    d = dd = h3
+    e = ee = h4
+
+    for rnd, (kl, kr, steps) in enumerate(_ROUNDS):
+        fl, fr = _F_LANES[rnd], _F_LANES[4 - rnd]
+        kl, kr = np.uint32(kl), np.uint32(kr)
+        for xl, sl, xr, sr in steps:
             # LEFT LINE
-            T = (ROL((a + F(b, c, d, j) + X[r[j]] + k[j//16]) % 2**32, s[j]) + e) % 2**32
-            c = ROL(c, 10) % 2**32
-            a = e
-            e = d
-            d = c
-            c = b
-            b = T
-
-            # RIGHT LINE (uses reversed round order: 79-j)
-            T = (ROL((aa + F(bb, cc, dd, 79-j) + X[rr[j]] + kk[j//16]) % 2**32, ss[j]) + ee) % 2**32
-            cc = ROL(cc, 10) % 2**32
-            aa = ee
-            ee = dd
-            dd = cc
-            cc = bb
-            bb = T
-
-        # Update hash values (combine left and right lines)
-        T = (h1 + c + dd) % 2**32
-        h1 = (h2 + d + ee) % 2**32
-        h2 = (h3 + e + aa) % 2**32
-        h3 = (h4 + a + bb) % 2**32
-        h4 = (h0 + b + cc) % 2**32
-        h0 = T
-
-    # ========================================================================
-    # OUTPUT - Combine final hash values in little-endian format
-    # ========================================================================
-
-    result = (little_end(makehex(h0)) +
-              little_end(makehex(h1)) +
-              little_end(makehex(h2)) +
-              little_end(makehex(h3)) +
-              little_end(makehex(h4)))
-
-    return result
\ No newline at end of file
+            t = a + fl(b, c, d) + X[xl] + kl
+            t = ((t << sl) | (t >> (32 - sl))) + e
+            a, e, d, c, b = e, d, (c << 10) | (c >> 22), b, t
+
+            # RIGHT LINE
+            t = aa + fr(bb, cc, dd) + X[xr] + kr
+            t = ((t << sr) | (t >> (32 - sr))) + ee
+            aa, ee, dd, cc, bb = ee, dd, (cc << 10) | (cc >> 22), bb, t
+
+    return (h1 + c + dd, h2 + d + ee, h3 + e + aa, h4 + a + bb, h0 + b + cc)
+
+
+def _batch_same_length(messages):
+    """Digest messages of one length with NumPy lanes (one lane per message)."""
+    tail = padding(len(messages[0]))
+    padded = b''.join(message + tail for message in messages)
+    blocks = len(padded) // (len(messages) * BLOCK_SIZE)
+    words = np.frombuffer(padded, dtype='<u4').reshape(len(messages), blocks, 16)
+
+    state = tuple(np.full(len(messages), h, dtype=np.uint32) for h in H0)
+    for block in range(blocks):
+        X = np.ascontiguousarray(words[:, block, :].T, dtype=np.uint32)
+        state = _compress_lanes(state, X)
+    out = np.stack(state, axis=1).astype('<u4').tobytes()
+    return [out[i:i + DIGEST_SIZE] for i in range(0, len(out), DIGEST_SIZE)]
+
+
+def batch_digest(messages, min_lanes=BATCH_MIN_LANES):
+    """Compute the RIPEMD-160 digests of many messages.
+
+    Messages are grouped by length; each group of at least min_lanes runs
+    through the compression rounds together, one NumPy uint32 lane per
+    message. Hash160 inputs (32-byte SHA-256 digests) are a single block,
+    so a group costs one vectorized compression. Smaller groups, and all
+    messages when NumPy is not installed, use digest() one at a time.
+
+    Args:
+        messages: Iterable of bytes-like messages
+        min_lanes: Smallest group that is vectorized
+
+    Returns:
+        list: 20-byte digests, in input order
+    """
+    messages = [bytes(m) for m in messages]
+    if np is None:
+        return [digest(m) for m in messages]
+
+    groups = {}
+    for index, message in enumerate(messages):
+        groups.setdefault(len(message), []).append(index)
+
+    digests = [None] * len(messages)
+    for indices in groups.values():
+        if len(indices) < min_lanes:
+            for index in indices:
+                digests[index] = digest(messages[index])
+            continue
+        for start in range(0, len(indices), BATCH_MAX_LANES):
+            chunk = indices[start:start + BATCH_MAX_LANES]
+            for index, result in zip(chunk, _batch_same_length([messages[i] for i in chunk])):
+                digests[index] = result
+    return digests
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def benchmark(count=20, min_time=0.2):
+    """Compare digest() with the educational version in old/ on Hash160 inputs.
+
+    The educational myRipeMD160() takes a hex public key and hashes its
+    SHA-256 digest, so both sides are timed on RIPEMD-160(SHA-256(key))
+    for 33-byte compressed public keys (one 32-byte block per hash).
+
+    Args:
+        count: Public keys per timed call
+        min_time: Seconds to spend per implementation
+
+    Returns:
+        dict: {'educational_us', 'digest_us', 'speedup'} per hash
+
+    Raises:
+        RuntimeError: If the two implementations disagree
+    """
+    import hashlib
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'old'))
+    from ripemd160_educational import myRipeMD160
+
+    keys = [bytes([2 + (i & 1)]) + hashlib.sha256(b'%d' % i).digest() for i in range(count)]
+    for key in keys:
+        if myRipeMD160(key.hex(), verbose=False) != digest(hashlib.sha256(key).digest()):
+            raise RuntimeError(f"RIPEMD-160 implementations disagree on {key.hex()}")
+
+    def per_hash(func):
+        calls, start = 0, time.perf_counter()
+        while True:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                return elapsed / (calls * count)
+
+    old = per_hash(lambda: [myRipeMD160(key.hex(), verbose=False) for key in keys])
+    new = per_hash(lambda: [digest(hashlib.sha256(key).digest()) for key in keys])
+    return {'educational_us': old * 1e6, 'digest_us': new * 1e6, 'speedup': old / new}
+
+
+if __name__ == "__main__":
+    if '--generate' in sys.argv:
+        write_compress_module()
+        print(f"Wrote {UNROLLED_PATH}")
+        sys.exit(0)
+
+    selection = compress_selection()
+    print(f"compress: {selection['selected']} (loop {selection['loop_us']:.1f} us, "
+          f"unrolled {selection['unrolled_us']:.1f} us per block)")
+    result = benchmark()
+    print(f"Hash160 of a public key: educational {result['educational_us']:.1f} us, "
+          f"digest() {result['digest_us']:.1f} us ({result['speedup']:.1f}x)")
+    print("Full backend comparison: python cryptography/tests/benchmark_ripemd160.py")
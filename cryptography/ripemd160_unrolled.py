@@ -0,0 +1,516 @@
+"""
+Unrolled RIPEMD-160 compression function.
+
+GENERATED by ripemd160.generate_compress_source() - do not edit by hand.
+Regenerate with: python cryptography/ripemd160.py --generate
+"""
+
+import struct
+
+_WORDS = struct.Struct('<16I')
+
+
+def compress_unrolled(state, block, offset=0):
+    """Straight-line RIPEMD-160 compression of one 64-byte block (see compress_loop)."""
+    h0, h1, h2, h3, h4 = state
+    x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15 = _WORDS.unpack_from(block, offset)
+    a = aa = h0
+    b = bb = h1
+    c = cc = h2
+    d = dd = h3
+    e = ee = h4
+    # LEFT LINE, round 1
+    a = (a + (b ^ c ^ d) + x0) & 0xFFFFFFFF
+    a = (((a << 11) | (a >> 21)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + (a ^ b ^ c) + x1) & 0xFFFFFFFF
+    e = (((e << 14) | (e >> 18)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + (e ^ a ^ b) + x2) & 0xFFFFFFFF
+    d = (((d << 15) | (d >> 17)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + (d ^ e ^ a) + x3) & 0xFFFFFFFF
+    c = (((c << 12) | (c >> 20)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + (c ^ d ^ e) + x4) & 0xFFFFFFFF
+    b = (((b << 5) | (b >> 27)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + (b ^ c ^ d) + x5) & 0xFFFFFFFF
+    a = (((a << 8) | (a >> 24)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + (a ^ b ^ c) + x6) & 0xFFFFFFFF
+    e = (((e << 7) | (e >> 25)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + (e ^ a ^ b) + x7) & 0xFFFFFFFF
+    d = (((d << 9) | (d >> 23)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + (d ^ e ^ a) + x8) & 0xFFFFFFFF
+    c = (((c << 11) | (c >> 21)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + (c ^ d ^ e) + x9) & 0xFFFFFFFF
+    b = (((b << 13) | (b >> 19)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + (b ^ c ^ d) + x10) & 0xFFFFFFFF
+    a = (((a << 14) | (a >> 18)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + (a ^ b ^ c) + x11) & 0xFFFFFFFF
+    e = (((e << 15) | (e >> 17)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + (e ^ a ^ b) + x12) & 0xFFFFFFFF
+    d = (((d << 6) | (d >> 26)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + (d ^ e ^ a) + x13) & 0xFFFFFFFF
+    c = (((c << 7) | (c >> 25)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + (c ^ d ^ e) + x14) & 0xFFFFFFFF
+    b = (((b << 9) | (b >> 23)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + (b ^ c ^ d) + x15) & 0xFFFFFFFF
+    a = (((a << 8) | (a >> 24)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    # LEFT LINE, round 2
+    e = (e + ((a & b) | (~a & c)) + x7 + 0x5A827999) & 0xFFFFFFFF
+    e = (((e << 7) | (e >> 25)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + ((e & a) | (~e & b)) + x4 + 0x5A827999) & 0xFFFFFFFF
+    d = (((d << 6) | (d >> 26)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + ((d & e) | (~d & a)) + x13 + 0x5A827999) & 0xFFFFFFFF
+    c = (((c << 8) | (c >> 24)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + ((c & d) | (~c & e)) + x1 + 0x5A827999) & 0xFFFFFFFF
+    b = (((b << 13) | (b >> 19)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + ((b & c) | (~b & d)) + x10 + 0x5A827999) & 0xFFFFFFFF
+    a = (((a << 11) | (a >> 21)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + ((a & b) | (~a & c)) + x6 + 0x5A827999) & 0xFFFFFFFF
+    e = (((e << 9) | (e >> 23)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + ((e & a) | (~e & b)) + x15 + 0x5A827999) & 0xFFFFFFFF
+    d = (((d << 7) | (d >> 25)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + ((d & e) | (~d & a)) + x3 + 0x5A827999) & 0xFFFFFFFF
+    c = (((c << 15) | (c >> 17)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + ((c & d) | (~c & e)) + x12 + 0x5A827999) & 0xFFFFFFFF
+    b = (((b << 7) | (b >> 25)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + ((b & c) | (~b & d)) + x0 + 0x5A827999) & 0xFFFFFFFF
+    a = (((a << 12) | (a >> 20)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + ((a & b) | (~a & c)) + x9 + 0x5A827999) & 0xFFFFFFFF
+    e = (((e << 15) | (e >> 17)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + ((e & a) | (~e & b)) + x5 + 0x5A827999) & 0xFFFFFFFF
+    d = (((d << 9) | (d >> 23)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + ((d & e) | (~d & a)) + x2 + 0x5A827999) & 0xFFFFFFFF
+    c = (((c << 11) | (c >> 21)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + ((c & d) | (~c & e)) + x14 + 0x5A827999) & 0xFFFFFFFF
+    b = (((b << 7) | (b >> 25)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + ((b & c) | (~b & d)) + x11 + 0x5A827999) & 0xFFFFFFFF
+    a = (((a << 13) | (a >> 19)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + ((a & b) | (~a & c)) + x8 + 0x5A827999) & 0xFFFFFFFF
+    e = (((e << 12) | (e >> 20)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    # LEFT LINE, round 3
+    d = (d + ((e | ~a) ^ b) + x3 + 0x6ED9EBA1) & 0xFFFFFFFF
+    d = (((d << 11) | (d >> 21)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + ((d | ~e) ^ a) + x10 + 0x6ED9EBA1) & 0xFFFFFFFF
+    c = (((c << 13) | (c >> 19)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + ((c | ~d) ^ e) + x14 + 0x6ED9EBA1) & 0xFFFFFFFF
+    b = (((b << 6) | (b >> 26)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + ((b | ~c) ^ d) + x4 + 0x6ED9EBA1) & 0xFFFFFFFF
+    a = (((a << 7) | (a >> 25)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + ((a | ~b) ^ c) + x9 + 0x6ED9EBA1) & 0xFFFFFFFF
+    e = (((e << 14) | (e >> 18)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + ((e | ~a) ^ b) + x15 + 0x6ED9EBA1) & 0xFFFFFFFF
+    d = (((d << 9) | (d >> 23)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + ((d | ~e) ^ a) + x8 + 0x6ED9EBA1) & 0xFFFFFFFF
+    c = (((c << 13) | (c >> 19)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + ((c | ~d) ^ e) + x1 + 0x6ED9EBA1) & 0xFFFFFFFF
+    b = (((b << 15) | (b >> 17)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + ((b | ~c) ^ d) + x2 + 0x6ED9EBA1) & 0xFFFFFFFF
+    a = (((a << 14) | (a >> 18)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + ((a | ~b) ^ c) + x7 + 0x6ED9EBA1) & 0xFFFFFFFF
+    e = (((e << 8) | (e >> 24)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + ((e | ~a) ^ b) + x0 + 0x6ED9EBA1) & 0xFFFFFFFF
+    d = (((d << 13) | (d >> 19)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + ((d | ~e) ^ a) + x6 + 0x6ED9EBA1) & 0xFFFFFFFF
+    c = (((c << 6) | (c >> 26)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + ((c | ~d) ^ e) + x13 + 0x6ED9EBA1) & 0xFFFFFFFF
+    b = (((b << 5) | (b >> 27)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + ((b | ~c) ^ d) + x11 + 0x6ED9EBA1) & 0xFFFFFFFF
+    a = (((a << 12) | (a >> 20)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + ((a | ~b) ^ c) + x5 + 0x6ED9EBA1) & 0xFFFFFFFF
+    e = (((e << 7) | (e >> 25)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + ((e | ~a) ^ b) + x12 + 0x6ED9EBA1) & 0xFFFFFFFF
+    d = (((d << 5) | (d >> 27)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    # LEFT LINE, round 4
+    c = (c + ((d & a) | (e & ~a)) + x1 + 0x8F1BBCDC) & 0xFFFFFFFF
+    c = (((c << 11) | (c >> 21)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + ((c & e) | (d & ~e)) + x9 + 0x8F1BBCDC) & 0xFFFFFFFF
+    b = (((b << 12) | (b >> 20)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + ((b & d) | (c & ~d)) + x11 + 0x8F1BBCDC) & 0xFFFFFFFF
+    a = (((a << 14) | (a >> 18)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + ((a & c) | (b & ~c)) + x10 + 0x8F1BBCDC) & 0xFFFFFFFF
+    e = (((e << 15) | (e >> 17)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + ((e & b) | (a & ~b)) + x0 + 0x8F1BBCDC) & 0xFFFFFFFF
+    d = (((d << 14) | (d >> 18)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + ((d & a) | (e & ~a)) + x8 + 0x8F1BBCDC) & 0xFFFFFFFF
+    c = (((c << 15) | (c >> 17)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + ((c & e) | (d & ~e)) + x12 + 0x8F1BBCDC) & 0xFFFFFFFF
+    b = (((b << 9) | (b >> 23)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + ((b & d) | (c & ~d)) + x4 + 0x8F1BBCDC) & 0xFFFFFFFF
+    a = (((a << 8) | (a >> 24)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + ((a & c) | (b & ~c)) + x13 + 0x8F1BBCDC) & 0xFFFFFFFF
+    e = (((e << 9) | (e >> 23)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + ((e & b) | (a & ~b)) + x3 + 0x8F1BBCDC) & 0xFFFFFFFF
+    d = (((d << 14) | (d >> 18)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + ((d & a) | (e & ~a)) + x7 + 0x8F1BBCDC) & 0xFFFFFFFF
+    c = (((c << 5) | (c >> 27)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + ((c & e) | (d & ~e)) + x15 + 0x8F1BBCDC) & 0xFFFFFFFF
+    b = (((b << 6) | (b >> 26)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + ((b & d) | (c & ~d)) + x14 + 0x8F1BBCDC) & 0xFFFFFFFF
+    a = (((a << 8) | (a >> 24)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + ((a & c) | (b & ~c)) + x5 + 0x8F1BBCDC) & 0xFFFFFFFF
+    e = (((e << 6) | (e >> 26)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + ((e & b) | (a & ~b)) + x6 + 0x8F1BBCDC) & 0xFFFFFFFF
+    d = (((d << 5) | (d >> 27)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + ((d & a) | (e & ~a)) + x2 + 0x8F1BBCDC) & 0xFFFFFFFF
+    c = (((c << 12) | (c >> 20)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    # LEFT LINE, round 5
+    b = (b + (c ^ (d | ~e)) + x4 + 0xA953FD4E) & 0xFFFFFFFF
+    b = (((b << 9) | (b >> 23)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + (b ^ (c | ~d)) + x0 + 0xA953FD4E) & 0xFFFFFFFF
+    a = (((a << 15) | (a >> 17)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + (a ^ (b | ~c)) + x5 + 0xA953FD4E) & 0xFFFFFFFF
+    e = (((e << 5) | (e >> 27)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + (e ^ (a | ~b)) + x9 + 0xA953FD4E) & 0xFFFFFFFF
+    d = (((d << 11) | (d >> 21)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + (d ^ (e | ~a)) + x7 + 0xA953FD4E) & 0xFFFFFFFF
+    c = (((c << 6) | (c >> 26)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + (c ^ (d | ~e)) + x12 + 0xA953FD4E) & 0xFFFFFFFF
+    b = (((b << 8) | (b >> 24)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + (b ^ (c | ~d)) + x2 + 0xA953FD4E) & 0xFFFFFFFF
+    a = (((a << 13) | (a >> 19)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + (a ^ (b | ~c)) + x10 + 0xA953FD4E) & 0xFFFFFFFF
+    e = (((e << 12) | (e >> 20)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + (e ^ (a | ~b)) + x14 + 0xA953FD4E) & 0xFFFFFFFF
+    d = (((d << 5) | (d >> 27)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + (d ^ (e | ~a)) + x1 + 0xA953FD4E) & 0xFFFFFFFF
+    c = (((c << 12) | (c >> 20)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + (c ^ (d | ~e)) + x3 + 0xA953FD4E) & 0xFFFFFFFF
+    b = (((b << 13) | (b >> 19)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    a = (a + (b ^ (c | ~d)) + x8 + 0xA953FD4E) & 0xFFFFFFFF
+    a = (((a << 14) | (a >> 18)) + e) & 0xFFFFFFFF
+    c = ((c << 10) | (c >> 22)) & 0xFFFFFFFF
+    e = (e + (a ^ (b | ~c)) + x11 + 0xA953FD4E) & 0xFFFFFFFF
+    e = (((e << 11) | (e >> 21)) + d) & 0xFFFFFFFF
+    b = ((b << 10) | (b >> 22)) & 0xFFFFFFFF
+    d = (d + (e ^ (a | ~b)) + x6 + 0xA953FD4E) & 0xFFFFFFFF
+    d = (((d << 8) | (d >> 24)) + c) & 0xFFFFFFFF
+    a = ((a << 10) | (a >> 22)) & 0xFFFFFFFF
+    c = (c + (d ^ (e | ~a)) + x15 + 0xA953FD4E) & 0xFFFFFFFF
+    c = (((c << 5) | (c >> 27)) + b) & 0xFFFFFFFF
+    e = ((e << 10) | (e >> 22)) & 0xFFFFFFFF
+    b = (b + (c ^ (d | ~e)) + x13 + 0xA953FD4E) & 0xFFFFFFFF
+    b = (((b << 6) | (b >> 26)) + a) & 0xFFFFFFFF
+    d = ((d << 10) | (d >> 22)) & 0xFFFFFFFF
+    # RIGHT LINE, round 1
+    aa = (aa + (bb ^ (cc | ~dd)) + x5 + 0x50A28BE6) & 0xFFFFFFFF
+    aa = (((aa << 8) | (aa >> 24)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + (aa ^ (bb | ~cc)) + x14 + 0x50A28BE6) & 0xFFFFFFFF
+    ee = (((ee << 9) | (ee >> 23)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + (ee ^ (aa | ~bb)) + x7 + 0x50A28BE6) & 0xFFFFFFFF
+    dd = (((dd << 9) | (dd >> 23)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + (dd ^ (ee | ~aa)) + x0 + 0x50A28BE6) & 0xFFFFFFFF
+    cc = (((cc << 11) | (cc >> 21)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + (cc ^ (dd | ~ee)) + x9 + 0x50A28BE6) & 0xFFFFFFFF
+    bb = (((bb << 13) | (bb >> 19)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + (bb ^ (cc | ~dd)) + x2 + 0x50A28BE6) & 0xFFFFFFFF
+    aa = (((aa << 15) | (aa >> 17)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + (aa ^ (bb | ~cc)) + x11 + 0x50A28BE6) & 0xFFFFFFFF
+    ee = (((ee << 15) | (ee >> 17)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + (ee ^ (aa | ~bb)) + x4 + 0x50A28BE6) & 0xFFFFFFFF
+    dd = (((dd << 5) | (dd >> 27)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + (dd ^ (ee | ~aa)) + x13 + 0x50A28BE6) & 0xFFFFFFFF
+    cc = (((cc << 7) | (cc >> 25)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + (cc ^ (dd | ~ee)) + x6 + 0x50A28BE6) & 0xFFFFFFFF
+    bb = (((bb << 7) | (bb >> 25)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + (bb ^ (cc | ~dd)) + x15 + 0x50A28BE6) & 0xFFFFFFFF
+    aa = (((aa << 8) | (aa >> 24)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + (aa ^ (bb | ~cc)) + x8 + 0x50A28BE6) & 0xFFFFFFFF
+    ee = (((ee << 11) | (ee >> 21)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + (ee ^ (aa | ~bb)) + x1 + 0x50A28BE6) & 0xFFFFFFFF
+    dd = (((dd << 14) | (dd >> 18)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + (dd ^ (ee | ~aa)) + x10 + 0x50A28BE6) & 0xFFFFFFFF
+    cc = (((cc << 14) | (cc >> 18)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + (cc ^ (dd | ~ee)) + x3 + 0x50A28BE6) & 0xFFFFFFFF
+    bb = (((bb << 12) | (bb >> 20)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + (bb ^ (cc | ~dd)) + x12 + 0x50A28BE6) & 0xFFFFFFFF
+    aa = (((aa << 6) | (aa >> 26)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    # RIGHT LINE, round 2
+    ee = (ee + ((aa & cc) | (bb & ~cc)) + x6 + 0x5C4DD124) & 0xFFFFFFFF
+    ee = (((ee << 9) | (ee >> 23)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + ((ee & bb) | (aa & ~bb)) + x11 + 0x5C4DD124) & 0xFFFFFFFF
+    dd = (((dd << 13) | (dd >> 19)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + ((dd & aa) | (ee & ~aa)) + x3 + 0x5C4DD124) & 0xFFFFFFFF
+    cc = (((cc << 15) | (cc >> 17)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + ((cc & ee) | (dd & ~ee)) + x7 + 0x5C4DD124) & 0xFFFFFFFF
+    bb = (((bb << 7) | (bb >> 25)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + ((bb & dd) | (cc & ~dd)) + x0 + 0x5C4DD124) & 0xFFFFFFFF
+    aa = (((aa << 12) | (aa >> 20)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + ((aa & cc) | (bb & ~cc)) + x13 + 0x5C4DD124) & 0xFFFFFFFF
+    ee = (((ee << 8) | (ee >> 24)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + ((ee & bb) | (aa & ~bb)) + x5 + 0x5C4DD124) & 0xFFFFFFFF
+    dd = (((dd << 9) | (dd >> 23)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + ((dd & aa) | (ee & ~aa)) + x10 + 0x5C4DD124) & 0xFFFFFFFF
+    cc = (((cc << 11) | (cc >> 21)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + ((cc & ee) | (dd & ~ee)) + x14 + 0x5C4DD124) & 0xFFFFFFFF
+    bb = (((bb << 7) | (bb >> 25)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + ((bb & dd) | (cc & ~dd)) + x15 + 0x5C4DD124) & 0xFFFFFFFF
+    aa = (((aa << 7) | (aa >> 25)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + ((aa & cc) | (bb & ~cc)) + x8 + 0x5C4DD124) & 0xFFFFFFFF
+    ee = (((ee << 12) | (ee >> 20)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + ((ee & bb) | (aa & ~bb)) + x12 + 0x5C4DD124) & 0xFFFFFFFF
+    dd = (((dd << 7) | (dd >> 25)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + ((dd & aa) | (ee & ~aa)) + x4 + 0x5C4DD124) & 0xFFFFFFFF
+    cc = (((cc << 6) | (cc >> 26)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + ((cc & ee) | (dd & ~ee)) + x9 + 0x5C4DD124) & 0xFFFFFFFF
+    bb = (((bb << 15) | (bb >> 17)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + ((bb & dd) | (cc & ~dd)) + x1 + 0x5C4DD124) & 0xFFFFFFFF
+    aa = (((aa << 13) | (aa >> 19)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + ((aa & cc) | (bb & ~cc)) + x2 + 0x5C4DD124) & 0xFFFFFFFF
+    ee = (((ee << 11) | (ee >> 21)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    # RIGHT LINE, round 3
+    dd = (dd + ((ee | ~aa) ^ bb) + x15 + 0x6D703EF3) & 0xFFFFFFFF
+    dd = (((dd << 9) | (dd >> 23)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + ((dd | ~ee) ^ aa) + x5 + 0x6D703EF3) & 0xFFFFFFFF
+    cc = (((cc << 7) | (cc >> 25)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + ((cc | ~dd) ^ ee) + x1 + 0x6D703EF3) & 0xFFFFFFFF
+    bb = (((bb << 15) | (bb >> 17)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + ((bb | ~cc) ^ dd) + x3 + 0x6D703EF3) & 0xFFFFFFFF
+    aa = (((aa << 11) | (aa >> 21)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + ((aa | ~bb) ^ cc) + x7 + 0x6D703EF3) & 0xFFFFFFFF
+    ee = (((ee << 8) | (ee >> 24)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + ((ee | ~aa) ^ bb) + x14 + 0x6D703EF3) & 0xFFFFFFFF
+    dd = (((dd << 6) | (dd >> 26)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + ((dd | ~ee) ^ aa) + x6 + 0x6D703EF3) & 0xFFFFFFFF
+    cc = (((cc << 6) | (cc >> 26)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + ((cc | ~dd) ^ ee) + x9 + 0x6D703EF3) & 0xFFFFFFFF
+    bb = (((bb << 14) | (bb >> 18)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + ((bb | ~cc) ^ dd) + x11 + 0x6D703EF3) & 0xFFFFFFFF
+    aa = (((aa << 12) | (aa >> 20)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + ((aa | ~bb) ^ cc) + x8 + 0x6D703EF3) & 0xFFFFFFFF
+    ee = (((ee << 13) | (ee >> 19)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + ((ee | ~aa) ^ bb) + x12 + 0x6D703EF3) & 0xFFFFFFFF
+    dd = (((dd << 5) | (dd >> 27)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + ((dd | ~ee) ^ aa) + x2 + 0x6D703EF3) & 0xFFFFFFFF
+    cc = (((cc << 14) | (cc >> 18)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + ((cc | ~dd) ^ ee) + x10 + 0x6D703EF3) & 0xFFFFFFFF
+    bb = (((bb << 13) | (bb >> 19)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + ((bb | ~cc) ^ dd) + x0 + 0x6D703EF3) & 0xFFFFFFFF
+    aa = (((aa << 13) | (aa >> 19)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + ((aa | ~bb) ^ cc) + x4 + 0x6D703EF3) & 0xFFFFFFFF
+    ee = (((ee << 7) | (ee >> 25)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + ((ee | ~aa) ^ bb) + x13 + 0x6D703EF3) & 0xFFFFFFFF
+    dd = (((dd << 5) | (dd >> 27)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    # RIGHT LINE, round 4
+    cc = (cc + ((dd & ee) | (~dd & aa)) + x8 + 0x7A6D76E9) & 0xFFFFFFFF
+    cc = (((cc << 15) | (cc >> 17)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + ((cc & dd) | (~cc & ee)) + x6 + 0x7A6D76E9) & 0xFFFFFFFF
+    bb = (((bb << 5) | (bb >> 27)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + ((bb & cc) | (~bb & dd)) + x4 + 0x7A6D76E9) & 0xFFFFFFFF
+    aa = (((aa << 8) | (aa >> 24)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + ((aa & bb) | (~aa & cc)) + x1 + 0x7A6D76E9) & 0xFFFFFFFF
+    ee = (((ee << 11) | (ee >> 21)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + ((ee & aa) | (~ee & bb)) + x3 + 0x7A6D76E9) & 0xFFFFFFFF
+    dd = (((dd << 14) | (dd >> 18)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + ((dd & ee) | (~dd & aa)) + x11 + 0x7A6D76E9) & 0xFFFFFFFF
+    cc = (((cc << 14) | (cc >> 18)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + ((cc & dd) | (~cc & ee)) + x15 + 0x7A6D76E9) & 0xFFFFFFFF
+    bb = (((bb << 6) | (bb >> 26)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + ((bb & cc) | (~bb & dd)) + x0 + 0x7A6D76E9) & 0xFFFFFFFF
+    aa = (((aa << 14) | (aa >> 18)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + ((aa & bb) | (~aa & cc)) + x5 + 0x7A6D76E9) & 0xFFFFFFFF
+    ee = (((ee << 6) | (ee >> 26)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + ((ee & aa) | (~ee & bb)) + x12 + 0x7A6D76E9) & 0xFFFFFFFF
+    dd = (((dd << 9) | (dd >> 23)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + ((dd & ee) | (~dd & aa)) + x2 + 0x7A6D76E9) & 0xFFFFFFFF
+    cc = (((cc << 12) | (cc >> 20)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + ((cc & dd) | (~cc & ee)) + x13 + 0x7A6D76E9) & 0xFFFFFFFF
+    bb = (((bb << 9) | (bb >> 23)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + ((bb & cc) | (~bb & dd)) + x9 + 0x7A6D76E9) & 0xFFFFFFFF
+    aa = (((aa << 12) | (aa >> 20)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + ((aa & bb) | (~aa & cc)) + x7 + 0x7A6D76E9) & 0xFFFFFFFF
+    ee = (((ee << 5) | (ee >> 27)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + ((ee & aa) | (~ee & bb)) + x10 + 0x7A6D76E9) & 0xFFFFFFFF
+    dd = (((dd << 15) | (dd >> 17)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + ((dd & ee) | (~dd & aa)) + x14 + 0x7A6D76E9) & 0xFFFFFFFF
+    cc = (((cc << 8) | (cc >> 24)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    # RIGHT LINE, round 5
+    bb = (bb + (cc ^ dd ^ ee) + x12) & 0xFFFFFFFF
+    bb = (((bb << 8) | (bb >> 24)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + (bb ^ cc ^ dd) + x15) & 0xFFFFFFFF
+    aa = (((aa << 5) | (aa >> 27)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + (aa ^ bb ^ cc) + x10) & 0xFFFFFFFF
+    ee = (((ee << 12) | (ee >> 20)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + (ee ^ aa ^ bb) + x4) & 0xFFFFFFFF
+    dd = (((dd << 9) | (dd >> 23)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + (dd ^ ee ^ aa) + x1) & 0xFFFFFFFF
+    cc = (((cc << 12) | (cc >> 20)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + (cc ^ dd ^ ee) + x5) & 0xFFFFFFFF
+    bb = (((bb << 5) | (bb >> 27)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + (bb ^ cc ^ dd) + x8) & 0xFFFFFFFF
+    aa = (((aa << 14) | (aa >> 18)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + (aa ^ bb ^ cc) + x7) & 0xFFFFFFFF
+    ee = (((ee << 6) | (ee >> 26)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + (ee ^ aa ^ bb) + x6) & 0xFFFFFFFF
+    dd = (((dd << 8) | (dd >> 24)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + (dd ^ ee ^ aa) + x2) & 0xFFFFFFFF
+    cc = (((cc << 13) | (cc >> 19)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + (cc ^ dd ^ ee) + x13) & 0xFFFFFFFF
+    bb = (((bb << 6) | (bb >> 26)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    aa = (aa + (bb ^ cc ^ dd) + x14) & 0xFFFFFFFF
+    aa = (((aa << 5) | (aa >> 27)) + ee) & 0xFFFFFFFF
+    cc = ((cc << 10) | (cc >> 22)) & 0xFFFFFFFF
+    ee = (ee + (aa ^ bb ^ cc) + x0) & 0xFFFFFFFF
+    ee = (((ee << 15) | (ee >> 17)) + dd) & 0xFFFFFFFF
+    bb = ((bb << 10) | (bb >> 22)) & 0xFFFFFFFF
+    dd = (dd + (ee ^ aa ^ bb) + x3) & 0xFFFFFFFF
+    dd = (((dd << 13) | (dd >> 19)) + cc) & 0xFFFFFFFF
+    aa = ((aa << 10) | (aa >> 22)) & 0xFFFFFFFF
+    cc = (cc + (dd ^ ee ^ aa) + x9) & 0xFFFFFFFF
+    cc = (((cc << 11) | (cc >> 21)) + bb) & 0xFFFFFFFF
+    ee = ((ee << 10) | (ee >> 22)) & 0xFFFFFFFF
+    bb = (bb + (cc ^ dd ^ ee) + x11) & 0xFFFFFFFF
+    bb = (((bb << 11) | (bb >> 21)) + aa) & 0xFFFFFFFF
+    dd = ((dd << 10) | (dd >> 22)) & 0xFFFFFFFF
+    return ((h1 + c + dd) & 0xFFFFFFFF,
+            (h2 + d + ee) & 0xFFFFFFFF,
+            (h3 + e + aa) & 0xFFFFFFFF,
+            (h4 + a + bb) & 0xFFFFFFFF,
+            (h0 + b + cc) & 0xFFFFFFFF)
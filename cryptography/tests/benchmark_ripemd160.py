@@ -0,0 +1,277 @@
+"""
+Throughput and correctness benchmark for every RIPEMD-160 backend
+
+Backends:
+    - pure-loop / pure-unrolled - ripemd160.digest() with each compress variant
+    - educational               - old/ripemd160_educational.py (Hash160 of a
+                                  hex public key: SHA-256 first, so its
+                                  RIPEMD-160 input is always 32 bytes)
+    - openssl / pycryptodome    - native backends that passed hashBackend's probe
+    - batch                     - ripemd160.batch_digest() NumPy lanes (if NumPy
+                                  is installed), BATCH_LANES messages per call
+
+Every backend is first cross-validated against the published RIPEMD-160
+test vectors, then timed on messages from 0 bytes to 1 MB. Results are
+reported as MB/s and hashes/s and can be saved as JSON to compare runs.
+
+Usage:
+    python cryptography/tests/benchmark_ripemd160.py
+    python cryptography/tests/benchmark_ripemd160.py --max-size 65536 --json before.json
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'old'))
+
+import argparse
+import hashlib
+import json
+import time
+
+import ripemd160
+from cryptography import hashBackend
+from cryptography.bitUtils import print_table
+from ripemd160_educational import myRipeMD160
+
+
+# Published test vectors (message, RIPEMD-160 digest)
+# https://homes.esat.kuleuven.be/~bosselae/ripemd160.html
+TEST_VECTORS = (
+    (b'', '9c1185a5c5e9fc54612808977ee8f548b2258d31'),
+    (b'a', '0bdc9d2d256b3ee9daae347be6f4dc835a467ffe'),
+    (b'abc', '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc'),
+    (b'message digest', '5d0689ef49d2fae572b881b123a85ffa21595f36'),
+    (b'abcdefghijklmnopqrstuvwxyz', 'f71c27109c692c1b56bbdceb5b9d2865b3708dbc'),
+    (b'abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq',
+     '12a053384a9c0c88e405a06c27dcf49ada62eb2b'),
+    (b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789',
+     'b0e20b6e3116640286ed3a87a5713079b21f5189'),
+    (b'1234567890' * 8, '9b752e45573d4b39f4dbd3323cab82bf63326bfb'),
+    (b'a' * 1000000, '52783243c1697bdbe16d37f97f68f08325dc1528'),
+)
+
+SIZES = (0, 32, 64, 256, 1024, 16384, 65536, 1 << 20)
+
+# Messages per batch_digest call, and the largest message size batched
+BATCH_LANES = 1024
+BATCH_MAX_SIZE = 1024
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+def _pure(variant):
+    def run(message):
+        ripemd160.set_compress(variant)
+        return ripemd160.digest(message)
+    return run
+
+
+def _educational(message):
+    """RIPEMD-160 of the SHA-256 of message, via the educational version."""
+    return myRipeMD160(message.hex(), verbose=False)
+
+
+def backends():
+    """
+    Get the backends available in this process.
+
+    Returns:
+        dict: name -> {'hash': callable(message) -> digest,
+                       'kind': 'ripemd160' | 'hash160' | 'batch'}
+    """
+    found = {
+        'pure-loop': {'hash': _pure('loop'), 'kind': 'ripemd160'},
+        'pure-unrolled': {'hash': _pure('unrolled'), 'kind': 'ripemd160'},
+        'educational': {'hash': _educational, 'kind': 'hash160'},
+    }
+    for name in hashBackend.available_backends():
+        if name != 'pure':
+            found[name] = {'hash': hashBackend.get_backend(name).ripemd160, 'kind': 'ripemd160'}
+    if ripemd160.np is not None:
+        found['batch'] = {'hash': lambda messages: ripemd160.batch_digest(messages, min_lanes=1),
+                          'kind': 'batch'}
+    return found
+
+
+# ============================================================================
+# CROSS-VALIDATION
+# ============================================================================
+
+def validate(found, include_million=True):
+    """
+    Check every backend against TEST_VECTORS.
+
+    'hash160' backends hash SHA-256(message) with RIPEMD-160, so they are
+    checked against the digest of the SHA-256 of each vector message as
+    computed by the (vector-checked) pure core. 'batch' backends get every
+    vector message in a batch of 16 lanes.
+
+    Args:
+        found: Output of backends()
+        include_million: Also check the 1,000,000 x 'a' vector
+
+    Returns:
+        dict: name -> list of failed vector descriptions (empty if all passed)
+    """
+    vectors = [(m, d) for m, d in TEST_VECTORS if include_million or len(m) < 1000000]
+    selected = ripemd160.compress_selection()['selected']
+    failures = {}
+    try:
+        for name, backend in found.items():
+            failed = []
+            for message, expected in vectors:
+                label = repr(message[:20]) + ('...' if len(message) > 20 else '')
+                if backend['kind'] == 'batch':
+                    if len(message) > BATCH_MAX_SIZE:
+                        continue
+                    results = backend['hash']([message] * 16)
+                    ok = all(result.hex() == expected for result in results)
+                elif backend['kind'] == 'hash160':
+                    if len(message) > BATCH_MAX_SIZE:
+                        continue
+                    ripemd160.set_compress('loop')
+                    reference = ripemd160.digest(hashlib.sha256(message).digest())
+                    ok = backend['hash'](message) == reference
+                else:
+                    ok = backend['hash'](message).hex() == expected
+                if not ok:
+                    failed.append(label)
+            failures[name] = failed
+    finally:
+        ripemd160.set_compress(selected)
+    return failures
+
+
+# ============================================================================
+# THROUGHPUT
+# ============================================================================
+
+def measure(backend, size, min_time=0.2):
+    """
+    Time one backend on messages of one size.
+
+    Args:
+        backend: Entry of backends()
+        size: Message size in bytes
+        min_time: Seconds to keep hashing (at least one call is timed)
+
+    Returns:
+        dict: {'hashes_per_sec', 'mb_per_sec'}, or None if the backend
+              does not apply to this size
+    """
+    message = bytes(i & 0xFF for i in range(size))
+    if backend['kind'] == 'batch':
+        if size > BATCH_MAX_SIZE:
+            return None
+        arg, per_call = [message] * BATCH_LANES, BATCH_LANES
+    elif backend['kind'] == 'hash160':
+        # The educational version only hashes a 32-byte SHA-256 digest
+        if size != 32:
+            return None
+        arg, per_call = message, 1
+    else:
+        arg, per_call = message, 1
+
+    hash_fn = backend['hash']
+    calls, start = 0, time.perf_counter()
+    while True:
+        hash_fn(arg)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+    rate = calls * per_call / elapsed
+    return {'hashes_per_sec': rate, 'mb_per_sec': rate * size / 1e6}
+
+
+def run_benchmark(sizes=SIZES, min_time=0.2, names=None):
+    """
+    Time every backend on every size.
+
+    Args:
+        sizes: Message sizes in bytes
+        min_time: Seconds per (backend, size)
+        names: Backend names to run (default: all available)
+
+    Returns:
+        dict: name -> {size: {'hashes_per_sec', 'mb_per_sec'} or None}
+    """
+    found = backends()
+    selected = ripemd160.compress_selection()['selected']
+    results = {}
+    try:
+        for name, backend in found.items():
+            if names and name not in names:
+                continue
+            results[name] = {size: measure(backend, size, min_time) for size in sizes}
+    finally:
+        ripemd160.set_compress(selected)
+    return results
+
+
+def _format_size(size):
+    if size >= 1 << 20:
+        return f"{size >> 20} MB"
+    if size >= 1 << 10:
+        return f"{size >> 10} KB"
+    return f"{size} B"
+
+
+def print_results(results):
+    """Print one table per message size."""
+    sizes = sorted({size for by_size in results.values() for size in by_size})
+    for size in sizes:
+        measured = sorted(((name, by_size[size]) for name, by_size in results.items()
+                           if by_size.get(size) is not None),
+                          key=lambda item: -item[1]['hashes_per_sec'])
+        rows = [[name, f"{result['mb_per_sec']:.3f}",
+                 f"{result['hashes_per_sec']:,.{0 if result['hashes_per_sec'] >= 100 else 2}f}"]
+                for name, result in measured]
+        print_table(["backend", "MB/s", "hashes/s"], rows, f"Message size: {_format_size(size)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RIPEMD-160 backend benchmark")
+    parser.add_argument('--max-size', type=int, default=1 << 20, help='Largest message size in bytes')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Seconds per backend and size')
+    parser.add_argument('--backend', action='append', help='Only run this backend (repeatable)')
+    parser.add_argument('--skip-million', action='store_true',
+                        help="Skip the 1,000,000 x 'a' vector during validation")
+    parser.add_argument('--json', default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("RIPEMD-160 BACKEND BENCHMARK")
+    print("=" * 70)
+    selection = ripemd160.compress_selection()
+    print(f"compress variant: {selection['selected']}")
+    print(f"hashBackend active: {hashBackend.active_backend()}")
+
+    found = backends()
+    print(f"\nCross-validating {', '.join(found)} against {len(TEST_VECTORS)} published vectors...")
+    failures = validate(found, include_million=not args.skip_million)
+    for name, failed in failures.items():
+        print(f"  [{'OK' if not failed else 'FAIL'}] {name}" + (f": {', '.join(failed)}" if failed else ""))
+
+    sizes = [size for size in SIZES if size <= args.max_size]
+    results = run_benchmark(sizes, args.min_time, args.backend)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'compress': selection,
+                       'hash_backend': hashBackend.active_backend(),
+                       'failures': failures,
+                       'results': {name: {str(size): result for size, result in by_size.items()}
+                                   for name, by_size in results.items()}}, f, indent=2)
+        print(f"\nSaved results to {args.json}")
+    print("=" * 70)
+    return 1 if any(failures.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Test suite for bit-level math utilities
+
+Tests bitUtils.py which handles:
+- Modular inverse (Extended Euclidean Algorithm and faster variants)
+- Batch modular inverse (Montgomery's trick)
+- Step-based EEA states and the shared quotient trace
+- Formatting helpers
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import unittest
+
+from cryptography import bitUtils
+
+# secp256k1 field prime
+P256 = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+
+
+class TestModInverse(unittest.TestCase):
+    """Test modular inverse functions."""
+
+    def test_small(self):
+        """Test mod_inverse(3, 17) = 6."""
+        self.assertEqual(bitUtils.mod_inverse(3, 17), 6)
+
+    def test_no_inverse(self):
+        """Test zero and non-coprime inputs raise ValueError."""
+        with self.assertRaises(ValueError):
+            bitUtils.mod_inverse(0, 17)
+        with self.assertRaises(ValueError):
+            bitUtils.mod_inverse(6, 9)
+
+    def test_batch_matches_single(self):
+        """Test batch_mod_inverse matches mod_inverse element-wise."""
+        values = [3, 5, 7, 2**200 + 1, P256 - 1, 12345678901234567890]
+        self.assertEqual(bitUtils.batch_mod_inverse(values, P256),
+                         [bitUtils.mod_inverse(v, P256) for v in values])
+        self.assertEqual(bitUtils.batch_mod_inverse([3, 5, 7], 17), [6, 7, 5])
+
+    def test_batch_edge_cases(self):
+        """Test empty input and a zero element."""
+        self.assertEqual(bitUtils.batch_mod_inverse([], 17), [])
+        with self.assertRaises(ValueError):
+            bitUtils.batch_mod_inverse([3, 17, 5], 17)
+
+
+class TestModInverseVariants(unittest.TestCase):
+    """Test the mod_inverse variants and size-based selection."""
+
+    def tearDown(self):
+        bitUtils.set_mod_inverse_selection([])
+
+    def test_variants_agree(self):
+        """Test every variant matches the EEA on prime and composite moduli."""
+        cases = [(3, 17), (2**200 + 1, P256), (P256 - 1, P256), (-5, 97),
+                 (7, 2**64), (10, 21)]
+        cases += [(v, p) for p in bitUtils.BENCHMARK_PRIMES.values()
+                  for v in bitUtils._benchmark_values(p, 5)]
+        for a, p in cases:
+            expected = bitUtils.mod_inverse_eea(a, p)
+            for name, func in bitUtils.MOD_INVERSE_VARIANTS.items():
+                self.assertEqual(func(a, p), expected, (name, a, p))
+
+    def test_fermat_on_primes(self):
+        """Test Fermat's variant matches on prime moduli."""
+        for p in bitUtils.BENCHMARK_PRIMES.values():
+            self.assertEqual(bitUtils.mod_inverse_fermat(3, p), bitUtils.mod_inverse_eea(3, p))
+
+    def test_variants_reject_non_invertible(self):
+        """Test every variant raises ValueError without an inverse."""
+        for name, func in bitUtils.MOD_INVERSE_VARIANTS.items():
+            for a, p in ((0, 17), (6, 9), (17, 17), (15, 25)):
+                with self.assertRaises(ValueError, msg=(name, a, p)):
+                    func(a, p)
+
+    def test_variants_reject_bad_modulus(self):
+        """Test every variant, Fermat included, raises ValueError for p <= 1."""
+        variants = dict(bitUtils.MOD_INVERSE_VARIANTS, fermat=bitUtils.mod_inverse_fermat)
+        for name, func in variants.items():
+            for a, p in ((1, 1), (3, 1), (3, 0), (3, -1), (3, -17), (-5, -97)):
+                with self.assertRaises(ValueError, msg=(name, a, p)):
+                    func(a, p)
+        bitUtils.set_mod_inverse_selection('binary')
+        with self.assertRaises(ValueError):
+            bitUtils.mod_inverse(3, -17)
+
+    def test_default_is_pow(self):
+        """Test mod_inverse uses pow with no calibration (an empty routing table)."""
+        self.assertEqual(bitUtils.mod_inverse_selection(), [])
+        self.assertEqual(bitUtils.mod_inverse(3, 17), 6)
+        self.assertEqual(bitUtils.mod_inverse(3, 2**521 - 1), pow(3, -1, 2**521 - 1))
+        with self.assertRaises(ValueError):
+            bitUtils.mod_inverse(6, 9)
+
+    def test_selection(self):
+        """Test forcing a variant and the opt-in routing table."""
+        selection = bitUtils.select_mod_inverse()
+        self.assertEqual(bitUtils.mod_inverse_selection(), selection)
+        self.assertTrue(selection)
+        self.assertEqual(selection[-1][0], 256)
+        for _, name in selection:
+            self.assertIn(name, bitUtils.MOD_INVERSE_VARIANTS)
+
+        bitUtils.set_mod_inverse_selection('binary')
+        self.assertEqual(bitUtils.mod_inverse_selection(), [(0, 'binary')])
+        self.assertEqual(bitUtils.mod_inverse(3, 17), 6)
+        bitUtils.set_mod_inverse_selection([(8, 'eea'), (256, 'pow')])
+        self.assertEqual(bitUtils.mod_inverse(3, 17), 6)
+        self.assertEqual(bitUtils.mod_inverse(3, 2**521 - 1), bitUtils.mod_inverse_eea(3, 2**521 - 1))
+        with self.assertRaises(ValueError):
+            bitUtils.set_mod_inverse_selection('gauss')
+
+    def test_benchmark(self):
+        """Test the microbenchmark reports every variant per size."""
+        results = bitUtils.benchmark_mod_inverse(bit_sizes=(4, 256), iterations=3)
+        self.assertEqual(set(results), {4, 256})
+        self.assertEqual(set(results[256]), {'eea', 'pow', 'binary', 'fermat'})
+
+
+class TestQuotientTrace(unittest.TestCase):
+    """Test the compact quotient trace and ModInverseState views."""
+
+    def test_overflow_values(self):
+        """Test quotients outside 64 bits round-trip through the overflow dict."""
+        values = [0, 1, 2**64 - 2, 2**64 - 1, 2**200 + 3, -7, 5]
+        trace = bitUtils.QuotientTrace(values)
+        self.assertEqual(len(trace), len(values))
+        self.assertEqual([trace[i] for i in range(len(values))], values)
+        self.assertEqual(trace[-2], -7)
+        self.assertEqual(trace[2:6], values[2:6])
+        self.assertEqual(trace.slice(3, 6)[0:3], values[3:6])
+
+    def test_serialization(self):
+        """Test to_bytes/from_bytes and rejection of foreign data."""
+        trace = bitUtils.QuotientTrace([3, 2**70, 1, -2**65])
+        loaded = bitUtils.QuotientTrace.from_bytes(trace.to_bytes())
+        self.assertEqual(loaded[0:4], [3, 2**70, 1, -2**65])
+        with self.assertRaises(ValueError):
+            bitUtils.QuotientTrace.from_bytes(b'not a trace at all....')
+
+    def test_full_matches_steps(self):
+        """Test mod_inverse_full records the same quotients as stepping."""
+        a = 0x1234567890ABCDEF1234567890ABCDEF
+        state = bitUtils.ModInverseState(old_r=a, r=P256, old_s=1, s=0)
+        quotients = []
+        while state.r != 0:
+            state, q = bitUtils.mod_inverse_step(state)
+            quotients.append(q)
+        full = bitUtils.mod_inverse_full(a, P256)
+        self.assertEqual(full.quotients, quotients)
+        self.assertEqual(full.step, len(quotients))
+        self.assertEqual(full.old_s % P256, bitUtils.mod_inverse(a, P256))
+        # The first quotient of a small a overflows 64 bits
+        self.assertEqual(bitUtils.mod_inverse_full(3, P256).quotients[1], P256 // 3)
+
+    def test_shared_trace(self):
+        """Test many inversions recorded into one trace keep their own slices."""
+        trace = bitUtils.QuotientTrace()
+        states = [bitUtils.mod_inverse_full(a, 23, trace=trace) for a in (7, 5, 11)]
+        self.assertEqual(len(trace), sum(len(st.quotients) for st in states))
+        for a, st in zip((7, 5, 11), states):
+            self.assertIs(st.trace, trace)
+            self.assertEqual(st.quotients, bitUtils.mod_inverse_full(a, 23).quotients)
+
+    def test_copy_shares_and_forks(self):
+        """Test copies share the trace and fork on a conflicting append."""
+        state = bitUtils.mod_inverse_full(7, 23)
+        original = state.quotients.copy()
+        first, second = state.copy(), state.copy()
+        self.assertIs(first.trace, state.trace)
+        first.quotients.append(9)
+        self.assertIs(first.trace, state.trace)
+        second.quotients.append(4)
+        self.assertIsNot(second.trace, state.trace)
+        self.assertEqual(first.quotients, original + [9])
+        self.assertEqual(second.quotients, original + [4])
+        self.assertEqual(state.quotients, original)
+
+    def test_assign_list(self):
+        """Test assigning a plain list still works."""
+        state = bitUtils.mod_inverse_full(7, 23)
+        state.quotients = []
+        self.assertFalse(state.quotients)
+        state.quotients = [1, 2]
+        self.assertEqual(state.quotients, [1, 2])
+
+    def test_quotients_keyword(self):
+        """Test the quotients= and reconstructed_bits= constructor keywords."""
+        state = bitUtils.ModInverseState(old_r=1, r=0, old_s=1, s=0, step=2,
+                                         quotients=[3, 2**70], reconstructed_bits={0: 1})
+        self.assertEqual(state.quotients, [3, 2**70])
+        self.assertEqual(state.trace_end - state.trace_start, 2)
+        self.assertEqual(state.get_reconstructed_value(), 1)
+
+    def test_equality(self):
+        """Test states compare by value, not by trace identity."""
+        self.assertEqual(bitUtils.mod_inverse_full(3, 17), bitUtils.mod_inverse_full(3, 17))
+        self.assertNotEqual(bitUtils.mod_inverse_full(3, 17), bitUtils.mod_inverse_full(5, 17))
+        trace = bitUtils.QuotientTrace([1, 1])
+        shared = bitUtils.mod_inverse_full(7, 23, trace=trace)
+        own = bitUtils.mod_inverse_full(7, 23)
+        self.assertEqual(shared, own)
+        self.assertEqual(own, bitUtils.ModInverseState(own.old_r, own.r, own.old_s, own.s, own.step,
+                                                       quotients=list(own.quotients)))
+        changed = own.copy()
+        changed.quotients.append(1)
+        self.assertNotEqual(changed, own)
+
+    def test_reconstructed_bits(self):
+        """Test the int-backed bit map behaves like the dict it replaces."""
+        state = bitUtils.ModInverseState(old_r=1, r=0, old_s=1, s=0)
+        state.reconstructed_bits[0] = 1
+        state.reconstructed_bits[3] = 1
+        state.reconstructed_bits[5] = 0
+        copy = state.copy()
+        copy.reconstructed_bits[3] = 0
+        self.assertEqual(state.reconstructed_bits, {0: 1, 3: 1, 5: 0})
+        self.assertEqual(sorted(state.reconstructed_bits.items()), [(0, 1), (3, 1), (5, 0)])
+        self.assertEqual(state.get_reconstructed_value(), 0b1001)
+        self.assertEqual(state.bits_determined(), 3)
+        self.assertEqual(copy.get_reconstructed_value(), 0b0001)
+        with self.assertRaises(KeyError):
+            state.reconstructed_bits[1]
+
+
+class TestFormatting(unittest.TestCase):
+    """Test formatting helpers."""
+
+    def test_to_hex(self):
+        """Test to_hex pads and uppercases."""
+        self.assertEqual(bitUtils.to_hex(15, 2), '0x0F')
+
+    def test_to_bin(self):
+        """Test to_bin pads with zeros."""
+        self.assertEqual(bitUtils.to_bin(15, 8), '00001111')
+
+
+if __name__ == '__main__':
+    unittest.main()
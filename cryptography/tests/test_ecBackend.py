@@ -0,0 +1,171 @@
+"""
+Test suite for the EC backend layer
+
+Tests that every available backend agrees, and backend selection.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import unittest
+import hashlib
+import ecdsa
+
+from cryptography import ecBackend
+from config import TestKeys
+
+
+class TestBackendsAgree(unittest.TestCase):
+    """Test every available backend against the ecdsa library."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.private_key = bytes.fromhex(TestKeys.KEY1_HEX)
+        sk = ecdsa.SigningKey.from_string(cls.private_key, curve=ecdsa.SECP256k1)
+        cls.public_key = sk.get_verifying_key().to_string()
+        cls.compressed = sk.get_verifying_key().to_string("compressed")
+        cls.digest = hashlib.sha256(b'backend test').digest()
+        cls.backends = [ecBackend.get_backend(name) for name in ecBackend.available_backends()]
+
+    def test_public_key(self):
+        """Test public key derivation."""
+        for backend in self.backends:
+            if 'public_key' in backend.operations:
+                self.assertEqual(backend.public_key(self.private_key), self.public_key, backend.name)
+
+    def test_public_keys(self):
+        """Test batch public key derivation matches single derivation."""
+        private_keys = [self.private_key, bytes.fromhex(TestKeys.KEY2_HEX)]
+        for backend in self.backends:
+            if 'public_key' in backend.operations:
+                self.assertEqual(backend.public_keys(private_keys),
+                                 [backend.public_key(key) for key in private_keys], backend.name)
+        self.assertEqual(ecBackend.public_keys(private_keys)[0], self.public_key)
+
+    def test_sign_and_verify_across_backends(self):
+        """Test signatures from each backend verify on every backend."""
+        signers = [b for b in self.backends if 'sign_digest' in b.operations]
+        verifiers = [b for b in self.backends if 'verify_digest' in b.operations]
+        for signer in signers:
+            signature = signer.sign_digest(self.private_key, self.digest)
+            for verifier in verifiers:
+                self.assertTrue(verifier.verify_digest(self.public_key, signature, self.digest),
+                                (signer.name, verifier.name))
+                self.assertFalse(verifier.verify_digest(self.public_key, signature,
+                                                        hashlib.sha256(b'other').digest()),
+                                 (signer.name, verifier.name))
+
+    def test_verify_batch(self):
+        """Test batch verification reports exactly the invalid items on every backend."""
+        signature = ecBackend.get_backend('ecdsa').sign_digest(self.private_key, self.digest)
+        other = hashlib.sha256(b'other').digest()
+        items = [(self.public_key, signature, self.digest),
+                 (self.public_key, signature, other),
+                 (self.public_key, b'\x30\x00', self.digest),
+                 (self.public_key, signature, self.digest + b'\x00'),
+                 (b'\x00' * 64, signature, self.digest)]                 # not on curve
+        for backend in self.backends:
+            self.assertEqual(backend.verify_batch(items), [1, 2, 3, 4], backend.name)
+            self.assertFalse(backend.verify_digest(b'\x00' * 64, signature, self.digest), backend.name)
+            self.assertEqual(backend.verify_batch([]), [], backend.name)
+
+        items.append((b'\x05' + self.public_key, signature, self.digest))
+        items.append((self.compressed, signature, self.digest))
+        self.assertEqual(ecBackend.verify_batch(items), [1, 2, 3, 4, 5])
+        for name in ('ecdsa', 'ecdsaRR'):
+            ecBackend.set_backend(name)
+            try:
+                self.assertEqual(ecBackend.verify_batch(items), [1, 2, 3, 4, 5], name)
+            finally:
+                ecBackend.set_backend(None)
+
+    def test_decompress(self):
+        """Test compressed key decompression."""
+        for backend in self.backends:
+            if 'decompress' in backend.operations:
+                self.assertEqual(backend.decompress(self.compressed), self.public_key, backend.name)
+                with self.assertRaises(ValueError):
+                    backend.decompress(b'\x02' + b'\xff' * 32)
+
+    def test_raw_public_key(self):
+        """Test SEC encodings are converted to 64-byte keys."""
+        self.assertEqual(ecBackend.raw_public_key(self.public_key), self.public_key)
+        self.assertEqual(ecBackend.raw_public_key(b'\x04' + self.public_key), self.public_key)
+        self.assertEqual(ecBackend.raw_public_key(self.compressed), self.public_key)
+        with self.assertRaises(ValueError):
+            ecBackend.raw_public_key(b'\x05' + self.public_key)
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test calibration, overrides and per-operation fallback."""
+
+    def tearDown(self):
+        os.environ.pop(ecBackend.ENV_BACKEND, None)
+        ecBackend.set_backend(None)
+
+    def test_calibration_picks_fastest(self):
+        """Test the calibrated backend is the fastest measured one."""
+        ecBackend.set_backend(None)
+        active = ecBackend.active_backend()
+        timings = ecBackend.calibration_results()
+        self.assertEqual(set(timings), set(ecBackend.available_backends()))
+        self.assertEqual(active.name, min(timings, key=timings.get))
+
+    def test_calibrate_rounds(self):
+        """Test calibrate times every backend and rejects rounds < 1."""
+        timings = ecBackend.calibrate(rounds=1)
+        self.assertEqual(set(timings), set(ecBackend.available_backends()))
+        for rounds in (0, -1):
+            with self.assertRaises(ValueError):
+                ecBackend.calibrate(rounds=rounds)
+
+    def test_environment_override(self):
+        """Test EC_BACKEND forces the backend without calibrating."""
+        os.environ[ecBackend.ENV_BACKEND] = 'ecdsa'
+        ecBackend.set_backend(None)
+        self.assertEqual(ecBackend.active_backend().name, 'ecdsa')
+
+    def test_environment_override_unknown(self):
+        """Test an unknown EC_BACKEND warns and falls back to the fastest backend."""
+        os.environ[ecBackend.ENV_BACKEND] = 'no-such-backend'
+        ecBackend.set_backend(None)
+        with self.assertWarns(RuntimeWarning):
+            active = ecBackend.active_backend()
+        timings = ecBackend.calibration_results()
+        self.assertEqual(active.name, min(timings, key=timings.get))
+
+    def test_operation_fallback(self):
+        """Test operations the selected backend lacks use the next one."""
+        ecBackend.set_backend('ecdsaRR')
+        self.assertEqual(ecBackend.backend_for('public_key').name, 'ecdsaRR')
+        for operation in ecBackend.OPERATIONS:
+            self.assertIn(operation, ecBackend.backend_for(operation).operations)
+
+        private_key = bytes.fromhex(TestKeys.KEY2_HEX)
+        digest = hashlib.sha256(b'fallback').digest()
+        signature = ecBackend.sign_digest(private_key, digest)
+        self.assertTrue(ecBackend.verify_digest(ecBackend.public_key(private_key), signature, digest))
+
+    def test_unknown_backend(self):
+        """Test selecting an unavailable backend fails."""
+        with self.assertRaises(ValueError):
+            ecBackend.set_backend('no-such-backend')
+        with self.assertRaises(ValueError):
+            ecBackend.get_backend('no-such-backend')
+
+    @unittest.skipUnless(ecBackend.CoincurveBackend.available(), "coincurve not installed")
+    def test_coincurve_accepts_high_s(self):
+        """Test the native backend accepts high-S signatures like ECDSA does."""
+        n = ecdsa.SECP256k1.order
+        private_key = bytes.fromhex(TestKeys.KEY1_HEX)
+        digest = hashlib.sha256(b'high s').digest()
+        r, s = ecdsa.util.sigdecode_der(ecBackend.get_backend('ecdsa').sign_digest(private_key, digest), n)
+        high_s = ecdsa.util.sigencode_der(r, max(s, n - s), n)
+        backend = ecBackend.get_backend('coincurve')
+        self.assertTrue(backend.verify_digest(backend.public_key(private_key), high_s, digest))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,633 @@
+"""
+Test suite for ecdsaRR (custom secp256k1 implementation)
+
+Cross-checks the custom curve arithmetic against the standard
+ecdsa library and against the plain affine formulas.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import unittest
+import tempfile
+import hashlib
+import ecdsa
+import ecdsa.util
+
+from cryptography import ecdsaRR
+from cryptography.ecdsaRR import Point, Secp256k1, GeneratorTable
+from config import TestKeys
+
+
+def reference_public_key(private_key_hex):
+    """Public key (64 bytes hex, no prefix) from the standard ecdsa library."""
+    sk = ecdsa.SigningKey.from_string(bytes.fromhex(private_key_hex), curve=ecdsa.SECP256k1)
+    return sk.get_verifying_key().to_string().hex()
+
+
+class TestPoint(unittest.TestCase):
+    """Test the public Point type."""
+
+    def test_compact(self):
+        """Test Point uses __slots__ (no per-instance __dict__)."""
+        P = Point(1, 2)
+        self.assertFalse(hasattr(P, '__dict__'))
+        with self.assertRaises(AttributeError):
+            P.z = 3
+
+    def test_equality_and_hash(self):
+        """Test equality, hashing and infinity."""
+        self.assertEqual(Point(1, 2), Point(1, 2))
+        self.assertNotEqual(Point(1, 2), Point(1, 3))
+        self.assertNotEqual(Point(1, 2), (1, 2))
+        self.assertEqual(len({Point(1, 2), Point(1, 2), Point(None, None)}), 2)
+        self.assertTrue(Point(None, None).is_infinity())
+        self.assertFalse(Secp256k1.G.is_infinity())
+
+    def test_inlined_loops_handle_doubling_and_cancellation(self):
+        """Test the inlined additions hit P + P and P + (-P) correctly."""
+        G = Secp256k1.G
+        two = Secp256k1.point_double(G)
+        self.assertEqual(Secp256k1.double_and_add(2, G), two)
+        self.assertTrue(Secp256k1.double_and_add(0, G).is_infinity())
+        # k1 x G + k2 x G where the running sum meets the added point
+        self.assertEqual(Secp256k1.multi_scalar_multiply([1, 1], [G, G]), two)
+        self.assertTrue(Secp256k1.multi_scalar_multiply([1, Secp256k1.n - 1], [G, G]).is_infinity())
+
+
+class TestFieldReduction(unittest.TestCase):
+    """Test the secp256k1 field reduction layer."""
+
+    def tearDown(self):
+        Secp256k1.set_field_reduction('generic')
+
+    def test_reduce_special(self):
+        """Test shift-and-fold reduction matches % p, including edge values."""
+        p = ecdsaRR.Secp256k1Field.P
+        values = [0, 1, p - 1, p, p + 1, 2 * p, (1 << 256) - 1, 1 << 256,
+                  (p - 1) * (p - 1), (1 << 1030) + 12345, -1, -p, -(p - 1) * (p - 1)]
+        values += [int.from_bytes(hashlib.sha512(b'%d' % i).digest(), 'big') for i in range(20)]
+        for x in values:
+            self.assertEqual(ecdsaRR.Secp256k1Field.reduce_special(x), x % p, x)
+            self.assertEqual(x % ecdsaRR.SpecialFieldModulus(p), x % p, x)
+
+    def test_curve_with_special_reduction(self):
+        """Test point multiplication is unchanged under the special reduction."""
+        P = Secp256k1.point_multiply(0x5EED)
+        k = int.from_bytes(hashlib.sha256(b'field').digest(), 'big')
+        expected = (Secp256k1.point_multiply(k), Secp256k1.point_multiply(k, P))
+
+        Secp256k1.set_field_reduction('special')
+        self.assertEqual(Secp256k1.field_reduction(), 'special')
+        self.assertEqual((Secp256k1.point_multiply(k), Secp256k1.point_multiply(k, P)), expected)
+
+    def test_select_and_reject(self):
+        """Test selection picks a known reduction and unknown names fail."""
+        self.assertIn(Secp256k1.select_field_reduction(iterations=20), Secp256k1.FIELD_REDUCTIONS)
+        with self.assertRaises(ValueError):
+            Secp256k1.set_field_reduction('barrett')
+
+
+class TestJacobianArithmetic(unittest.TestCase):
+    """Test Jacobian-coordinate point operations."""
+
+    def test_roundtrip(self):
+        """Test affine -> Jacobian -> affine is the identity."""
+        J = Secp256k1.to_jacobian(Secp256k1.G)
+        self.assertEqual(Secp256k1.from_jacobian(J), Secp256k1.G)
+
+    def test_double_matches_affine(self):
+        """Test jacobian_double agrees with affine point_double."""
+        J = Secp256k1.jacobian_double(Secp256k1.to_jacobian(Secp256k1.G))
+        self.assertEqual(Secp256k1.from_jacobian(J), Secp256k1.point_double(Secp256k1.G))
+
+    def test_add_matches_affine(self):
+        """Test jacobian_add and mixed addition agree with point_add."""
+        G = Secp256k1.G
+        G2 = Secp256k1.point_double(G)
+        expected = Secp256k1.point_add(G, G2)
+
+        J2 = Secp256k1.jacobian_double(Secp256k1.to_jacobian(G))
+        self.assertEqual(Secp256k1.from_jacobian(
+            Secp256k1.jacobian_add(J2, Secp256k1.to_jacobian(G))), expected)
+        self.assertEqual(Secp256k1.from_jacobian(
+            Secp256k1.jacobian_add_affine(J2, G.x, G.y)), expected)
+
+    def test_add_special_cases(self):
+        """Test P + P doubles and P + (-P) is infinity."""
+        G = Secp256k1.G
+        JG = Secp256k1.to_jacobian(G)
+        self.assertEqual(Secp256k1.from_jacobian(Secp256k1.jacobian_add(JG, JG)),
+                         Secp256k1.point_double(G))
+        neg = Secp256k1.jacobian_add_affine(JG, G.x, Secp256k1.p - G.y)
+        self.assertTrue(Secp256k1.from_jacobian(neg).is_infinity())
+        self.assertEqual(Secp256k1.jacobian_add(Secp256k1.JACOBIAN_INFINITY, JG), JG)
+
+
+class TestPointMultiply(unittest.TestCase):
+    """Test scalar multiplication against the standard ecdsa library."""
+
+    def test_small_multiples(self):
+        """Test k*G matches repeated affine addition for small k."""
+        G = Secp256k1.G
+        acc = G
+        for k in range(2, 12):
+            acc = Secp256k1.point_add(acc, G)
+            self.assertEqual(Secp256k1.point_multiply(k), acc)
+
+    def test_special_scalars(self):
+        """Test k = 0, k = 1 and k = n."""
+        self.assertTrue(Secp256k1.point_multiply(0).is_infinity())
+        self.assertEqual(Secp256k1.point_multiply(1), Secp256k1.G)
+        self.assertTrue(Secp256k1.point_multiply(Secp256k1.n).is_infinity())
+
+    def test_matches_ecdsa_library(self):
+        """Test public keys match the standard ecdsa library."""
+        for key in (TestKeys.KEY1_HEX, TestKeys.KEY2_HEX, TestKeys.KEY3_HEX, '%064x' % (Secp256k1.n - 1)):
+            sk = ecdsaRR.SigningKey.from_string(bytes.fromhex(key))
+            self.assertEqual(sk.get_verifying_key().to_string().hex(), reference_public_key(key))
+
+    def test_arbitrary_point(self):
+        """Test k*P for a non-generator point."""
+        P = Secp256k1.point_multiply(0xDEADBEEF)
+        k = 0x1234567890ABCDEF
+        self.assertEqual(Secp256k1.point_multiply(k, P),
+                         Secp256k1.point_multiply((k * 0xDEADBEEF) % Secp256k1.n))
+
+
+class TestWNAF(unittest.TestCase):
+    """Test width-w NAF variable-base multiplication."""
+
+    def test_wnaf_digits(self):
+        """Test wNAF digits reconstruct k and respect the width bound."""
+        k = 0x0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D
+        for width in range(2, 8):
+            digits = Secp256k1.wnaf(k, width)
+            self.assertEqual(sum(d << i for i, d in enumerate(digits)), k)
+            for i, d in enumerate(digits):
+                if d:
+                    self.assertEqual(d % 2, 1)
+                    self.assertLess(abs(d), 1 << (width - 1))
+                    self.assertFalse(any(digits[i + 1:i + width]))
+
+    def test_wnaf_multiply_matches_double_and_add(self):
+        """Test every window width gives the same point."""
+        P = Secp256k1.point_multiply(0xC0FFEE)
+        k = 0xA2D43EFAC7E99B7E3CF4C07EBFEBB3C349D8F2B5B0E1062D9CEF93C170D22D4F
+        expected = Secp256k1.double_and_add(k, P)
+        for width in range(2, 8):
+            self.assertEqual(Secp256k1.wnaf_multiply(k, P, width), expected)
+        self.assertEqual(Secp256k1.point_multiply(k, P, window=3), expected)
+
+    def test_invalid_width(self):
+        """Test width below 2 is rejected."""
+        with self.assertRaises(ValueError):
+            Secp256k1.wnaf_multiply(5, Secp256k1.G, 1)
+
+
+class TestGLV(unittest.TestCase):
+    """Test GLV endomorphism-accelerated multiplication."""
+
+    SCALARS = [1, 2, 0xDEADBEEF, Secp256k1.lam, Secp256k1.n - 1,
+               0xA2D43EFAC7E99B7E3CF4C07EBFEBB3C349D8F2B5B0E1062D9CEF93C170D22D4F,
+               0x18E14A7B6A307F426A94F8114701E7C8E774E7F9A47E2C2035DB29A206321725]
+
+    def test_endomorphism(self):
+        """Test lambda × G == (beta * Gx, Gy)."""
+        phi_G = Secp256k1.double_and_add(Secp256k1.lam, Secp256k1.G)
+        self.assertEqual(phi_G, Point((Secp256k1.beta * Secp256k1.Gx) % Secp256k1.p, Secp256k1.Gy))
+
+    def test_decompose(self):
+        """Test k = k1 + k2*lambda (mod n) with ~128-bit halves."""
+        for k in self.SCALARS:
+            k1, k2 = Secp256k1.glv_decompose(k)
+            self.assertEqual((k1 + k2 * Secp256k1.lam) % Secp256k1.n, k)
+            self.assertLessEqual(abs(k1).bit_length(), 129)
+            self.assertLessEqual(abs(k2).bit_length(), 129)
+
+    def test_matches_ecdsa_library(self):
+        """Test GLV k × P against the standard ecdsa library."""
+        base = 0x0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D
+        P = Secp256k1.point_multiply(base)
+        P_standard = ecdsa.SECP256k1.generator * base
+        for k in self.SCALARS:
+            R = Secp256k1.glv_multiply(k, P)
+            R_standard = P_standard * k
+            self.assertEqual((R.x, R.y), (R_standard.x(), R_standard.y()))
+
+    def test_point_multiply_glv_flag(self):
+        """Test point_multiply gives the same result with and without GLV."""
+        P = Secp256k1.point_multiply(0xC0FFEE)
+        k = self.SCALARS[5]
+        self.assertEqual(Secp256k1.point_multiply(k, P, glv=True),
+                         Secp256k1.point_multiply(k, P, glv=False))
+
+
+class TestVerifyDigest(unittest.TestCase):
+    """Test native ECDSA verification against signatures from the ecdsa library."""
+
+    @classmethod
+    def setUpClass(cls):
+        key = bytes.fromhex(TestKeys.KEY3_HEX)
+        cls.sk_standard = ecdsa.SigningKey.from_string(key, curve=ecdsa.SECP256k1)
+        cls.vk = ecdsaRR.SigningKey.from_string(key).get_verifying_key()
+        cls.digest = hashlib.sha256(b'ecdsaRR verify').digest()
+
+    def tearDown(self):
+        Secp256k1.set_generator_table(None)
+
+    def test_verify_raw_signature(self):
+        """Test a raw r||s signature verifies."""
+        sig = self.sk_standard.sign_digest(self.digest)
+        self.assertTrue(self.vk.verify_digest(sig, self.digest))
+
+    def test_verify_der_signature(self):
+        """Test a DER signature verifies with sigdecode_der."""
+        sig = self.sk_standard.sign_digest(self.digest, sigencode=ecdsa.util.sigencode_der)
+        self.assertTrue(self.vk.verify_digest(sig, self.digest, sigdecode=ecdsaRR.sigdecode_der))
+        self.assertEqual(ecdsaRR.sigdecode_der(sig, Secp256k1.n),
+                         ecdsa.util.sigdecode_der(sig, Secp256k1.n))
+
+    def test_verify_with_and_without_table(self):
+        """Test both the table and the interleaved-G paths, with and without GLV."""
+        sig = self.sk_standard.sign_digest(self.digest)
+        for table in (None, GeneratorTable.build(width=4)):
+            Secp256k1.set_generator_table(table)
+            for glv in (True, False):
+                Secp256k1.USE_GLV = glv
+                try:
+                    self.assertTrue(self.vk.verify_digest(sig, self.digest))
+                finally:
+                    Secp256k1.USE_GLV = True
+
+    def test_reject_wrong_digest(self):
+        """Test a signature over another digest is rejected."""
+        sig = self.sk_standard.sign_digest(self.digest)
+        with self.assertRaises(ecdsaRR.BadSignatureError):
+            self.vk.verify_digest(sig, hashlib.sha256(b'other').digest())
+
+    def test_reject_wrong_key(self):
+        """Test a signature is rejected under another public key."""
+        sig = self.sk_standard.sign_digest(self.digest)
+        other = ecdsaRR.SigningKey.from_string(bytes.fromhex(TestKeys.KEY1_HEX)).get_verifying_key()
+        with self.assertRaises(ecdsaRR.BadSignatureError):
+            other.verify_digest(sig, self.digest)
+
+    def test_reject_out_of_range(self):
+        """Test r = 0 and s >= n are rejected."""
+        zero_r = bytes(32) + (1).to_bytes(32, 'big')
+        big_s = (1).to_bytes(32, 'big') + Secp256k1.n.to_bytes(32, 'big')
+        for sig in (zero_r, big_s):
+            with self.assertRaises(ecdsaRR.BadSignatureError):
+                self.vk.verify_digest(sig, self.digest)
+
+
+class TestVerifyBatch(unittest.TestCase):
+    """Test batch signature verification."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.items = []
+        for i in range(12):
+            key = hashlib.sha256(b'batch key %d' % (i % 3)).digest()
+            sk = ecdsa.SigningKey.from_string(key, curve=ecdsa.SECP256k1)
+            digest = hashlib.sha256(b'batch message %d' % i).digest()
+            cls.items.append((sk.get_verifying_key().to_string(), digest, sk.sign_digest(digest)))
+
+    def test_all_valid(self):
+        """Test a valid batch reports no failures."""
+        self.assertEqual(ecdsaRR.verify_batch(self.items), [])
+        self.assertEqual(ecdsaRR.verify_batch([]), [])
+
+    def test_failing_indices(self):
+        """Test the exact failing indices are reported."""
+        items = list(self.items)
+        pub, digest, sig = items[2]
+        items[2] = (pub, hashlib.sha256(b'wrong').digest(), sig)        # wrong digest
+        items[7] = (items[8][0], items[7][1], items[7][2])               # wrong key
+        items[9] = (items[9][0], items[9][1], bytes(64))                 # r = s = 0
+        items[10] = (b'\x00' * 64, items[10][1], items[10][2])          # not on curve
+        self.assertEqual(ecdsaRR.verify_batch(items), [2, 7, 9, 10])
+
+    def test_der_and_verifying_key_inputs(self):
+        """Test VerifyingKey objects and DER signatures are accepted."""
+        items = []
+        for pub, digest, sig in self.items[:4]:
+            r, s = ecdsa.util.sigdecode_string(sig, Secp256k1.n)
+            items.append((ecdsaRR.VerifyingKey.from_string(pub), digest,
+                          ecdsa.util.sigencode_der(r, s, Secp256k1.n)))
+        self.assertEqual(ecdsaRR.verify_batch(items, sigdecode=ecdsaRR.sigdecode_der), [])
+
+
+class TestMultiScalar(unittest.TestCase):
+    """Test multi-scalar multiplication (Strauss and Pippenger)."""
+
+    @classmethod
+    def setUpClass(cls):
+        keys = [int.from_bytes(hashlib.sha256(b'msm %d' % i).digest(), 'big') for i in range(40)]
+        cls.points = [Secp256k1.point_multiply(k) for k in keys[:20]]
+        cls.scalars = keys[20:]
+
+    def expected_sum(self, scalars, points):
+        R = Secp256k1.JACOBIAN_INFINITY
+        for k, P in zip(scalars, points):
+            R = Secp256k1.jacobian_add(R, Secp256k1.to_jacobian(Secp256k1.double_and_add(k % Secp256k1.n, P)))
+        return Secp256k1.from_jacobian(R)
+
+    def test_pippenger_widths(self):
+        """Test every bucket width, with and without GLV, gives the same sum."""
+        expected = self.expected_sum(self.scalars, self.points)
+        for width in range(1, 9):
+            for glv in (False, True):
+                R = Secp256k1.pippenger_jacobian(self.scalars, self.points, width, glv)
+                self.assertEqual(Secp256k1.from_jacobian(R), expected, (width, glv))
+
+    def test_strauss_and_pippenger_agree(self):
+        """Test both multi_scalar_multiply paths match."""
+        expected = self.expected_sum(self.scalars[:5], self.points[:5])
+        self.assertEqual(Secp256k1.multi_scalar_multiply(self.scalars[:5], self.points[:5]), expected)
+        self.assertEqual(Secp256k1.multi_scalar_multiply(self.scalars[:5], self.points[:5], width=3),
+                         expected)
+
+    def test_edge_cases(self):
+        """Test zero scalars, infinity, cancellation and repeated points."""
+        P = self.points[0]
+        n = Secp256k1.n
+        self.assertTrue(Secp256k1.multi_scalar_multiply([], []).is_infinity())
+        self.assertTrue(Secp256k1.multi_scalar_multiply([0, n], [P, P], width=4).is_infinity())
+        self.assertTrue(Secp256k1.multi_scalar_multiply([5, n - 5], [P, P], width=4).is_infinity())
+        self.assertEqual(Secp256k1.multi_scalar_multiply([3, 4, 7], [P, Point(None, None), P], width=2),
+                         Secp256k1.double_and_add(10, P))
+        with self.assertRaises(ValueError):
+            Secp256k1.multi_scalar_multiply([1, 2], [P])
+
+    def test_pippenger_width_grows(self):
+        """Test the chosen bucket width grows with the number of terms."""
+        widths = [Secp256k1.pippenger_width(count) for count in (1, 16, 256, 4096)]
+        self.assertEqual(widths, sorted(widths))
+        self.assertLess(widths[0], widths[-1])
+
+
+class TestSigning(unittest.TestCase):
+    """Test RFC 6979 signing."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.key = bytes.fromhex(TestKeys.KEY1_HEX)
+        cls.sk = ecdsaRR.SigningKey.from_string(cls.key)
+        cls.reference = ecdsa.SigningKey.from_string(cls.key, curve=ecdsa.SECP256k1)
+        cls.digests = [hashlib.sha256(b'sign %d' % i).digest() for i in range(12)]
+
+    def test_matches_reference_rfc6979(self):
+        """Test signatures equal the ecdsa library's RFC 6979 signatures (low-S)."""
+        n = Secp256k1.n
+        for digest in self.digests:
+            r, s = ecdsa.util.sigdecode_string(
+                self.reference.sign_digest_deterministic(digest, hashfunc=hashlib.sha256), n)
+            self.assertEqual(self.sk.sign_digest(digest, low_s=False), ecdsaRR.sigencode_string(r, s, n))
+            self.assertEqual(self.sk.sign_digest(digest), ecdsaRR.sigencode_string(r, min(s, n - s), n))
+
+    def test_low_s_and_verify(self):
+        """Test s <= n/2 and signatures verify with both implementations."""
+        vk = self.sk.get_verifying_key()
+        for digest in self.digests:
+            signature = self.sk.sign_digest(digest, sigencode=ecdsaRR.sigencode_der)
+            r, s = ecdsaRR.sigdecode_der(signature, Secp256k1.n)
+            self.assertLessEqual(s, Secp256k1.n // 2)
+            self.assertTrue(vk.verify_digest(signature, digest, sigdecode=ecdsaRR.sigdecode_der))
+            self.assertTrue(self.reference.get_verifying_key().verify_digest(
+                signature, digest, sigdecode=ecdsa.util.sigdecode_der))
+
+    def test_sign_many_matches_sign_digest(self):
+        """Test batch signing gives exactly the single signatures."""
+        self.assertEqual(self.sk.sign_many(self.digests),
+                         [self.sk.sign_digest(d) for d in self.digests])
+        self.assertEqual(self.sk.sign_many(self.digests[:3], sigencode=ecdsaRR.sigencode_der),
+                         [self.sk.sign_digest(d, sigencode=ecdsaRR.sigencode_der) for d in self.digests[:3]])
+        self.assertEqual(self.sk.sign_many([]), [])
+
+    def test_sigencode_der(self):
+        """Test DER encoding matches the ecdsa library, including padding."""
+        n = Secp256k1.n
+        for r, s in [(1, 1), (0x7F, 0x80), (n - 1, 2 ** 255), (2 ** 200 + 5, 12345)]:
+            self.assertEqual(ecdsaRR.sigencode_der(r, s, n), ecdsa.util.sigencode_der(r, s, n))
+            self.assertEqual(ecdsaRR.sigdecode_der(ecdsaRR.sigencode_der(r, s, n), n), (r, s))
+
+
+class TestCompressedKeys(unittest.TestCase):
+    """Test compressed (33-byte) public key parsing."""
+
+    def test_matches_ecdsa_library(self):
+        """Test decompressed keys match the ecdsa library for both parities."""
+        parities = set()
+        for i in range(8):
+            key = hashlib.sha256(b'compressed %d' % i).digest()
+            vk = ecdsa.SigningKey.from_string(key, curve=ecdsa.SECP256k1).get_verifying_key()
+            compressed = vk.to_string('compressed')
+            parities.add(compressed[0])
+            ours = ecdsaRR.VerifyingKey.from_string(compressed)
+            self.assertEqual(ours.to_string(), vk.to_string())
+            self.assertEqual(ours.to_string('compressed'), compressed)
+            self.assertEqual(ours.to_string('uncompressed'), vk.to_string('uncompressed'))
+        self.assertEqual(parities, {2, 3})
+
+    def test_uncompressed_prefix(self):
+        """Test 65-byte keys with the 04 prefix are accepted."""
+        vk = ecdsaRR.SigningKey.from_string(bytes.fromhex(TestKeys.KEY1_HEX)).get_verifying_key()
+        parsed = ecdsaRR.VerifyingKey.from_string(vk.to_string('uncompressed'))
+        self.assertEqual(parsed.public_point, vk.public_point)
+        with self.assertRaises(ValueError):
+            ecdsaRR.VerifyingKey.from_string(b'\x05' + vk.to_string())
+
+    def test_rejects_invalid(self):
+        """Test bad prefixes, lengths and x values off the curve are rejected."""
+        x = Secp256k1.Gx.to_bytes(32, 'big')
+        with self.assertRaises(ValueError):
+            ecdsaRR.VerifyingKey.from_string(b'\x04' + x)
+        with self.assertRaises(ValueError):
+            ecdsaRR.VerifyingKey.from_string(b'\x02' + x[:31])
+        with self.assertRaises(ValueError):
+            ecdsaRR.decompress_point(b'\x02' + Secp256k1.p.to_bytes(32, 'big'))
+        # x = 5: 5^3 + 7 = 132 is not a square mod p
+        with self.assertRaises(ValueError):
+            ecdsaRR.decompress_point(b'\x02' + (5).to_bytes(32, 'big'))
+        with self.assertRaises(ValueError):
+            ecdsaRR.VerifyingKey(Secp256k1.G).to_string('hybrid')
+
+    def test_cache_hits(self):
+        """Test repeated keys are served from the decompression cache."""
+        ecdsaRR.clear_decompression_cache()
+        compressed = b'\x02' + Secp256k1.Gx.to_bytes(32, 'big')
+        self.assertEqual(ecdsaRR.decompress_point(compressed), Secp256k1.G)
+        self.assertEqual(ecdsaRR.decompress_point(bytearray(compressed)), Secp256k1.G)
+        info = ecdsaRR.decompression_cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertEqual(info.maxsize, ecdsaRR.DECOMPRESSION_CACHE_SIZE)
+
+
+class TestVerifyingKeyCache(unittest.TestCase):
+    """Test per-key precomputation and the verifying key LRU."""
+
+    def setUp(self):
+        self.sk = ecdsaRR.SigningKey.from_string(bytes.fromhex(TestKeys.KEY2_HEX))
+        self.digests = [hashlib.sha256(b'hot %d' % i).digest() for i in range(4)]
+        self.signatures = self.sk.sign_many(self.digests)
+
+    def test_precomputed_verify(self):
+        """Test precomputed keys accept valid and reject invalid signatures."""
+        for width in (2, 4, 6):
+            vk = ecdsaRR.VerifyingKey(self.sk.get_verifying_key().public_point).precompute(width)
+            self.assertGreater(vk.precomputed_size(), 0)
+            for digest, signature in zip(self.digests, self.signatures):
+                self.assertTrue(vk.verify_digest(signature, digest))
+            with self.assertRaises(ecdsaRR.BadSignatureError):
+                vk.verify_digest(self.signatures[0], self.digests[1])
+
+    def test_precomputed_without_glv(self):
+        """Test the precomputed table also works with GLV disabled."""
+        vk = self.sk.get_verifying_key().precompute()
+        Secp256k1.USE_GLV = False
+        try:
+            self.assertTrue(vk.verify_digest(self.signatures[0], self.digests[0]))
+        finally:
+            Secp256k1.USE_GLV = True
+
+    def test_hits_and_precompute_on_reuse(self):
+        """Test a key is parsed once and precomputed on its second lookup."""
+        cache = ecdsaRR.VerifyingKeyCache(maxsize=2)
+        encoded = self.sk.get_verifying_key().to_string()
+        first = cache.get(encoded)
+        self.assertIsNone(first._precomputed)
+        self.assertEqual(cache.stats()['bytes_per_key'], 0)
+        self.assertIs(cache.get(encoded), first)
+        self.assertIsNotNone(first._precomputed)
+
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+        self.assertEqual(stats['bytes_per_key'], first.precomputed_size())
+
+    def test_eviction_and_invalid_keys(self):
+        """Test the LRU bound and that invalid keys raise without being cached."""
+        cache = ecdsaRR.VerifyingKeyCache(maxsize=2)
+        keys = [ecdsaRR.SigningKey.from_string((k).to_bytes(32, 'big')).get_verifying_key().to_string()
+                for k in (1, 2, 3)]
+        for key in keys:
+            cache.get(key)
+        self.assertEqual(len(cache), 2)
+        cache.get(keys[0])
+        self.assertEqual(cache.stats()['misses'], 4)
+        with self.assertRaises(ValueError):
+            cache.get(b'\x00' * 64)
+        self.assertEqual(len(cache), 2)
+        cache.resize(0)
+        self.assertEqual(len(cache), 0)
+
+
+class TestBatchPublicKeys(unittest.TestCase):
+    """Test batch public key derivation."""
+
+    def test_matches_single_keys(self):
+        """Test each batch key matches get_verifying_key."""
+        keys = [hashlib.sha256(b'pubkey %d' % i).digest() for i in range(10)]
+        batch = ecdsaRR.batch_public_keys(keys)
+        self.assertEqual(len(batch), len(keys))
+        for key, vk in zip(keys, batch):
+            single = ecdsaRR.SigningKey.from_string(key).get_verifying_key()
+            self.assertEqual(vk.to_string(), single.to_string())
+
+    def test_int_and_bytes_inputs(self):
+        """Test integers and 32-byte strings give the same keys."""
+        scalars = [1, 2, Secp256k1.n - 1]
+        from_ints = ecdsaRR.batch_public_keys(scalars)
+        from_bytes = ecdsaRR.batch_public_keys([k.to_bytes(32, 'big') for k in scalars])
+        self.assertEqual([vk.to_string() for vk in from_ints],
+                         [vk.to_string() for vk in from_bytes])
+        self.assertEqual(from_ints[0].to_string().hex(), reference_public_key('%064x' % 1))
+        self.assertEqual(ecdsaRR.batch_public_keys([]), [])
+
+    def test_rejects_out_of_range(self):
+        """Test zero and n are rejected."""
+        with self.assertRaises(ValueError):
+            ecdsaRR.batch_public_keys([1, 0])
+        with self.assertRaises(ValueError):
+            ecdsaRR.batch_public_keys([Secp256k1.n])
+
+
+class TestGeneratorTable(unittest.TestCase):
+    """Test the fixed-base table for G."""
+
+    def test_table_matches_double_and_add(self):
+        """Test table multiplication against generic double-and-add."""
+        table = GeneratorTable.build(width=4)
+        for k in (1, 2, 15, 16, 0xABCDEF, Secp256k1.n - 1):
+            self.assertEqual(Secp256k1.from_jacobian(table.multiply_jacobian(k)),
+                             Secp256k1.double_and_add(k, Secp256k1.G))
+
+    def test_save_and_load(self):
+        """Test a saved table is memory-mapped back with identical entries."""
+        table = GeneratorTable.build(width=4)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'gtable.bin')
+            table.save(path)
+            loaded = GeneratorTable.load(path)
+            self.assertEqual(loaded.width, 4)
+            self.assertEqual(loaded.entry(0), (Secp256k1.Gx, Secp256k1.Gy))
+            self.assertEqual(loaded.entry(table.size - 1), table.entry(table.size - 1))
+            k = 0x0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D
+            self.assertEqual(Secp256k1.from_jacobian(loaded.multiply_jacobian(k)),
+                             Secp256k1.from_jacobian(table.multiply_jacobian(k)))
+            loaded._buffer.close()
+
+    def test_load_rejects_bad_file(self):
+        """Test loading a file that is not a table raises ValueError."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bad.bin')
+            with open(path, 'wb') as f:
+                f.write(b'not a table at all')
+            with self.assertRaises(ValueError):
+                GeneratorTable.load(path)
+
+    def test_load_checks_width_and_length(self):
+        """Test the stored width must be valid and match the file length."""
+        table = GeneratorTable.build(width=4)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'gtable.bin')
+            table.save(path)
+            with open(path, 'rb') as f:
+                data = f.read()
+            header = GeneratorTable.HEADER_SIZE
+            for bad in (data[:header - 1] + b'\x00' + data[header:],   # width 0
+                        data[:header - 1] + b'\x05' + data[header:],   # width 5, size of width 4
+                        data[:-1],                                     # truncated
+                        data[:header] + bytes(64) + data[header + 64:],   # first entry not G
+                        data[:-64] + bytes([data[-64] ^ 1]) + data[-63:]):  # last entry corrupt
+                with open(path, 'wb') as f:
+                    f.write(bad)
+                with self.assertRaises(ValueError):
+                    GeneratorTable.load(path)
+
+    def test_bad_cache_file_is_rebuilt(self):
+        """Test a corrupt ECDSARR_G_TABLE file is replaced instead of failing."""
+        saved = Secp256k1._generator_table
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'gtable.bin')
+            with open(path, 'wb') as f:
+                f.write(b'stale cache')
+            os.environ[GeneratorTable.ENV_PATH] = path
+            Secp256k1._generator_table = None
+            try:
+                with self.assertWarns(RuntimeWarning):
+                    table = Secp256k1.generator_table()
+                self.assertEqual(Secp256k1.from_jacobian(table.multiply_jacobian(2)),
+                                 Secp256k1.double_and_add(2, Secp256k1.G))
+                GeneratorTable.load(path)._buffer.close()
+            finally:
+                os.environ.pop(GeneratorTable.ENV_PATH, None)
+                Secp256k1._generator_table = saved
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Test suite for the RIPEMD-160 / HASH160 backend layer
+
+Tests that every working backend agrees, and backend selection.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import unittest
+import hashlib
+
+from cryptography import hashBackend
+from cryptography.ripemd160 import digest as pure_ripemd160
+
+
+class TestBackendsAgree(unittest.TestCase):
+    """Test every working backend against the pure implementation."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.backends = [hashBackend.get_backend(name) for name in hashBackend.available_backends()]
+
+    def test_pure_always_available(self):
+        """Test the pure-Python backend passes the probe."""
+        self.assertIn('pure', hashBackend.available_backends())
+
+    def test_ripemd160(self):
+        """Test one-shot digests for several message sizes."""
+        for size in (0, 1, 32, 55, 56, 64, 65, 200):
+            message = bytes(range(size))
+            for backend in self.backends:
+                self.assertEqual(backend.ripemd160(message), pure_ripemd160(message),
+                                 (backend.name, size))
+
+    def test_incremental(self):
+        """Test hashlib-style objects from every backend."""
+        for backend in self.backends:
+            h = backend.new(b'ab')
+            h.update(b'c')
+            self.assertEqual(h.hexdigest(), '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc', backend.name)
+
+    def test_hash160(self):
+        """Test hash160 is RIPEMD-160 of SHA-256."""
+        pubkey = bytes.fromhex('0250863ad64a87ae8a2fe83c1af1a8403cb53f53e486d8511dad8a04887e5b2352')
+        self.assertEqual(hashBackend.hash160(pubkey),
+                         pure_ripemd160(hashlib.sha256(pubkey).digest()))
+        self.assertEqual(hashBackend.ripemd160(b'abc'), pure_ripemd160(b'abc'))
+        self.assertEqual(hashBackend.new(b'abc').digest(), pure_ripemd160(b'abc'))
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test the probe, overrides and the report."""
+
+    def tearDown(self):
+        os.environ.pop(hashBackend.ENV_BACKEND, None)
+        hashBackend.set_backend(None)
+
+    def test_probe_picks_fastest(self):
+        """Test the selected backend has the highest measured throughput."""
+        report = hashBackend.backend_report()
+        self.assertEqual(set(report['backends']), set(hashBackend.available_backends()))
+        rates = {name: r['hashes_per_sec'] for name, r in report['backends'].items()}
+        self.assertEqual(report['active'], max(rates, key=rates.get))
+        self.assertFalse(report['forced'])
+
+    def test_report_throughput(self):
+        """Test the report gives hashes/s and MB/s for 32-byte messages."""
+        for result in hashBackend.backend_report()['backends'].values():
+            self.assertGreater(result['hashes_per_sec'], 0)
+            self.assertAlmostEqual(result['mb_per_sec'],
+                                   result['hashes_per_sec'] * hashBackend.PROBE_SIZE / 1e6)
+
+    def test_environment_override(self):
+        """Test HASH160_BACKEND forces the backend."""
+        os.environ[hashBackend.ENV_BACKEND] = 'pure'
+        hashBackend.set_backend(None)
+        self.assertEqual(hashBackend.active_backend(), 'pure')
+        self.assertTrue(hashBackend.backend_report()['forced'])
+
+    def test_environment_override_unknown(self):
+        """Test an unknown HASH160_BACKEND warns and falls back to the fastest backend."""
+        os.environ[hashBackend.ENV_BACKEND] = 'no-such-backend'
+        with self.assertWarns(RuntimeWarning):
+            hashBackend.set_backend(None)
+        report = hashBackend.backend_report()
+        rates = {name: r['hashes_per_sec'] for name, r in report['backends'].items()}
+        self.assertEqual(report['active'], max(rates, key=rates.get))
+        self.assertFalse(report['forced'])
+        self.assertEqual(hashBackend.ripemd160(b''), pure_ripemd160(b''))
+
+    def test_set_backend(self):
+        """Test selecting a backend by name."""
+        hashBackend.set_backend('pure')
+        self.assertEqual(hashBackend.active_backend(), 'pure')
+        self.assertEqual(hashBackend.ripemd160(b''), pure_ripemd160(b''))
+
+    def test_unknown_backend(self):
+        """Test selecting a backend that did not pass the probe fails."""
+        with self.assertRaises(ValueError):
+            hashBackend.set_backend('no-such-backend')
+        with self.assertRaises(ValueError):
+            hashBackend.get_backend('no-such-backend')
+
+    def test_broken_backend_skipped(self):
+        """Test a backend that fails the test vectors is not selectable."""
+        class BrokenBackend(hashBackend.PureBackend):
+            name = 'broken'
+
+            def ripemd160(self, data):
+                return bytes(20)
+
+        hashBackend.BACKENDS.insert(0, BrokenBackend)
+        try:
+            hashBackend.set_backend(None)
+            self.assertNotIn('broken', hashBackend.available_backends())
+        finally:
+            hashBackend.BACKENDS.remove(BrokenBackend)
+
+
+if __name__ == '__main__':
+    unittest.main()
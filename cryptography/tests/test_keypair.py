@@ -13,7 +13,9 @@ import unittest
 import hashlib
 import ecdsa
 
-from cryptography.keypair import KeyPair
+from cryptography import ecdsaRR
+from cryptography import keypair as keypair_module
+from cryptography.keypair import KeyPair, PublicKeyCache
 from config import TestKeys
 
 
@@ -203,6 +205,25 @@ class TestKeyPairSigning(unittest.TestCase):
 
         self.assertFalse(is_valid)
 
+    def test_verify_malformed_on_every_backend(self):
+        """Test malformed inputs return False on every EC backend."""
+        from cryptography import ecBackend
+        keypair = KeyPair(TestKeys.KEY1_HEX)
+        message_hash = hashlib.sha256(b"Hello, Bitcoin!").digest()
+        signature = keypair.sign(message_hash)
+        malformed = [
+            (message_hash, signature.hex()),    # str signature
+            (message_hash, None),               # no signature
+            (message_hash * 2, signature),      # 64-byte digest
+        ]
+        try:
+            for name in ecBackend.available_backends():
+                ecBackend.set_backend(name)
+                for digest, bad_signature in malformed:
+                    self.assertFalse(keypair.verify(digest, bad_signature), (name, bad_signature))
+        finally:
+            ecBackend.set_backend(None)
+
 
 class TestKeyPairDeterministic(unittest.TestCase):
     """Test deterministic behavior."""
@@ -246,6 +267,157 @@ class TestKeyPairStringRepresentation(unittest.TestCase):
         self.assertNotIn(TestKeys.KEY2_HEX, str_repr)
 
 
+class TestKeyPairSignMany(unittest.TestCase):
+    """Test batch signing."""
+
+    def test_sign_many(self):
+        """Test every batch signature verifies."""
+        keypair = KeyPair(TestKeys.KEY1_HEX)
+        hashes = [hashlib.sha256(b'input %d' % i).digest() for i in range(5)]
+        signatures = keypair.sign_many(hashes)
+        self.assertEqual(len(signatures), len(hashes))
+        for message_hash, signature in zip(hashes, signatures):
+            self.assertTrue(keypair.verify(message_hash, signature))
+        self.assertFalse(keypair.verify(hashes[0], signatures[1]))
+
+    def test_verify_uses_verifying_key_cache(self):
+        """Test repeated verifies with the ecdsaRR backend hit the key cache."""
+        from cryptography import ecBackend, ecdsaRR
+        ecBackend.set_backend('ecdsaRR')
+        try:
+            ecdsaRR.verifying_key_cache.clear()
+            keypair = KeyPair(TestKeys.KEY2_HEX)
+            message_hash = hashlib.sha256(b'hot wallet').digest()
+            signature = keypair.sign(message_hash)
+            for _ in range(3):
+                self.assertTrue(keypair.verify(message_hash, signature))
+            stats = ecdsaRR.verifying_key_cache.stats()
+            self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+            self.assertGreater(stats['bytes_per_key'], 0)
+        finally:
+            ecBackend.set_backend(None)
+
+
+class TestPublicKeyCache(unittest.TestCase):
+    """Test the LRU public key cache."""
+
+    def test_hits_misses_and_eviction(self):
+        """Test counters and least-recently-used eviction."""
+        cache = PublicKeyCache(maxsize=2)
+        self.assertIsNone(cache.get('A'))
+        cache.put('A', 'pa')
+        cache.put('B', 'pb')
+        self.assertEqual(cache.get('A'), 'pa')    # A is now most recent
+        cache.put('C', 'pc')                      # evicts B
+        self.assertIsNone(cache.get('B'))
+        self.assertEqual(cache.get('C'), 'pc')
+
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (2, 2, 2))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(cache.stats()['hits'], 0)
+
+    def test_keypair_uses_cache(self):
+        """Test repeated KeyPairs for the same key hit the shared cache."""
+        keypair_module.public_key_cache.clear()
+        first = KeyPair(TestKeys.KEY1_HEX)
+        second = KeyPair(TestKeys.KEY1_HEX.lower())
+        self.assertEqual(first.publickey, second.publickey)
+        self.assertEqual(keypair_module.public_key_cache.stats()['hits'], 1)
+
+
+class TestCrossCheckPolicy(unittest.TestCase):
+    """Test the public key cross-check policy."""
+
+    def setUp(self):
+        keypair_module.public_key_cache.clear()
+
+    def tearDown(self):
+        KeyPair.set_cross_check_policy('always', sample_rate=100)
+        keypair_module.public_key_cache.clear()
+
+    def expected(self, private_key_hex):
+        sk = ecdsa.SigningKey.from_string(bytes.fromhex(private_key_hex), curve=ecdsa.SECP256k1)
+        return '04' + sk.get_verifying_key().to_string().hex()
+
+    def test_policies_give_same_keys(self):
+        """Test every policy derives the correct public key."""
+        for policy in KeyPair.CROSS_CHECK_POLICIES:
+            KeyPair.set_cross_check_policy(policy, sample_rate=2)
+            keypair_module.public_key_cache.clear()
+            for key in (TestKeys.KEY1_HEX, TestKeys.KEY2_HEX, TestKeys.GOBI_KEY):
+                self.assertEqual(KeyPair(key).publickey, self.expected(key), policy)
+
+    def test_sample_rate(self):
+        """Test 'sample' cross-checks 1 in N derivations."""
+        calls = []
+        original = keypair_module._derive_public_keys_ecdsa
+
+        def counting(private_key_hexes):
+            calls.extend(private_key_hexes)
+            return original(private_key_hexes)
+
+        keypair_module._derive_public_keys_ecdsa = counting
+        try:
+            KeyPair.set_cross_check_policy('sample', sample_rate=3)
+            for i in range(7):
+                KeyPair(hashlib.sha256(b'sample %d' % i).hexdigest())
+        finally:
+            keypair_module._derive_public_keys_ecdsa = original
+        # Derivations 0, 3 and 6 are cross-checked
+        self.assertEqual(len(calls), 3)
+
+    def test_public_keys_batch(self):
+        """Test batch derivation follows the policy and fills the cache."""
+        keys = [hashlib.sha256(b'batch %d' % i).hexdigest() for i in range(4)]
+        calls = []
+        original = keypair_module._derive_public_keys_ecdsa
+
+        def counting(private_key_hexes):
+            calls.extend(private_key_hexes)
+            return original(private_key_hexes)
+
+        keypair_module._derive_public_keys_ecdsa = counting
+        try:
+            self.assertEqual(KeyPair.public_keys(keys[:2]), [self.expected(k) for k in keys[:2]])
+            KeyPair.set_cross_check_policy('trust')
+            self.assertEqual(KeyPair.public_keys(keys), [self.expected(k) for k in keys])
+        finally:
+            keypair_module._derive_public_keys_ecdsa = original
+        # Only the first two were derived under 'always'; the rest were trusted
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(keypair_module.public_key_cache.stats()['hits'], 2)
+
+    def test_public_keys_batch_under_always(self):
+        """Test the default policy cross-checks a batch with one ecdsaRR batch call."""
+        keys = [hashlib.sha256(b'always %d' % i).hexdigest() for i in range(5)]
+        batches = []
+        original = ecdsaRR.batch_public_keys
+
+        def counting(scalars):
+            batches.append(len(scalars))
+            return original(scalars)
+
+        ecdsaRR.batch_public_keys = counting
+        try:
+            self.assertEqual(KeyPair.cross_check_policy, 'always')
+            self.assertEqual(KeyPair.public_keys(keys), [self.expected(k) for k in keys])
+        finally:
+            ecdsaRR.batch_public_keys = original
+        self.assertEqual(batches, [5])
+
+    def test_invalid_policy(self):
+        """Test unknown policies and sample rates are rejected."""
+        with self.assertRaises(ValueError):
+            KeyPair.set_cross_check_policy('never')
+        with self.assertRaises(ValueError):
+            KeyPair.set_cross_check_policy('sample', sample_rate=0)
+
+
 def run_tests():
     """Run all tests and print results."""
     loader = unittest.TestLoader()
@@ -259,6 +431,9 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestKeyPairSigning))
     suite.addTests(loader.loadTestsFromTestCase(TestKeyPairDeterministic))
     suite.addTests(loader.loadTestsFromTestCase(TestKeyPairStringRepresentation))
+    suite.addTests(loader.loadTestsFromTestCase(TestKeyPairSignMany))
+    suite.addTests(loader.loadTestsFromTestCase(TestPublicKeyCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestCrossCheckPolicy))
 
     # Run tests with verbose output
     runner = unittest.TextTestRunner(verbosity=2)
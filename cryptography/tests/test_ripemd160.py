@@ -14,10 +14,26 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+import hashlib
 import unittest
 from ripemd160 import RIPEMD160
 
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _hashlib_ripemd160():
+    """Return True if hashlib (OpenSSL) provides ripemd160."""
+    try:
+        hashlib.new('ripemd160')
+    except ValueError:
+        return False
+    return True
+
+
 class TestRIPEMD160(unittest.TestCase):
     """Test RIPEMD-160 hash function with official test vectors."""
 
@@ -152,15 +168,6 @@ class TestRIPEMD160UtilityFunctions(unittest.TestCase):
         self.assertEqual(makehex(255, 4), '00ff')
         self.assertEqual(makehex(0, 8), '00000000')
 
-    def test_makebin(self):
-        """Test binary formatting function."""
-        from ripemd160 import makebin
-
-        # Test basic conversion
-        self.assertEqual(makebin(0, 8), '00000000')
-        self.assertEqual(makebin(255, 8), '11111111')
-        self.assertEqual(makebin(1, 32), '00000000000000000000000000000001')
-
     def test_ROL(self):
         """Test rotate left operation."""
         from ripemd160 import ROL
@@ -173,15 +180,275 @@ class TestRIPEMD160UtilityFunctions(unittest.TestCase):
         # In 32-bit: should wrap around
         self.assertEqual(ROL(1, 31), 0x80000000)
 
-    def test_little_end(self):
-        """Test little-endian conversion."""
-        from ripemd160 import little_end
+class TestRIPEMD160Bytes(unittest.TestCase):
+    """Test the bytes-native core (digest, compress, padding)."""
+
+    def test_digest_vectors(self):
+        """Test digest() on raw bytes against the reference vectors."""
+        from ripemd160 import digest
+
+        self.assertEqual(digest(b'').hex(), '9c1185a5c5e9fc54612808977ee8f548b2258d31')
+        self.assertEqual(digest(b'abc').hex(), '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc')
+        self.assertEqual(digest(b'message digest').hex(),
+                         '5d0689ef49d2fae572b881b123a85ffa21595f36')
+
+    def test_padding_boundaries(self):
+        """Test lengths around the 55/56/64-byte padding boundaries."""
+        from ripemd160 import RIPEMD160Hash, digest, padding
+
+        for length in (54, 55, 56, 57, 63, 64, 65, 119, 120, 128):
+            message = bytes(range(length))
+            self.assertEqual((length + len(padding(length))) % 64, 0)
+            h = RIPEMD160Hash()
+            for i in range(length):
+                h.update(message[i:i + 1])
+            self.assertEqual(h.digest(), digest(message),
+                             f"byte-at-a-time updates should match digest at {length} bytes")
+            if _hashlib_ripemd160():
+                self.assertEqual(digest(message), hashlib.new('ripemd160', message).digest())
+
+    @unittest.skipUnless(_hashlib_ripemd160(), "hashlib has no ripemd160")
+    def test_matches_hashlib(self):
+        """Test digest() against hashlib for 0..200 byte messages."""
+        from ripemd160 import digest
+
+        for length in range(201):
+            message = bytes((i * 7 + length) & 0xFF for i in range(length))
+            self.assertEqual(digest(message), hashlib.new('ripemd160', message).digest())
+
+    def test_buffer_types(self):
+        """Test that bytes, bytearray and memoryview give the same digest."""
+        from ripemd160 import digest
+
+        message = bytes(range(150))
+        expected = digest(message)
+        self.assertEqual(digest(bytearray(message)), expected)
+        self.assertEqual(digest(memoryview(message)), expected)
+        self.assertEqual(digest(memoryview(b'xx' + message)[2:]), expected)
+
+    def test_compress_offset(self):
+        """Test compress() reads the block at the given offset."""
+        from ripemd160 import compress, H0
+
+        block = bytes(range(64))
+        self.assertEqual(compress(H0, b'\x00' * 64 + block, 64), compress(H0, block))
+
+    def test_hex_wrapper_rejects_odd_length(self):
+        """Test RIPEMD160() raises ValueError on a partial hex byte."""
+        with self.assertRaises(ValueError):
+            RIPEMD160('abc')
+
+
+class TestRIPEMD160Hash(unittest.TestCase):
+    """Test the streaming hashlib-style RIPEMD160Hash object."""
+
+    def test_chunked_updates(self):
+        """Test that any split of the input gives the one-shot digest."""
+        from ripemd160 import RIPEMD160Hash, digest
+
+        message = bytes(range(256)) * 2
+        expected = digest(message)
+        for chunk in (1, 7, 63, 64, 65, 200):
+            h = RIPEMD160Hash()
+            for i in range(0, len(message), chunk):
+                h.update(message[i:i + chunk])
+            self.assertEqual(h.digest(), expected, f"chunk size {chunk}")
+
+    def test_constructor_data(self):
+        """Test RIPEMD160Hash(data) matches update(data)."""
+        from ripemd160 import RIPEMD160Hash
+
+        h = RIPEMD160Hash()
+        h.update(b'abc')
+        self.assertEqual(RIPEMD160Hash(b'abc').hexdigest(), h.hexdigest())
+        self.assertEqual(h.hexdigest(), '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc')
+
+    def test_buffers_only_partial_block(self):
+        """Test that at most one partial block is kept between updates."""
+        from ripemd160 import RIPEMD160Hash
+
+        h = RIPEMD160Hash()
+        h.update(b'x' * 100)
+        self.assertEqual(len(h._buffer), 36)
+        h.update(b'x' * 28)
+        self.assertEqual(len(h._buffer), 0)
+
+    def test_copy_shares_midstate(self):
+        """Test copy() forks the state without affecting the original."""
+        from ripemd160 import RIPEMD160Hash, digest
+
+        prefix = RIPEMD160Hash(b'a' * 70)
+        fork = prefix.copy()
+        fork.update(b'b')
+        prefix.update(b'c')
+        self.assertEqual(fork.digest(), digest(b'a' * 70 + b'b'))
+        self.assertEqual(prefix.digest(), digest(b'a' * 70 + b'c'))
+
+    def test_digest_does_not_finalize(self):
+        """Test digest() can be called and the object updated afterwards."""
+        from ripemd160 import RIPEMD160Hash, digest
+
+        h = RIPEMD160Hash(b'abc')
+        first = h.digest()
+        self.assertEqual(h.digest(), first)
+        h.update(b'def')
+        self.assertEqual(h.digest(), digest(b'abcdef'))
+
+    def test_hashlib_attributes(self):
+        """Test name, digest_size and block_size match hashlib."""
+        from ripemd160 import RIPEMD160Hash
+
+        h = RIPEMD160Hash()
+        self.assertEqual((h.name, h.digest_size, h.block_size), ('ripemd160', 20, 64))
+
+
+class TestCompressVariants(unittest.TestCase):
+    """Test the loop and generated unrolled compression functions."""
+
+    def setUp(self):
+        import ripemd160
+        self.ripemd160 = ripemd160
+        self.selected = ripemd160.compress_selection()['selected']
+
+    def tearDown(self):
+        self.ripemd160.set_compress(self.selected)
+
+    def test_generated_module_up_to_date(self):
+        """Test ripemd160_unrolled.py matches generate_compress_source()."""
+        with open(self.ripemd160.UNROLLED_PATH) as f:
+            self.assertEqual(f.read(), self.ripemd160.generate_compress_source(),
+                             "Regenerate with: python cryptography/ripemd160.py --generate")
+
+    def test_variants_agree(self):
+        """Test both variants on varied states, blocks and offsets."""
+        r = self.ripemd160
+        state = r.H0
+        data = bytes((i * 37 + 11) & 0xFF for i in range(64 * 8))
+        for offset in range(0, len(data), 64):
+            loop = r.compress_loop(state, data, offset)
+            self.assertEqual(r.compress_unrolled(state, data, offset), loop)
+            state = loop
+
+    def test_digest_with_each_variant(self):
+        """Test digest() gives the reference vectors with either variant."""
+        for name in self.ripemd160.COMPRESS_VARIANTS:
+            self.ripemd160.set_compress(name)
+            self.assertEqual(self.ripemd160.digest(b'message digest').hex(),
+                             '5d0689ef49d2fae572b881b123a85ffa21595f36', name)
+
+    def test_select_compress(self):
+        """Test the gate only picks unrolled when it is COMPRESS_GATE faster."""
+        r = self.ripemd160
+        result = r.select_compress()
+        self.assertEqual(r.compress_selection(), result)
+        faster = result['unrolled_us'] <= result['loop_us'] * (1 - r.COMPRESS_GATE)
+        self.assertEqual(result['selected'], 'unrolled' if faster else 'loop')
+
+    def test_gate_is_lazy(self):
+        """Test importing and light use do not run the gate; sustained use does."""
+        import importlib.util
+        spec = importlib.util.spec_from_file_location('ripemd160_fresh', self.ripemd160.__file__)
+        r = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(r)
+        self.assertIsNone(r._compress_selection)
+
+        r.digest(b'short message')
+        self.assertIsNone(r._compress_selection)
+
+        r.digest(bytes(64 * r.COMPRESS_GATE_AFTER))
+        self.assertIn('loop_us', r.compress_selection())
+        self.assertEqual(r.digest(b'message digest').hex(),
+                         '5d0689ef49d2fae572b881b123a85ffa21595f36')
+
+    def test_set_compress_unknown(self):
+        """Test forcing an unknown variant raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.ripemd160.set_compress('no-such-variant')
+
+
+class TestBatchDigest(unittest.TestCase):
+    """Test batch_digest (NumPy lanes with per-message fallback)."""
+
+    def setUp(self):
+        import ripemd160
+        self.ripemd160 = ripemd160
+
+    @unittest.skipIf(numpy is None, "NumPy not installed")
+    def test_single_block_lanes(self):
+        """Test a batch of 32-byte digests (one block per lane)."""
+        messages = [hashlib.sha256(b'%d' % i).digest() for i in range(40)]
+        self.assertEqual(self.ripemd160.batch_digest(messages),
+                         [self.ripemd160.digest(m) for m in messages])
+
+    @unittest.skipIf(numpy is None, "NumPy not installed")
+    def test_mixed_lengths_keep_order(self):
+        """Test groups of different lengths (1-3 blocks) come back in input order."""
+        lengths = [0, 33, 55, 56, 64, 65, 130]
+        messages = [bytes([i & 0xFF]) * lengths[i % len(lengths)] for i in range(7 * 20)]
+        self.assertEqual(self.ripemd160.batch_digest(messages, min_lanes=2),
+                         [self.ripemd160.digest(m) for m in messages])
+
+    @unittest.skipIf(numpy is None, "NumPy not installed")
+    def test_lane_chunks(self):
+        """Test groups larger than BATCH_MAX_LANES are split correctly."""
+        r = self.ripemd160
+        messages = [bytes([i]) * 32 for i in range(50)]
+        saved = r.BATCH_MAX_LANES
+        r.BATCH_MAX_LANES = 16
+        try:
+            self.assertEqual(r.batch_digest(messages, min_lanes=1),
+                             [r.digest(m) for m in messages])
+        finally:
+            r.BATCH_MAX_LANES = saved
+
+    def test_fallback_without_numpy(self):
+        """Test the per-message path when NumPy is unavailable."""
+        r = self.ripemd160
+        saved, r.np = r.np, None
+        try:
+            self.assertEqual([d.hex() for d in r.batch_digest([b'', b'abc'])],
+                             ['9c1185a5c5e9fc54612808977ee8f548b2258d31',
+                              '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc'])
+        finally:
+            r.np = saved
+
+    def test_empty_and_buffer_types(self):
+        """Test an empty batch and bytearray/memoryview messages."""
+        r = self.ripemd160
+        self.assertEqual(r.batch_digest([]), [])
+        messages = [bytearray(b'abc'), memoryview(b'abc')] * 10
+        self.assertEqual(r.batch_digest(messages), [r.digest(b'abc')] * 20)
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    """Smoke test for benchmark_ripemd160.py (validation and timing)."""
+
+    def test_all_backends_pass_vectors(self):
+        """Test every available backend passes the published vectors."""
+        import benchmark_ripemd160 as bench
+
+        failures = bench.validate(bench.backends(), include_million=False)
+        self.assertIn('pure-unrolled', failures)
+        self.assertEqual({name: failed for name, failed in failures.items() if failed}, {})
+
+    def test_run_benchmark(self):
+        """Test results have hashes/s and MB/s, None where a backend does not apply."""
+        import benchmark_ripemd160 as bench
+
+        results = bench.run_benchmark(sizes=(0, 32, 2048), min_time=0.001,
+                                      names=['pure-loop', 'educational'])
+        self.assertEqual(set(results), {'pure-loop', 'educational'})
+        self.assertGreater(results['pure-loop'][32]['hashes_per_sec'], 0)
+        self.assertEqual(results['pure-loop'][0]['mb_per_sec'], 0)
+        self.assertIsNone(results['educational'][2048])
 
-        # Test hex conversion
-        self.assertEqual(little_end('12345678', 16), '78563412')
+    def test_module_benchmark(self):
+        """Test ripemd160.benchmark() cross-checks and times the educational version."""
+        from ripemd160 import benchmark
 
-        # Test binary conversion
-        self.assertEqual(little_end('0000000011111111', 2), '1111111100000000')
+        result = benchmark(count=2, min_time=0.001)
+        self.assertGreater(result['educational_us'], 0)
+        self.assertGreater(result['digest_us'], 0)
 
 
 def run_tests():
@@ -193,6 +460,11 @@ def run_tests():
     # Add all test cases
     suite.addTests(loader.loadTestsFromTestCase(TestRIPEMD160))
     suite.addTests(loader.loadTestsFromTestCase(TestRIPEMD160UtilityFunctions))
+    suite.addTests(loader.loadTestsFromTestCase(TestRIPEMD160Bytes))
+    suite.addTests(loader.loadTestsFromTestCase(TestRIPEMD160Hash))
+    suite.addTests(loader.loadTestsFromTestCase(TestCompressVariants))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchDigest))
+    suite.addTests(loader.loadTestsFromTestCase(TestBenchmarkHarness))
 
     # Run tests with verbose output
     runner = unittest.TextTestRunner(verbosity=2)
@@ -0,0 +1,348 @@
+"""
+Parallel quotient-statistics sweep for modular inversion studies.
+
+analyze_information_loss() in rollbackModInverseMechanism looks at one
+inversion at a time. This module runs mod_inverse_full over many random
+(a, p) pairs in a process pool and streams every result into mergeable
+histograms, so memory stays constant no matter how many samples:
+
+    - quotient distribution (exact counts for q < 256, bit-length buckets above)
+    - step counts (EEA iterations per inversion)
+    - bits lost per inversion (sum of quotient bit lengths, as in
+      analyze_information_loss)
+
+"Bits lost" is the repo's name for what a recorded quotient trace
+determines: the quotients are the continued fraction of a / p, so the
+bits each integer division discards are exactly the bits that recording
+its quotient pins down (and that rollback without quotients has to
+search for). The histogram therefore answers "how many bits does the
+trace determine per inversion"; it is kept under the bits_lost name so
+it lines up with analyze_information_loss and demo_bitcoin_scale.
+
+Each worker returns a QuotientStats for its chunk and the parent merges
+them as they arrive. Chunks are seeded from (seed, chunk index), so the
+totals do not depend on the number of workers. Results can be saved as a
+compressed NumPy .npz (NumPy is optional; everything else is pure Python).
+
+Usage:
+    python rollback/modInverseSweep.py --samples 1000000 --bits 256 --out sweep.npz
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cryptography.bitUtils import mod_inverse_full, print_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Quotients below this are counted exactly; larger ones by bit length
+QUOTIENT_EXACT = 256
+
+
+def _add_into(target: list, source: list):
+    """Element-wise target += source, growing target as needed."""
+    if len(target) < len(source):
+        target.extend([0] * (len(source) - len(target)))
+    for i, count in enumerate(source):
+        target[i] += count
+
+
+def _bump(histogram: list, index: int):
+    """histogram[index] += 1, growing the list as needed."""
+    if index >= len(histogram):
+        histogram.extend([0] * (index + 1 - len(histogram)))
+    histogram[index] += 1
+
+
+class QuotientStats:
+    """
+    Mergeable histograms of EEA behaviour over many inversions.
+
+    All histograms are plain lists of counts indexed by value, so two
+    QuotientStats combine by element-wise addition (merge) and pickle
+    cheaply between processes.
+
+    Attributes:
+        samples (int): Inversions recorded
+        no_inverse (int): Pairs skipped because gcd(a, p) != 1
+        quotient_counts (list): quotient_counts[q] for 0 <= q < QUOTIENT_EXACT
+        large_quotient_bits (list): Count of quotients >= QUOTIENT_EXACT by bit length
+        step_counts (list): step_counts[n] = inversions that took n steps
+        bits_lost_counts (list): bits_lost_counts[b] = inversions whose
+            quotients total b bits (the bits lost to division, which are
+            the bits the recorded quotients determine)
+    """
+
+    def __init__(self):
+        self.samples = 0
+        self.no_inverse = 0
+        self.quotient_counts = [0] * QUOTIENT_EXACT
+        self.large_quotient_bits = []
+        self.step_counts = []
+        self.bits_lost_counts = []
+
+    def add_quotients(self, quotients):
+        """
+        Record one inversion from its quotient sequence.
+
+        Args:
+            quotients: Quotients of one mod_inverse_full run, in order
+        """
+        counts = self.quotient_counts
+        total_bits = 0
+        for q in quotients:
+            if q < QUOTIENT_EXACT:
+                counts[q] += 1
+                total_bits += q.bit_length() or 1
+            else:
+                bits = q.bit_length()
+                _bump(self.large_quotient_bits, bits)
+                total_bits += bits
+        _bump(self.step_counts, len(quotients))
+        _bump(self.bits_lost_counts, total_bits)
+        self.samples += 1
+
+    def merge(self, other: 'QuotientStats') -> 'QuotientStats':
+        """
+        Add another QuotientStats into this one.
+
+        Args:
+            other: Stats from another chunk or run
+
+        Returns:
+            self, for chaining
+        """
+        self.samples += other.samples
+        self.no_inverse += other.no_inverse
+        _add_into(self.quotient_counts, other.quotient_counts)
+        _add_into(self.large_quotient_bits, other.large_quotient_bits)
+        _add_into(self.step_counts, other.step_counts)
+        _add_into(self.bits_lost_counts, other.bits_lost_counts)
+        return self
+
+    def total_quotients(self) -> int:
+        """Number of quotients recorded across all samples."""
+        return sum(self.quotient_counts) + sum(self.large_quotient_bits)
+
+    def summary(self) -> dict:
+        """
+        Get headline numbers.
+
+        Returns:
+            dict: {'samples', 'no_inverse', 'quotients', 'mean_steps',
+                   'mean_bits_lost', 'max_steps', 'gauss_kuzmin'}, where
+                   gauss_kuzmin maps q in 1..5 to (observed, expected)
+                   frequency among quotients >= 1. Quotients of a random
+                   continued fraction follow Gauss-Kuzmin:
+                   P(q = k) = -log2(1 - 1/(k+1)^2)
+        """
+        def mean(histogram):
+            total = sum(histogram)
+            return sum(i * c for i, c in enumerate(histogram)) / total if total else 0.0
+
+        positive = self.total_quotients() - self.quotient_counts[0]
+        gauss_kuzmin = {
+            k: (self.quotient_counts[k] / positive if positive else 0.0,
+                -math.log2(1 - 1 / (k + 1) ** 2))
+            for k in range(1, 6)
+        }
+        return {
+            'samples': self.samples,
+            'no_inverse': self.no_inverse,
+            'quotients': self.total_quotients(),
+            'mean_steps': mean(self.step_counts),
+            'mean_bits_lost': mean(self.bits_lost_counts),
+            'max_steps': len(self.step_counts) - 1,
+            'gauss_kuzmin': gauss_kuzmin,
+        }
+
+    def save_npz(self, path: str, **params):
+        """
+        Save the histograms as a compressed NumPy archive.
+
+        Args:
+            path: Output file (.npz)
+            **params: Extra integer metadata to store (e.g. bits=256, seed=0)
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required to save .npz files (pip install numpy)")
+        meta = {'samples': self.samples, 'no_inverse': self.no_inverse, **params}
+        np.savez_compressed(
+            path,
+            quotient_counts=np.array(self.quotient_counts, dtype=np.int64),
+            large_quotient_bits=np.array(self.large_quotient_bits, dtype=np.int64),
+            step_counts=np.array(self.step_counts, dtype=np.int64),
+            bits_lost_counts=np.array(self.bits_lost_counts, dtype=np.int64),
+            meta_keys=np.array(list(meta)),
+            meta_values=np.array(list(meta.values()), dtype=np.int64),
+        )
+
+    @classmethod
+    def load_npz(cls, path: str) -> 'QuotientStats':
+        """
+        Load histograms written by save_npz (merge() them to combine runs).
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required to load .npz files (pip install numpy)")
+        stats = cls()
+        with np.load(path) as data:
+            stats.quotient_counts = data['quotient_counts'].tolist()
+            stats.large_quotient_bits = data['large_quotient_bits'].tolist()
+            stats.step_counts = data['step_counts'].tolist()
+            stats.bits_lost_counts = data['bits_lost_counts'].tolist()
+            meta = dict(zip(data['meta_keys'].tolist(), data['meta_values'].tolist()))
+        stats.samples = meta['samples']
+        stats.no_inverse = meta['no_inverse']
+        return stats
+
+
+# ============================================================================
+# SWEEP ENGINE
+# ============================================================================
+
+def _random_pair(rng: random.Random, bits: int, p: int = None) -> tuple:
+    """Random (a, p): a in [1, p-1]; p random odd with its top bit set if not given."""
+    if p is None:
+        p = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+    return rng.randrange(1, p), p
+
+
+def sweep_chunk(seed: int, chunk: int, count: int, bits: int, p: int = None) -> QuotientStats:
+    """
+    Run one chunk of the sweep (the unit of work sent to a worker).
+
+    Args:
+        seed: Sweep seed
+        chunk: Chunk index (mixed into the seed, so chunks are independent)
+        count: Inversions in this chunk
+        bits: Modulus size when p is None
+        p: Fixed modulus, or None for a random odd modulus per sample
+
+    Returns:
+        QuotientStats for this chunk
+    """
+    rng = random.Random(seed * 1_000_003 + chunk)
+    stats = QuotientStats()
+    for _ in range(count):
+        a, modulus = _random_pair(rng, bits, p)
+        try:
+            state = mod_inverse_full(a, modulus)
+        except ValueError:
+            stats.no_inverse += 1
+            continue
+        stats.add_quotients(state.trace[state.trace_start:state.trace_end])
+    return stats
+
+
+def sweep(samples: int, bits: int = 256, p: int = None, workers: int = None,
+          chunk_size: int = 10_000, seed: int = 0, progress=None) -> QuotientStats:
+    """
+    Collect quotient statistics over many random inversions.
+
+    Args:
+        samples: Number of (a, p) pairs to draw
+        bits: Modulus size in bits (when p is None)
+        p: Fixed modulus (random a only), or None for random odd moduli
+            (pairs with gcd(a, p) != 1 are counted in no_inverse)
+        workers: Worker processes (default os.cpu_count(); 1 runs in-process)
+        chunk_size: Samples per work unit
+        seed: Base seed; the same seed gives the same totals for any
+            number of workers
+        progress: Optional callback(samples_done, elapsed_sec) per chunk
+
+    Returns:
+        Merged QuotientStats
+    """
+    if bits < 2 and p is None:
+        raise ValueError("bits must be at least 2")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    chunks = [(seed, index, min(chunk_size, samples - start), bits, p)
+              for index, start in enumerate(range(0, samples, chunk_size))]
+    total = QuotientStats()
+    start_time = time.perf_counter()
+
+    def collect(results):
+        done = 0
+        for stats in results:
+            total.merge(stats)
+            done += stats.samples + stats.no_inverse
+            if progress:
+                progress(done, time.perf_counter() - start_time)
+
+    if workers <= 1 or len(chunks) <= 1:
+        collect(sweep_chunk(*args) for args in chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            collect(pool.map(sweep_chunk, *zip(*chunks)))
+    return total
+
+
+def print_summary(stats: QuotientStats, elapsed: float = None):
+    """Print the headline numbers and the Gauss-Kuzmin comparison."""
+    summary = stats.summary()
+    print(f"Samples:        {summary['samples']:,} (+{summary['no_inverse']:,} without inverse)")
+    print(f"Quotients:      {summary['quotients']:,}")
+    print(f"Mean steps:     {summary['mean_steps']:.2f} (max {summary['max_steps']})")
+    print(f"Mean bits lost: {summary['mean_bits_lost']:.2f}")
+    if elapsed:
+        rate = (summary['samples'] + summary['no_inverse']) / elapsed
+        print(f"Throughput:     {rate:,.0f} inversions/sec ({elapsed:.2f}s)")
+    rows = [[k, f"{observed:.4f}", f"{expected:.4f}"]
+            for k, (observed, expected) in summary['gauss_kuzmin'].items()]
+    print_table(["q", "observed", "Gauss-Kuzmin"], rows, "Quotient distribution (q >= 1)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel mod_inverse quotient statistics")
+    parser.add_argument('--samples', type=int, default=100_000, help='Inversions to run')
+    parser.add_argument('--bits', type=int, default=256, help='Modulus size in bits')
+    parser.add_argument('--prime', action='store_true',
+                        help='Use the secp256k1 field prime instead of random moduli')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes')
+    parser.add_argument('--chunk-size', type=int, default=10_000, help='Samples per work unit')
+    parser.add_argument('--seed', type=int, default=0, help='Base seed')
+    parser.add_argument('--out', default=None, help='Write histograms to this .npz file')
+    args = parser.parse_args()
+
+    p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F if args.prime else None
+    print("=" * 70)
+    print("MOD_INVERSE QUOTIENT SWEEP")
+    print("=" * 70)
+
+    def report(done, elapsed):
+        print(f"  {done:,}/{args.samples:,} ({done / elapsed:,.0f}/s)", end='\r')
+
+    start = time.perf_counter()
+    stats = sweep(args.samples, bits=args.bits, p=p, workers=args.workers,
+                  chunk_size=args.chunk_size, seed=args.seed, progress=report)
+    elapsed = time.perf_counter() - start
+    print()
+    print_summary(stats, elapsed)
+
+    if args.out:
+        stats.save_npz(args.out, bits=args.bits, seed=args.seed, prime=int(args.prime))
+        print(f"\nSaved histograms to {args.out}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,12 @@ The mechanism operates on mod_inverse_step, not the full mod_inverse function.
 import sys
 import os
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from typing import Optional, Dict
-from cryptography.bitUtils import ModInverseState, mod_inverse_full, print_table
+from cryptography.bitUtils import ModInverseState, ReconstructedBits, mod_inverse_full, print_table
 
 
 def mod_inverse_step_reverse(state: ModInverseState, quotient: int) -> ModInverseState:
@@ -24,6 +25,8 @@ def mod_inverse_step_reverse(state: ModInverseState, quotient: int) -> ModInvers
 
     Forward: (old_r, r) -> (r, old_r - q*r)
     Reverse: prev_old_r = r + q * old_r, prev_r = old_r
+
+    The result shares the state's quotient trace (no copy).
     """
     return ModInverseState(
         old_r=state.r + quotient * state.old_r,
@@ -31,101 +34,251 @@ def mod_inverse_step_reverse(state: ModInverseState, quotient: int) -> ModInvers
         old_s=state.s + quotient * state.old_s,
         s=state.old_s,
         step=state.step - 1,
-        quotients=state.quotients.copy()
+        trace=state.trace,
+        trace_start=state.trace_start,
+        trace_end=state.trace_end
     )
 
 
 def rollback_with_quotients(state: ModInverseState, n_steps: int) -> ModInverseState:
-    """Roll back n steps using state's quotients."""
+    """
+    Roll back n steps using state's quotients.
+
+    Raises:
+        ValueError: If the state has no recorded quotients (trace is None);
+            use rollback_without_quotients to search for them
+    """
+    if n_steps > 0 and state.trace is None:
+        raise ValueError("State has no recorded quotients to roll back with; "
+                         "use rollback_without_quotients")
     result = state.copy()
-    for i in range(n_steps):
-        q_idx = len(state.quotients) - 1 - i
-        result = mod_inverse_step_reverse(result, state.quotients[q_idx])
+    # Read the last n quotients from the shared trace once, newest first
+    end = state.trace_end
+    quotients = state.trace[max(end - n_steps, state.trace_start):end] if n_steps > 0 else []
+    for quotient in reversed(quotients):
+        result = mod_inverse_step_reverse(result, quotient)
     return result
 
 
+# Nodes between timeout checks in the search loop
+_CLOCK_INTERVAL = 1024
+
+# Seconds to wait, after the deadline, for running parallel branches to report
+_DEADLINE_GRACE_SEC = 0.25
+
+
+def _quotient_range(old_r: int, r: int, old_s: int, s: int, step: int,
+                    known_p: int, prune: bool, max_q: int):
+    """
+    Candidate quotients for reversing the step that produced this state.
+
+    The reverse step is prev = (r + q*old_r, old_r, s + q*old_s, old_s).
+
+    Without pruning: 0 <= q <= max_q with prev_old_r <= p, and
+    prev_old_r > prev_r for q > 0 (the original bound checks).
+
+    With continued-fraction pruning (step = t, producing state t-1):
+        - remainders never exceed p:      q <= (p - r) // old_r
+        - r_0 = a < r_1 = p:              q = 0 exactly when t = 1
+        - r_{t-1} > r_t for t >= 2:       q >= 1
+        - the s_i are the continuants of a/p: |s_{t-1}| < |s_t| with
+          alternating signs for t >= 2 (|s_2| = |s_3| = 1 is possible
+          when q_2 = 1, so t = 3 allows equality). s + q*old_s must land
+          in (-|old_s|, |old_s|) with the opposite sign of old_s. That
+          leaves q within one of floor(-s/old_s), and the sign picks
+          one: each level has at most one child.
+    """
+    if old_r <= 0:
+        return ()
+    q_hi = (known_p - r) // old_r
+    if not prune:
+        return range(min(max_q, q_hi) + 1)
+    if step == 1:
+        return (0,) if q_hi >= 0 else ()
+    if old_s == 0:
+        return ()
+    f = (-s) // old_s
+    limit = abs(old_s) + (1 if step == 3 else 0)
+    result = []
+    for q in (f - 1, f, f + 1):
+        if 1 <= q <= q_hi:
+            prev_old_s = s + q * old_s
+            if abs(prev_old_s) < limit and prev_old_s * old_s <= 0:
+                result.append(q)
+    return result
+
+
+def _search(root: tuple, known_p: int, prune: bool, memo: bool, max_q: int,
+            max_candidates: int, deadline: float) -> tuple:
+    """
+    Iterative depth-first search from one reverse-search node.
+
+    Nodes are (old_r, r, old_s, s, step, path), where path is a linked
+    list (q, parent_path) of the quotients chosen so far, earliest first
+    when unwound. With memo, each (old_r, r, old_s, s, step) is expanded
+    once: paths that revisit a state (e.g. pairs of q = 0 swaps in the
+    unpruned search) collapse into one.
+
+    Returns:
+        (candidates, nodes_explored, timed_out), candidates being
+        (old_r, r, quotient list) at the initial state
+    """
+    candidates = []
+    seen = set()
+    stack = [root]
+    nodes = 0
+    clock = time.perf_counter
+    while stack:
+        old_r, r, old_s, s, step, path = stack.pop()
+        nodes += 1
+        if nodes % _CLOCK_INTERVAL == 0 and clock() > deadline:
+            return candidates, nodes, True
+
+        if memo:
+            key = (old_r, r, old_s, s, step)
+            if key in seen:
+                continue
+            seen.add(key)
+
+        if step == 0:
+            # Reached initial state - validate
+            if old_s == 1 and s == 0 and r == known_p:
+                quotients = []
+                while path is not None:
+                    q, path = path
+                    quotients.append(q)
+                candidates.append((old_r, r, quotients))
+                if len(candidates) >= max_candidates:
+                    return candidates, nodes, False
+            continue
+
+        qs = _quotient_range(old_r, r, old_s, s, step, known_p, prune, max_q)
+        # Push in reverse so small quotients are explored first
+        for q in reversed(qs):
+            prev_old_r = r + q * old_r
+            prev_r = old_r
+            # EEA constraint: old_r > r (except possibly q=0)
+            if not prune and q > 0 and prev_old_r <= prev_r:
+                continue
+            stack.append((prev_old_r, prev_r, s + q * old_s, old_s, step - 1, (q, path)))
+    return candidates, nodes, False
+
+
+def _search_worker(args: tuple) -> tuple:
+    """
+    Process-pool entry point: _search on one top-level branch.
+
+    The deadline arrives as wall-clock time (time.time()), since
+    perf_counter values are not comparable between processes, and is
+    converted to this process's perf_counter.
+    """
+    root, known_p, prune, memo, max_q, max_candidates, wall_deadline = args
+    return _search(root, known_p, prune, memo, max_q, max_candidates,
+                   time.perf_counter() + (wall_deadline - time.time()))
+
+
 def rollback_without_quotients(state: ModInverseState, known_p: int,
                                 timeout_sec: float = 30.0,
                                 max_q: int = 100,
-                                max_candidates: int = 100000) -> ModInverseState:
+                                max_candidates: int = 100000,
+                                prune: bool = True,
+                                memo: bool = True,
+                                workers: int = 1) -> ModInverseState:
     """
-    Attempt rollback WITHOUT quotients (brute force).
+    Attempt rollback WITHOUT quotients (search).
+
+    Makes a copy, clears quotients, tries to recover them by searching
+    backwards from the final state. The search is iterative (explicit
+    stack), checks the clock every _CLOCK_INTERVAL nodes, and can split
+    the top-level quotient branches across worker processes.
 
-    Makes a copy, clears quotients, tries to recover them via brute force.
     Returns state with recovered quotients and reconstructed_bits.
 
     Args:
         state: Final state from mod_inverse_full (quotients will be ignored)
         known_p: The modulus p (used to validate candidates)
         timeout_sec: Timeout in seconds (default 30)
-        max_q: Maximum quotient value to try per step
+        max_q: Maximum quotient value to try per step (unpruned search only;
+            the pruned search derives its own bounds)
         max_candidates: Maximum candidates to track
+        prune: Use continued-fraction bounds on each quotient (see
+            _quotient_range); False gives the original bound checks
+        memo: Expand each visited state only once
+        workers: Processes for the top-level branches (1 = in-process); all
+            branches share one deadline, timeout_sec from the call. Only
+            helps with prune=False: the pruned search has at most one
+            branch per level, and fewer than 2 top-level branches always
+            run in-process
 
     Returns:
         ModInverseState with:
             - quotients: recovered quotient sequence (if found)
             - reconstructed_bits: {pos: bit} for bits determined across all candidates
+            - _rollback_meta: candidates, elapsed_sec, timed_out, nodes,
+              nodes_per_sec
     """
-    start_time = time.time()
-    num_steps = state.step
-
-    # Work with a clean copy (no quotients)
-    work_state = state.copy()
-    work_state.quotients = []
-    work_state.reconstructed_bits = {}
-
-    candidates = []  # List of (old_r, r, quotient_sequence)
-
-    def recurse(s: ModInverseState, depth: int, quotients: list):
-        """Recursively try quotient values."""
-        # Check timeout
-        if time.time() - start_time > timeout_sec:
-            return
-        if len(candidates) >= max_candidates:
-            return
-
-        if depth == 0:
-            # Reached initial state - validate
-            if s.old_s != 1 or s.s != 0:
-                return
-            if s.r != known_p:
-                return
-            candidates.append((s.old_r, s.r, quotients.copy()))
-            return
-
-        # Try different quotient values
-        for q in range(0, max_q + 1):
-            if time.time() - start_time > timeout_sec:
-                return
-
-            prev_old_r = s.r + q * s.old_r
-            prev_r = s.old_r
-            prev_old_s = s.s + q * s.old_s
-            prev_s = s.old_s
-
-            # EEA constraint: old_r > r (except possibly q=0)
-            if q > 0 and prev_old_r <= prev_r:
-                continue
-            if prev_old_r > known_p:
+    start_time = time.perf_counter()
+    deadline = start_time + timeout_sec
+    root = (state.old_r, state.r, state.old_s, state.s, state.step, None)
+
+    # Expand the root here, one subtree per worker task
+    branches = []
+    if workers > 1 and state.step > 0:
+        old_r, r, old_s, s, step, _ = root
+        for q in _quotient_range(old_r, r, old_s, s, step, known_p, prune, max_q):
+            prev_old_r = r + q * old_r
+            if not prune and q > 0 and prev_old_r <= old_r:
                 continue
+            branches.append((prev_old_r, old_r, s + q * old_s, old_s, step - 1, (q, None)))
 
-            prev_state = ModInverseState(
-                old_r=prev_old_r, r=prev_r,
-                old_s=prev_old_s, s=prev_s,
-                step=s.step - 1
-            )
-            recurse(prev_state, depth - 1, [q] + quotients)
-
-    # Run brute force
-    recurse(work_state, num_steps, [])
-
-    elapsed = time.time() - start_time
-    timed_out = elapsed >= timeout_sec
+    if len(branches) < 2:
+        # Nothing to split (one worker, or a single branch as with pruning):
+        # a process pool would only add start-up cost
+        candidates, nodes, timed_out = _search(root, known_p, prune, memo, max_q,
+                                               max_candidates, deadline)
+    else:
+        # One absolute deadline for the whole search, shared by every task
+        wall_deadline = time.time() + (deadline - time.perf_counter())
+        tasks = [(branch, known_p, prune, memo, max_q, max_candidates, wall_deadline)
+                 for branch in reversed(branches)]
+        candidates, nodes, timed_out = [], 1, False
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            # Keep at most `workers` branches in flight, so branches not yet
+            # started when the deadline passes are never submitted
+            pending = set()
+            while tasks or pending:
+                while tasks and len(pending) < workers:
+                    pending.add(pool.submit(_search_worker, tasks.pop()))
+                done, pending = wait(pending, timeout=max(0.0, deadline - time.perf_counter()),
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, explored, branch_timed_out = future.result()
+                    candidates.extend(found)
+                    nodes += explored
+                    timed_out = timed_out or branch_timed_out
+                if len(candidates) >= max_candidates:
+                    break
+                if time.perf_counter() > deadline:
+                    timed_out = timed_out or bool(tasks or pending)
+                    # Running branches stop at their own deadline check; give
+                    # them a moment to report what they found
+                    for future in wait(pending, timeout=_DEADLINE_GRACE_SEC)[0]:
+                        found, explored, _ = future.result()
+                        candidates.extend(found)
+                        nodes += explored
+                    break
+        finally:
+            # Never block on branches still running; unstarted ones are cancelled
+            pool.shutdown(wait=False, cancel_futures=True)
+        del candidates[max_candidates:]
+
+    elapsed = time.perf_counter() - start_time
 
     # Build result state
     result = state.copy()
     result.quotients = []
-    result.reconstructed_bits = {}
+    result.reconstructed_bits = ReconstructedBits()
 
     if candidates:
         # If exactly one candidate, we found the quotients
@@ -143,12 +296,54 @@ def rollback_without_quotients(state: ModInverseState, known_p: int,
     result._rollback_meta = {
         'candidates': len(candidates),
         'elapsed_sec': elapsed,
-        'timed_out': timed_out
+        'timed_out': timed_out,
+        'nodes': nodes,
+        'nodes_per_sec': nodes / elapsed if elapsed > 0 else 0.0,
     }
 
     return result
 
 
+def benchmark_rollback_depth(cases=None, timeout_sec: float = 2.0, workers: int = 1) -> list:
+    """
+    Measure how deep rollback_without_quotients recovers, with and without pruning.
+
+    Args:
+        cases: List of (a, p); default spans 5- to 256-bit moduli
+        timeout_sec: Per-search timeout
+        workers: Processes for the top-level branches
+
+    Returns:
+        List of dicts: {'bits', 'steps', 'prune', 'recovered', 'nodes',
+                        'nodes_per_sec', 'timed_out'}
+    """
+    if cases is None:
+        cases = [
+            (7, 23),
+            (12345, 65537),
+            (2**31 - 1, 2**31 + 11),
+            (2**63 - 25, 2**64 - 59),
+            (2**255 - 19, 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F),
+        ]
+    rows = []
+    for a, p in cases:
+        state = mod_inverse_full(a, p)
+        for prune in (False, True):
+            recovered = rollback_without_quotients(state, p, timeout_sec=timeout_sec,
+                                                   prune=prune, workers=workers)
+            meta = recovered._rollback_meta
+            rows.append({
+                'bits': p.bit_length(),
+                'steps': state.step,
+                'prune': prune,
+                'recovered': recovered.quotients == state.quotients,
+                'nodes': meta['nodes'],
+                'nodes_per_sec': meta['nodes_per_sec'],
+                'timed_out': meta['timed_out'],
+            })
+    return rows
+
+
 def verify_rollback(original: ModInverseState, recovered: ModInverseState,
                     a: int, p: int) -> Dict:
     """
@@ -237,6 +432,7 @@ def demo():
     print(f"Candidates found: {meta.get('candidates', 0)}")
     print(f"Time: {meta.get('elapsed_sec', 0):.3f}s")
     print(f"Timed out: {meta.get('timed_out', False)}")
+    print(f"Nodes explored: {meta.get('nodes', 0)} ({meta.get('nodes_per_sec', 0):,.0f}/s)")
     print(f"Quotients recovered: {recovered.quotients if recovered.quotients else 'None'}")
     print(f"Bits determined: {len(recovered.reconstructed_bits)}")
 
@@ -259,6 +455,21 @@ def demo():
     print(f"Bits correct: {verification['bits_correct']}")
     print(f"Bits wrong: {verification['bits_wrong']}")
 
+    # =========================================================================
+    # SECTION 3c: Search depth (pruning on/off)
+    # =========================================================================
+    print("\n--- 3c. SEARCH DEPTH (0.5s limit per search) ---")
+
+    headers = ["bits(p)", "Steps", "Pruning", "Recovered", "Nodes", "Nodes/s"]
+    rows = []
+    for row in benchmark_rollback_depth(timeout_sec=0.5):
+        rows.append([row['bits'], row['steps'], "CF bounds" if row['prune'] else "bounds only",
+                     "yes" if row['recovered'] else ("timeout" if row['timed_out'] else "no"),
+                     row['nodes'], f"{row['nodes_per_sec']:,.0f}"])
+    print_table(headers, rows, None)
+    print("The s coefficients are continuants of a/p: with them known, each")
+    print("quotient is pinned to one value and the search is linear in the steps.")
+
     # =========================================================================
     # SECTION 4: Information Loss Analysis
     # =========================================================================
@@ -297,7 +508,7 @@ def analyze_information_loss(a: int, p: int) -> dict:
         bits_per_step.append(bits)
 
     return {
-        'quotients': state.quotients,
+        'quotients': state.quotients.copy(),
         'bits_per_step': bits_per_step,
         'total_bits': sum(bits_per_step),
         'steps': len(state.quotients),
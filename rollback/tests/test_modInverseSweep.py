@@ -0,0 +1,102 @@
+"""
+Test suite for the mod_inverse quotient sweep
+
+Tests modInverseSweep.py which handles:
+- Mergeable quotient / step / bits-lost histograms
+- Deterministic sweeps, independent of the number of workers
+- Saving and loading histograms as .npz
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import tempfile
+import unittest
+
+from rollback import modInverseSweep
+from rollback.modInverseSweep import QuotientStats, sweep, sweep_chunk
+
+
+class TestQuotientStats(unittest.TestCase):
+    """Test histogram recording and merging."""
+
+    def test_add_quotients(self):
+        """Test one inversion's quotients land in every histogram."""
+        stats = QuotientStats()
+        stats.add_quotients([0, 5, 1, 2])          # mod_inverse_full(3, 17)
+        self.assertEqual(stats.samples, 1)
+        self.assertEqual(stats.quotient_counts[:6], [1, 1, 1, 0, 0, 1])
+        self.assertEqual(stats.step_counts, [0, 0, 0, 0, 1])
+        # bits: 0 -> 1, 5 -> 3, 1 -> 1, 2 -> 2
+        self.assertEqual(len(stats.bits_lost_counts), 8)
+        self.assertEqual(stats.bits_lost_counts[7], 1)
+
+    def test_large_quotients(self):
+        """Test quotients >= QUOTIENT_EXACT are bucketed by bit length."""
+        stats = QuotientStats()
+        stats.add_quotients([modInverseSweep.QUOTIENT_EXACT, 2**70])
+        self.assertEqual(stats.large_quotient_bits[9], 1)
+        self.assertEqual(stats.large_quotient_bits[71], 1)
+        self.assertEqual(stats.total_quotients(), 2)
+        self.assertEqual(stats.bits_lost_counts[80], 1)
+
+    def test_merge(self):
+        """Test merging equals recording everything into one."""
+        first, second, both = QuotientStats(), QuotientStats(), QuotientStats()
+        for quotients, target in (([0, 5, 1, 2], first), ([1, 1, 1, 1, 2**70], second)):
+            target.add_quotients(quotients)
+            both.add_quotients(quotients)
+        second.no_inverse = both.no_inverse = 3
+        merged = first.merge(second)
+        self.assertIs(merged, first)
+        for name in ('samples', 'no_inverse', 'quotient_counts', 'large_quotient_bits',
+                     'step_counts', 'bits_lost_counts'):
+            self.assertEqual(getattr(merged, name), getattr(both, name), name)
+
+
+class TestSweep(unittest.TestCase):
+    """Test the sweep engine."""
+
+    def test_known_histogram(self):
+        """Test a sweep mod 3, where every sample is one of two known runs."""
+        # a = 1: quotients [0, 3] (2 steps, 1 + 2 bits)
+        # a = 2: quotients [0, 1, 2] (3 steps, 1 + 1 + 2 bits)
+        stats = sweep_chunk(seed=1, chunk=0, count=20, bits=2, p=3)
+        ones, twos = stats.step_counts[2], stats.step_counts[3]
+        self.assertEqual(stats.samples, 20)
+        self.assertEqual(ones + twos, 20)
+        self.assertEqual(stats.step_counts, [0, 0, ones, twos])
+        self.assertEqual(stats.bits_lost_counts, [0, 0, 0, ones, twos])
+        self.assertEqual(stats.quotient_counts[:4], [20, twos, twos, ones])
+        self.assertEqual((ones, twos), (11, 9))
+
+    def test_deterministic(self):
+        """Test the same seed gives the same totals for any chunking or worker count."""
+        serial = sweep(60, bits=16, workers=1, chunk_size=20, seed=5)
+        parallel = sweep(60, bits=16, workers=2, chunk_size=20, seed=5)
+        self.assertEqual(serial.samples + serial.no_inverse, 60)
+        self.assertEqual(parallel.step_counts, serial.step_counts)
+        self.assertEqual(parallel.quotient_counts, serial.quotient_counts)
+        self.assertEqual(parallel.bits_lost_counts, serial.bits_lost_counts)
+        self.assertNotEqual(sweep(60, bits=16, workers=1, chunk_size=20, seed=6).quotient_counts,
+                            serial.quotient_counts)
+
+    @unittest.skipIf(modInverseSweep.np is None, "NumPy not installed")
+    def test_npz_round_trip(self):
+        """Test histograms survive save_npz / load_npz."""
+        stats = sweep(50, bits=32, workers=1, chunk_size=25, seed=2)
+        stats.add_quotients([2**70])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sweep.npz')
+            stats.save_npz(path, bits=32, seed=2)
+            loaded = QuotientStats.load_npz(path)
+        for name in ('samples', 'no_inverse', 'quotient_counts', 'large_quotient_bits',
+                     'step_counts', 'bits_lost_counts'):
+            self.assertEqual(getattr(loaded, name), getattr(stats, name), name)
+        self.assertEqual(loaded.summary(), stats.summary())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Test suite for the mod inverse rollback mechanism
+
+Tests rollbackModInverseMechanism.py which handles:
+- Rollback with recorded quotients
+- Quotient search without recorded quotients (serial and parallel)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+import unittest
+
+from cryptography.bitUtils import mod_inverse_full
+from rollback import rollbackModInverseMechanism
+from rollback.rollbackModInverseMechanism import rollback_with_quotients, rollback_without_quotients
+
+
+class TestRollbackWithQuotients(unittest.TestCase):
+    """Test rollback when the quotients were recorded."""
+
+    def test_full_rollback(self):
+        """Test rolling back every step recovers the initial state."""
+        state = mod_inverse_full(7, 23)
+        initial = rollback_with_quotients(state, state.step)
+        self.assertEqual((initial.old_r, initial.r), (7, 23))
+        self.assertEqual((initial.old_s, initial.s), (1, 0))
+
+    def test_missing_quotients(self):
+        """Test a state without a quotient trace raises ValueError."""
+        state = mod_inverse_full(7, 23)
+        bare = type(state)(state.old_r, state.r, state.old_s, state.s, state.step)
+        with self.assertRaises(ValueError):
+            rollback_with_quotients(bare, bare.step)
+        self.assertEqual(rollback_with_quotients(bare, 0), bare)
+
+
+class TestRollbackWithoutQuotients(unittest.TestCase):
+    """Test the quotient search, serial and parallel."""
+
+    def test_serial_and_parallel_agree(self):
+        """Test the parallel search finds the same quotients as the serial one."""
+        state = mod_inverse_full(7, 23)
+        serial = rollback_without_quotients(state, 23, timeout_sec=5.0)
+        parallel = rollback_without_quotients(state, 23, timeout_sec=5.0, workers=2)
+        self.assertEqual(serial.quotients, state.quotients)
+        self.assertEqual(parallel.quotients, serial.quotients)
+        self.assertEqual(parallel.reconstructed_bits, serial.reconstructed_bits)
+        self.assertFalse(parallel._rollback_meta['timed_out'])
+
+        # Unpruned, the root has several branches, so the pool is used
+        serial = rollback_without_quotients(state, 23, timeout_sec=5.0, prune=False, max_q=10)
+        parallel = rollback_without_quotients(state, 23, timeout_sec=5.0, prune=False, max_q=10,
+                                              workers=2)
+        self.assertEqual(parallel._rollback_meta['candidates'], serial._rollback_meta['candidates'])
+        self.assertEqual(parallel.reconstructed_bits, serial.reconstructed_bits)
+
+    def test_single_branch_runs_in_process(self):
+        """Test the pruned search (one branch per level) never starts a process pool."""
+        state = mod_inverse_full(7, 23)
+        original = rollbackModInverseMechanism.ProcessPoolExecutor
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started for a single branch")
+
+        rollbackModInverseMechanism.ProcessPoolExecutor = no_pool
+        try:
+            result = rollback_without_quotients(state, 23, timeout_sec=5.0, workers=4)
+        finally:
+            rollbackModInverseMechanism.ProcessPoolExecutor = original
+        self.assertEqual(result.quotients, state.quotients)
+
+    def test_parallel_respects_timeout(self):
+        """Test the parallel search stops near timeout_sec, not branches x timeout_sec."""
+        p = (1 << 61) - 1
+        state = mod_inverse_full(123456789123, p)
+        timeout_sec = 0.5
+        start = time.perf_counter()
+        result = rollback_without_quotients(state, p, timeout_sec=timeout_sec,
+                                            prune=False, max_q=20, workers=2)
+        elapsed = time.perf_counter() - start
+        self.assertTrue(result._rollback_meta['timed_out'])
+        self.assertLess(elapsed, timeout_sec + 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()